@@ -0,0 +1,47 @@
+"""
+Combines the saved sessions of every participant into one dataset for
+analysis. Run after sessions are saved; only new or changed sessions are
+parsed again. With --cueing-effects, participant and group cueing effects are
+also written.
+"""
+
+import argparse
+
+from src.analysis import cueing_effect
+from src.analysis.aggregation import aggregate, write_dataset
+from src.constants import (
+    ANALYSIS_CACHE_PATH,
+    ANALYSIS_PATH,
+    ANALYSIS_WORKERS,
+    DATA_PATH,
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-path", default=DATA_PATH)
+    parser.add_argument("--output-path", default=ANALYSIS_PATH)
+    parser.add_argument("--workers", type=int, default=ANALYSIS_WORKERS)
+    parser.add_argument(
+        "--no-cache",
+        dest="cache_path",
+        action="store_const",
+        const=None,
+        default=ANALYSIS_CACHE_PATH,
+    )
+    parser.add_argument("--cueing-effects", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    trials = aggregate(args.data_path, args.workers, args.cache_path)
+    if trials.empty:
+        print(f"No sessions found in {args.data_path}")
+    else:
+        path = write_dataset(trials, args.output_path)
+        print(f"Wrote {len(trials)} trials to {path}")
+    if args.cueing_effects and not trials.empty:
+        effects, group = cueing_effect.analyse(
+            trials, workers=args.workers, seed=args.seed
+        )
+        write_dataset(effects, args.output_path, "participant_effects")
+        write_dataset(group, args.output_path, "cueing_effects")
+        print(group.to_string(index=False))
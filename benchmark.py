@@ -0,0 +1,239 @@
+"""
+Benchmarks the visuals package headless with the SDL dummy video driver: the
+cost of constructing and drawing each element and GUI widget, rescaling an
+image, laying out the instructions, and displaying a whole experiment frame.
+With --output, the results are also written as JSON, to compare commits.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import timeit
+from collections.abc import Callable
+from datetime import datetime
+from itertools import cycle
+from pathlib import Path
+from typing import Any
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.constants import (
+    BLACK,
+    POSITIONS,
+    SCREEN_DIMENSIONS,
+    STIMULI_PATH,
+    STIMULUS_SCALE,
+    TARGET_SCALE,
+    TARGETS_PATH,
+    TEXT_CONTINUE,
+    TEXT_INSTRUCTIONS,
+    TEXT_TITLE,
+    WHITE,
+)
+from src.gui import Button, Checkbox, InputBox
+from src.scenes.experiment_scene import ExperimentScene
+from src.services.screen import init_screen
+from src.visuals import (
+    Element,
+    FixationCross,
+    Image,
+    MultilineText,
+    Text,
+    fonts,
+    init_fonts,
+)
+from src.visuals.image import load_image
+
+
+def visuals_benchmarks(screen: pygame.Surface) -> dict[str, Callable[[], Any]]:
+    """
+    Builds the benchmarks of the visuals package. Everything a benchmark needs
+    is created here, so only the named operation is timed.
+
+    Parameters
+    ----------
+    screen: pygame.Surface
+        The main window drawn on.
+
+    Returns
+    -------
+    dict[str, Callable[[], Any]]
+        The operation timed by each benchmark.
+    """
+    centre = SCREEN_DIMENSIONS["centre"]
+    stimulus = load_image(str(sorted(Path(STIMULI_PATH).rglob("*.tif"))[0]))
+    target = load_image(str(sorted(Path(TARGETS_PATH).rglob("*.*"))[0]))
+
+    def text() -> Text:
+        return Text(string=TEXT_TITLE, font=fonts["title"], position=centre)
+
+    def multiline_text() -> MultilineText:
+        return MultilineText(
+            string=TEXT_INSTRUCTIONS, font=fonts["text"], position=centre
+        )
+
+    def image() -> Image:
+        return Image(stimulus, POSITIONS["stimuli"], STIMULUS_SCALE)
+
+    def element() -> Element:
+        return Element(centre, (200, 100), background_colour=BLACK, border_colour=WHITE)
+
+    def button() -> Button:
+        return Button(
+            text=Text(string=TEXT_CONTINUE, font=fonts["button"]), position=centre
+        )
+
+    def checkbox() -> Checkbox:
+        return Checkbox(position=centre)
+
+    def input_box() -> InputBox:
+        return InputBox(
+            text=Text(string="123", font=fonts["text"]),
+            position=centre,
+            is_numeric=True,
+        )
+
+    def fixation_cross() -> FixationCross:
+        return FixationCross(screen)
+
+    drawn = {
+        "Element": element(),
+        "Text": text(),
+        "MultilineText": multiline_text(),
+        "Image": image(),
+        "FixationCross": fixation_cross(),
+        "Button": button(),
+        "Checkbox": checkbox(),
+        "InputBox": input_box(),
+    }
+    constructors = {
+        "Element": element,
+        "Text": text,
+        "MultilineText": multiline_text,
+        "Image": image,
+        "FixationCross": fixation_cross,
+        "Button": button,
+        "Checkbox": checkbox,
+        "InputBox": input_box,
+    }
+    benchmarks: dict[str, Callable[[], Any]] = {}
+    for name, constructor in constructors.items():
+        benchmarks[f"{name}.__init__"] = constructor
+        benchmarks[f"{name}.draw"] = lambda item=drawn[name]: item.draw(screen)
+
+    rescaled = drawn["Image"]
+    benchmarks["Image.size"] = lambda: setattr(rescaled, "size", STIMULUS_SCALE)
+    benchmarks["MultilineText.set_rect"] = drawn["MultilineText"].set_rect
+
+    # Each frame moves to the next phase of a trial, as the experiment does.
+    stimulus_image = Image(stimulus, POSITIONS["stimuli"], STIMULUS_SCALE)
+    target_image = Image(target, POSITIONS["left_target"], TARGET_SCALE)
+    phases = [[], [stimulus_image], [stimulus_image, target_image]]
+    for prepared in (True, False):
+        scene = ExperimentScene(screen)
+        if prepared:
+            scene.prepare_frames(phases)
+        frames = cycle(phases)
+        name = "prepared" if prepared else "unprepared"
+        benchmarks[f"ExperimentScene.display[{name}]"] = (
+            lambda scene=scene, frames=frames: scene.display(next(frames))
+        )
+    return benchmarks
+
+
+def run(benchmark: Callable[[], Any], repeat: int, min_time: float) -> dict[str, float]:
+    """
+    Times a benchmark, calling it enough times per repeat to take at least
+    min_time seconds.
+
+    Parameters
+    ----------
+    benchmark: Callable[[], Any]
+        The operation to time.
+    repeat: int
+        The number of timed repeats.
+    min_time: float
+        The minimum duration of each repeat in seconds.
+
+    Returns
+    -------
+    dict[str, float]
+        The calls per repeat and the time per call of the repeats in
+        microseconds.
+    """
+    timer = timeit.Timer(benchmark)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    times = [time / number * 1e6 for time in timer.repeat(repeat, number)]
+    return {
+        "number": number,
+        "min_us": min(times),
+        "median_us": statistics.median(times),
+        "max_us": max(times),
+    }
+
+
+def commit() -> str | None:
+    """
+    Gets the checked out commit, if the working directory is a git repository.
+
+    Returns
+    -------
+    str | None
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="Seconds per repeat"
+    )
+    parser.add_argument("--filter", default="", help="Only names containing this")
+    parser.add_argument("--output", default=None, help="Writes the results as JSON")
+    args = parser.parse_args()
+
+    pygame.init()
+    init_fonts()
+    screen = init_screen()
+
+    results = {}
+    for name, benchmark in visuals_benchmarks(screen).items():
+        if args.filter not in name:
+            continue
+        results[name] = run(benchmark, args.repeat, args.min_time)
+        print(
+            f"{name:<40} {results[name]['min_us']:>12.2f} us"
+            f" (median {results[name]['median_us']:.2f} us,"
+            f" {results[name]['number']} calls)"
+        )
+    pygame.quit()
+
+    if args.output:
+        report = {
+            "commit": commit(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "video_driver": os.environ["SDL_VIDEODRIVER"],
+            "repeat": args.repeat,
+            "results": results,
+        }
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
@@ -4,23 +4,25 @@ Entry point to the experiment. Initiates pygame, fonts, main window, and game lo
 
 import pygame
 
+from src.services.frame_pacer import FramePacer, PacingMode
 from src.services.scene_manager import QuitActionType, SceneManager
 from src.services.screen import init_screen
 from src.visuals.tools import show_fps
 
 
 def main(
-    controller: SceneManager, screen: pygame.Surface, clock: pygame.time.Clock
+    controller: SceneManager, screen: pygame.Surface, pacer: FramePacer
 ) -> QuitActionType:
     """
-    Main game loop.
+    Main game loop. When DIRTY_RECT_RENDERING is enabled, only the regions
+    reported by the active scene are updated on the display.
     Parameters
     ----------
     controller: SceneManager
         Processes all pygame events and experiment scenes.
     screen: pygame.Surface
         The main window displaying the experiment.
-    clock: pygame.time.Clock
+    pacer: FramePacer
         Regulates the game's framerate.
     Returns
     -------
@@ -28,30 +30,89 @@ def main(
         Program quit or restart.
     """
     action = QuitActionType.CONTINUE
+    fps_rect = pygame.Rect(0, 0, 0, 0)
     while action == QuitActionType.CONTINUE:
-        screen.fill(BG_GREY)
+        if not DIRTY_RECT_RENDERING:
+            screen.fill(BG_GREY)
         action = controller.process_game_events()
+        rects = list(controller.active_scene.dirty_rects)
         if SHOW_FRAMERATE:
-            show_fps(screen, clock, fonts["text"])
-        pygame.display.update()
-        clock.tick(FRAMERATE)
+            if DIRTY_RECT_RENDERING:
+                screen.fill(BG_GREY, fps_rect)
+                rects.append(fps_rect)
+            fps_rect = show_fps(screen, pacer.clock, fonts["text"])
+            rects.append(fps_rect)
+        if not DIRTY_RECT_RENDERING:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
+        elif pacer.mode == PacingMode.VSYNC:
+            pygame.display.flip()
+        controller.record_flip()
+        pacer.wait()
     return action
 
 
 if __name__ == "__main__":
     import subprocess
     import sys
+    from datetime import datetime
+    from pathlib import Path
 
-    from src.constants import BG_GREY, FRAMERATE, SHOW_FRAMERATE
+    from src.constants import (
+        BG_GREY,
+        DIRTY_RECT_RENDERING,
+        EVENT_RECORDING_PATH,
+        FIRST_TRIAL_DELAY,
+        INTER_TRIAL_INTERVAL,
+        MAX_RESPONSE_TIME,
+        RESPONSE_DEVICE,
+        SHOW_FRAMERATE,
+        STIMULUS_ONSET_ASYNCS,
+    )
+    from src.services.clock import Clock
+    from src.services.event_source import (
+        EventSource,
+        PygameEventSource,
+        RecordingEventSource,
+    )
+    from src.services.frame_scheduler import report_quantisation
     from src.visuals import fonts, init_fonts
 
     pygame.init()
     init_fonts()
 
     screen = init_screen()
+    report_quantisation(
+        {
+            "Stimulus onset async": STIMULUS_ONSET_ASYNCS,
+            "Inter-trial interval": [INTER_TRIAL_INTERVAL],
+            "First trial delay": [FIRST_TRIAL_DELAY],
+            "Max response time": [MAX_RESPONSE_TIME],
+        }
+    )
 
-    scene_manager = SceneManager(screen)
-    quit_action = main(scene_manager, screen, pygame.time.Clock())
+    clock = Clock()
+    events: EventSource = PygameEventSource(clock)
+    if RESPONSE_DEVICE:
+        from src.services.evdev_source import EvdevEventSource
+
+        events = EvdevEventSource(events, clock, RESPONSE_DEVICE)
+    recorder = None
+    if EVENT_RECORDING_PATH:
+        events = recorder = RecordingEventSource(
+            events,
+            clock,
+            Path(EVENT_RECORDING_PATH) / f"{datetime.now():%Y%m%d-%H%M%S}.jsonl",
+        )
+    scene_manager = SceneManager(screen, clock, events)
+    if recorder:
+        # A replay restores the trial order instead of shuffling again.
+        recorder.write_header({"trials": scene_manager.trial_manager.trial_order()})
+    frame_pacer = FramePacer(poll=events.poll)
+    quit_action = main(scene_manager, screen, frame_pacer)
+    frame_pacer.report(scene_manager.experiment_frame_statistics())
+    events.close()
     pygame.quit()
 
     if quit_action == QuitActionType.RESTART:
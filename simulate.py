@@ -0,0 +1,83 @@
+"""
+Runs the experiment headless with a simulated participant and a virtual clock,
+completing a session as fast as the CPU allows and saving the usual output in
+SIMULATION_PATH, apart from the experiment's data. With --replay, the input
+events of a recorded session are replayed instead.
+"""
+
+import argparse
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.components import Participant
+from src.constants import SIMULATION_PATH
+from src.services.event_source import load_header, load_recording
+from src.services.screen import init_screen
+from src.services.simulation import SimulatedParticipant, simulate
+from src.visuals import init_fonts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--id", type=int, default=0, help="Participant ID")
+    parser.add_argument("--age", type=int, default=30)
+    parser.add_argument("--gender", type=int, default=1)
+    parser.add_argument("--culture", type=int, default=1)
+    parser.add_argument("--rt-mu", type=float, default=400.0)
+    parser.add_argument("--rt-sigma", type=float, default=40.0)
+    parser.add_argument("--rt-tau", type=float, default=100.0)
+    parser.add_argument("--cueing-effect", type=float, default=0.0)
+    parser.add_argument("--accuracy", type=float, default=0.95)
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seeds the trial order and responses"
+    )
+    parser.add_argument("--trials", type=int, default=None)
+    parser.add_argument("--record", default=None, help="Records events to a file")
+    parser.add_argument("--replay", default=None, help="Replays a recorded file")
+    parser.add_argument(
+        "--data-path", default=SIMULATION_PATH, help="Saves the session here"
+    )
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    pygame.init()
+    init_fonts()
+    screen = init_screen()
+
+    recording = None
+    trial_order = None
+    responder = None
+    if args.replay:
+        recording = load_recording(args.replay)
+        trial_order = load_header(args.replay).get("trials")
+    else:
+        responder = SimulatedParticipant(
+            Participant(args.id, args.age, args.gender, args.culture),
+            rt_mu=args.rt_mu,
+            rt_sigma=args.rt_sigma,
+            rt_tau=args.rt_tau,
+            cueing_effect=args.cueing_effect,
+            accuracy=args.accuracy,
+            seed=args.seed,
+        )
+    scene_manager = simulate(
+        screen,
+        responder,
+        trials=args.trials,
+        recording=recording,
+        record_path=args.record,
+        trial_order=trial_order,
+        data_path=args.data_path,
+    )
+    trial_manager = scene_manager.trial_manager
+    print(
+        f"Simulated {trial_manager.trials_length} trials"
+        f" in {scene_manager.clock.now() / 60000:.1f} virtual minutes"
+    )
+    pygame.quit()
@@ -0,0 +1,3 @@
+"""
+Provides group-level analysis of saved sessions.
+"""
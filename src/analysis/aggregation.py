@@ -0,0 +1,274 @@
+"""
+Combines the saved sessions of every participant into one dataset.
+
+Session files are parsed concurrently in a process pool and validated against
+their variable_levels table. Each parsed session is cached on disk, keyed on
+the file's path, modification time and size, so re-running after a new
+session only parses the new file.
+"""
+
+import hashlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+from pandas import DataFrame
+
+from src.components import (
+    Response,
+    StimulusGazeDirection,
+    StimulusSpecies,
+    TargetLetter,
+    TargetLocation,
+)
+from src.constants import (
+    ANALYSIS_CACHE_PATH,
+    ANALYSIS_FORMATS,
+    ANALYSIS_PATH,
+    ANALYSIS_WORKERS,
+    DATA_PATH,
+)
+from src.services import output_writer
+
+# Trial data columns holding the levels of each variable.
+VARIABLE_COLUMNS = {
+    "stimulus_species": StimulusSpecies,
+    "stimulus_gaze_direction": StimulusGazeDirection,
+    "target_letter": TargetLetter,
+    "target_location": TargetLocation,
+    "response": Response,
+}
+
+logger = logging.getLogger(__name__)
+
+# Session file suffixes, fastest to parse first. When a session was saved in
+# several formats, only the first is parsed.
+SESSION_SUFFIXES = [".parquet", ".feather", ".csv", ".xlsx"]
+
+
+def find_sessions(data_path: str = DATA_PATH) -> dict[int, Path]:
+    """
+    Finds the saved session of each participant in a directory.
+
+    Parameters
+    ----------
+    data_path: str, optional
+        Directory containing the saved sessions. Defaults to DATA_PATH from
+        src.constants.
+
+    Returns
+    -------
+    dict[int, Path]
+        The trial data file of each participant ID.
+    """
+    sessions: dict[int, Path] = {}
+    for suffix in reversed(SESSION_SUFFIXES):
+        pattern = "*.xlsx" if suffix == ".xlsx" else f"*_trial_data{suffix}"
+        for file in Path(data_path).glob(pattern):
+            id = file.stem.split("_")[0]
+            if id.isnumeric():
+                sessions[int(id)] = file
+    return dict(sorted(sessions.items()))
+
+
+def read_table(file: Path, table: str) -> DataFrame:
+    """
+    Reads one table of a saved session.
+
+    Parameters
+    ----------
+    file: Path
+        The session's trial data file.
+    table: str
+        The name of the table, e.g. variable_levels.
+
+    Returns
+    -------
+    DataFrame
+    """
+    if file.suffix == ".xlsx":
+        return pd.read_excel(file, sheet_name=table, index_col=0)
+    path = file.with_name(file.name.replace("trial_data", table))
+    if file.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    elif file.suffix == ".feather":
+        df = pd.read_feather(path)
+    else:
+        df = pd.read_csv(path)
+    return df.set_index(df.columns[0])
+
+
+def validate(trial_data: DataFrame, variable_levels: DataFrame) -> None:
+    """
+    Checks that a session's variable levels match the current experiment, and
+    that its trial data only contains those levels.
+
+    Parameters
+    ----------
+    trial_data: DataFrame
+        The session's trial data.
+    variable_levels: DataFrame
+        The session's variable_levels table.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the session does not match the variable levels.
+    """
+    for column, variable in VARIABLE_COLUMNS.items():
+        levels = {level.name: level.value for level in variable}
+        if variable.__name__ not in variable_levels:
+            raise ValueError(f"{variable.__name__} levels are missing")
+        saved = variable_levels[variable.__name__].dropna().astype(int).to_dict()
+        if saved != levels:
+            raise ValueError(f"{variable.__name__} levels {saved} != {levels}")
+        if column not in trial_data:
+            raise ValueError(f"{column} is missing")
+        unknown = set(trial_data[column].dropna()) - set(levels.values())
+        if unknown:
+            raise ValueError(f"{column} has unknown levels {sorted(unknown)}")
+
+
+def parse_session(file: Path) -> DataFrame:
+    """
+    Reads and validates the trial data of a saved session. Runs in a worker
+    process.
+
+    Parameters
+    ----------
+    file: Path
+        The session's trial data file.
+
+    Returns
+    -------
+    DataFrame
+        The trial data, with trial_number as a column.
+
+    Raises
+    ------
+    ValueError
+        If the session does not match its variable levels.
+    """
+    trial_data = read_table(file, "trial_data")
+    validate(trial_data, read_table(file, "variable_levels"))
+    trial_data.index.name = "trial_number"
+    return output_writer.with_dtypes(
+        trial_data.reset_index(), output_writer.TRIAL_DATA_DTYPES
+    )
+
+
+def cache_file(file: Path, cache_path: str) -> Path:
+    """
+    Gets the cache file of a parsed session. The file name changes whenever
+    the session file is modified.
+
+    Parameters
+    ----------
+    file: Path
+        The session's trial data file.
+    cache_path: str
+        Directory containing the parsed sessions.
+
+    Returns
+    -------
+    Path
+    """
+    stat = file.stat()
+    key = f"{file.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return Path(cache_path) / f"{digest}.pkl"
+
+
+def aggregate(
+    data_path: str = DATA_PATH,
+    workers: int | None = ANALYSIS_WORKERS,
+    cache_path: str | None = ANALYSIS_CACHE_PATH,
+) -> DataFrame:
+    """
+    Combines the trial data of every saved session. Sessions that cannot be
+    read or fail validation are reported and left out.
+
+    Parameters
+    ----------
+    data_path: str, optional
+        Directory containing the saved sessions. Defaults to DATA_PATH from
+        src.constants.
+    workers: int | None, optional
+        Number of processes parsing sessions, or None for one per core.
+        Defaults to ANALYSIS_WORKERS from src.constants.
+    cache_path: str | None, optional
+        Directory containing parsed sessions, or None to always parse every
+        session. Defaults to ANALYSIS_CACHE_PATH from src.constants.
+
+    Returns
+    -------
+    DataFrame
+    """
+    sessions = find_sessions(data_path)
+    parsed: dict[int, DataFrame] = {}
+    uncached: dict[int, Path] = {}
+    for id, file in sessions.items():
+        cached = cache_file(file, cache_path) if cache_path else None
+        if cached and cached.is_file():
+            parsed[id] = pd.read_pickle(cached)
+        else:
+            uncached[id] = file
+
+    if uncached:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                id: executor.submit(parse_session, file)
+                for id, file in uncached.items()
+            }
+        for id, future in futures.items():
+            try:
+                parsed[id] = future.result()
+            except Exception:
+                # Corrupt files raise the errors of whichever library read them,
+                # so the traceback is kept to tell them apart.
+                logger.warning("Skipped %s", uncached[id], exc_info=True)
+                continue
+            if cache_path:
+                cached = cache_file(uncached[id], cache_path)
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                temp = cached.with_suffix(f".{os.getpid()}.tmp")
+                parsed[id].to_pickle(temp)
+                os.replace(temp, cached)
+
+    print(f"Parsed {len(uncached)} of {len(sessions)} sessions")
+    if not parsed:
+        return DataFrame()
+    return pd.concat([parsed[id] for id in sorted(parsed)], ignore_index=True)
+
+
+def write_dataset(
+    data: DataFrame, output_path: str = ANALYSIS_PATH, name: str = "trials"
+) -> Path:
+    """
+    Writes a group dataset as group_<name> in the first available of
+    ANALYSIS_FORMATS.
+
+    Parameters
+    ----------
+    data: DataFrame
+        The dataset, e.g. the combined trial data.
+    output_path: str, optional
+        Directory of the dataset. Defaults to ANALYSIS_PATH from src.constants.
+    name: str, optional
+        Name of the dataset.
+
+    Returns
+    -------
+    Path
+        The dataset file.
+    """
+    output_format = next(f for f in ANALYSIS_FORMATS if output_writer.is_available(f))
+    stem = Path(output_path) / "group"
+    output_writer.write_tables(stem, {name: data}, [output_format])
+    return stem.with_name(f"group_{name}.{output_format}")
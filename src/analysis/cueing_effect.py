@@ -0,0 +1,217 @@
+"""
+Computes gaze-cueing effects, the mean reaction time on invalid trials minus
+the mean on valid trials, for each stimulus species and stimulus onset async.
+
+Every step operates on whole columns, so the combined trials of a thousand
+participants are processed in seconds. Group confidence intervals are
+bootstrapped over participants, with the resamples split across processes.
+"""
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame
+
+from src.constants import (
+    ANALYSIS_WORKERS,
+    BOOTSTRAP_CONFIDENCE,
+    BOOTSTRAP_SAMPLES,
+    RT_TRIM_RANGE,
+    RT_TRIM_SD,
+)
+
+# Columns identifying each condition of a participant's cueing effect.
+CONDITION = ["stimulus_species", "stimulus_onset_async"]
+
+# Resamples drawn at once by each task, limiting the size of the index arrays.
+BOOTSTRAP_CHUNK = 500
+
+
+def trim(
+    trials: DataFrame,
+    rt_range: tuple[float, float] = RT_TRIM_RANGE,
+    sd: float | None = RT_TRIM_SD,
+    rt_column: str = "reaction_time",
+) -> DataFrame:
+    """
+    Keeps correct trials with a reaction time inside a range, then excludes
+    reaction times more than a number of standard deviations from the mean of
+    the participant's condition.
+
+    Parameters
+    ----------
+    trials: DataFrame
+        Trial data of one or more participants.
+    rt_range: tuple[float, float], optional
+        The minimum and maximum reaction times kept in milliseconds. Defaults
+        to RT_TRIM_RANGE from src.constants.
+    sd: float | None, optional
+        The number of standard deviations kept, or None to skip this step.
+        Defaults to RT_TRIM_SD from src.constants.
+    rt_column: str, optional
+        The reaction time column.
+
+    Returns
+    -------
+    DataFrame
+    """
+    # Missing reaction times become NaN, which fails every comparison.
+    rt = trials[rt_column].astype("float64")
+    kept = (trials["response_accuracy"] == 1) & rt.between(*rt_range)
+    trials, rt = trials[kept], rt[kept]
+    if sd is None:
+        return trials
+    groups = rt.groupby(
+        [trials[column] for column in ["participant_id", *CONDITION, "gaze_validity"]]
+    )
+    distance = (rt - groups.transform("mean")).abs()
+    # Conditions with a single trial have no deviation, so that trial is kept.
+    return trials[~(distance > sd * groups.transform("std"))]
+
+
+def participant_effects(
+    trials: DataFrame, rt_column: str = "reaction_time"
+) -> DataFrame:
+    """
+    Computes the cueing effect of each participant in each condition.
+
+    Parameters
+    ----------
+    trials: DataFrame
+        Trimmed trial data of one or more participants.
+    rt_column: str, optional
+        The reaction time column.
+
+    Returns
+    -------
+    DataFrame
+        One row per participant and condition, with the mean valid and
+        invalid reaction times and the cueing effect.
+    """
+    means = (
+        trials.groupby(["participant_id", *CONDITION, "gaze_validity"])[rt_column]
+        .mean()
+        .astype("float64")
+        .unstack("gaze_validity")
+        .reindex(columns=[1, 0])
+    )
+    means.columns = ["valid_rt", "invalid_rt"]
+    means["cueing_effect"] = means["invalid_rt"] - means["valid_rt"]
+    return means.reset_index()
+
+
+def bootstrap_means(
+    effects: np.ndarray, samples: int, seed: np.random.SeedSequence
+) -> np.ndarray:
+    """
+    Resamples participants with replacement and averages their effects. Runs
+    in a worker process.
+
+    Parameters
+    ----------
+    effects: np.ndarray
+        Cueing effects, one row per participant and one column per condition.
+        Missing conditions are NaN.
+    samples: int
+        The number of resamples.
+    seed: np.random.SeedSequence
+        Seeds the resampling, so every task draws independent samples.
+
+    Returns
+    -------
+    np.ndarray
+        The mean effect of each condition, one row per resample.
+    """
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, len(effects), (samples, len(effects)))
+    with warnings.catch_warnings():
+        # A resample can contain no participant with a condition, giving NaN.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(effects[indices], axis=1)
+
+
+def group_effects(
+    effects: DataFrame,
+    samples: int = BOOTSTRAP_SAMPLES,
+    confidence: float = BOOTSTRAP_CONFIDENCE,
+    workers: int | None = ANALYSIS_WORKERS,
+    seed: int | None = None,
+) -> DataFrame:
+    """
+    Computes the mean cueing effect across participants in each condition,
+    with percentile bootstrap confidence intervals.
+
+    Parameters
+    ----------
+    effects: DataFrame
+        Participant cueing effects from participant_effects.
+    samples: int, optional
+        The number of bootstrap resamples. Defaults to BOOTSTRAP_SAMPLES from
+        src.constants.
+    confidence: float, optional
+        The confidence level of the intervals. Defaults to
+        BOOTSTRAP_CONFIDENCE from src.constants.
+    workers: int | None, optional
+        Number of processes resampling, or None for one per core. 1 resamples
+        in this process. Defaults to ANALYSIS_WORKERS from src.constants.
+    seed: int | None, optional
+        Seeds the resampling for reproducible intervals.
+
+    Returns
+    -------
+    DataFrame
+        One row per condition with the number of participants, mean cueing
+        effect and confidence interval.
+    """
+    matrix = effects.pivot(
+        index="participant_id", columns=CONDITION, values="cueing_effect"
+    )
+    values = matrix.to_numpy(dtype="float64")
+    chunks = [
+        min(BOOTSTRAP_CHUNK, samples - start)
+        for start in range(0, samples, BOOTSTRAP_CHUNK)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    if workers == 1:
+        resamples = [
+            bootstrap_means(values, n, s) for n, s in zip(chunks, seeds, strict=True)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            resamples = list(
+                executor.map(bootstrap_means, [values] * len(chunks), chunks, seeds)
+            )
+    means = np.concatenate(resamples)
+    alpha = (1 - confidence) / 2
+    lower, upper = np.nanquantile(means, [alpha, 1 - alpha], axis=0)
+    return DataFrame(
+        {
+            "participants": matrix.notna().sum().to_numpy(),
+            "cueing_effect": np.nanmean(values, axis=0),
+            "ci_lower": lower,
+            "ci_upper": upper,
+        },
+        index=matrix.columns,
+    ).reset_index()
+
+
+def analyse(trials: DataFrame, **kwargs: Any) -> tuple[DataFrame, DataFrame]:
+    """
+    Trims the trials and computes participant and group cueing effects.
+
+    Parameters
+    ----------
+    trials: DataFrame
+        Combined trial data, e.g. from src.analysis.aggregation.aggregate.
+    **kwargs: Any
+        Passed to group_effects.
+
+    Returns
+    -------
+    tuple[DataFrame, DataFrame]
+        The participant and group cueing effects.
+    """
+    effects = participant_effects(trim(trials))
+    return effects, group_effects(effects, **kwargs)
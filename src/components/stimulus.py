@@ -7,10 +7,8 @@ from enum import IntEnum, auto
 from pathlib import Path
 from typing import Any, Iterator
 
-from pygame.image import load
-from pygame.transform import scale
-
-from src.constants import POSITIONS, STIMULI_PATH, STIMULUS_SCALE
+from src.constants import LOADING_WORKERS, POSITIONS, STIMULI_PATH, STIMULUS_SCALE
+from src.services.image_loader import load_scaled_images
 from src.visuals import Image
 
 
@@ -47,17 +45,24 @@ class Stimulus:
 stimuli: list[Stimulus] = []
 
 
-def init_stimuli() -> None:
+def init_stimuli(workers: int = LOADING_WORKERS) -> None:
     """
     Initialises the experimental stimuli.
 
+    Parameters
+    ----------
+    workers: int, optional
+        Number of threads loading the stimuli images. Defaults to
+        LOADING_WORKERS from src.constants.
+
     Returns
     -------
     None
     """
-    for file in Path(STIMULI_PATH).rglob("*.tif"):
-        path = str(file)
-        surface = scale(load(path), STIMULUS_SCALE)
+    paths = [str(file) for file in Path(STIMULI_PATH).rglob("*.tif")]
+    surfaces = load_scaled_images(paths, STIMULUS_SCALE, workers)
+    stimuli.clear()
+    for path, surface in zip(paths, surfaces, strict=True):
         stimulus = Stimulus(
             image=Image(surface, POSITIONS["stimuli"]),
             number=int("".join([i for i in path if i.isdigit()])),
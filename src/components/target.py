@@ -7,10 +7,8 @@ from enum import IntEnum, auto
 from pathlib import Path
 from typing import Any, Iterator
 
-from pygame.image import load
-from pygame.transform import scale
-
-from src.constants import POSITIONS, TARGET_SCALE, TARGETS_PATH
+from src.constants import LOADING_WORKERS, POSITIONS, TARGET_SCALE, TARGETS_PATH
+from src.services.image_loader import load_scaled_images
 from src.visuals import Image
 
 
@@ -46,18 +44,24 @@ class Target:
 targets: list[Target] = []
 
 
-def init_targets() -> None:
+def init_targets(workers: int = LOADING_WORKERS) -> None:
     """
     Initialises the experimental targets.
 
+    Parameters
+    ----------
+    workers: int, optional
+        Number of threads loading the target images. Defaults to
+        LOADING_WORKERS from src.constants.
+
     Returns
     -------
     None
     """
-    for file in Path(TARGETS_PATH).glob("*.tif"):
-        path = str(file)
-        surface = scale(load(path), TARGET_SCALE)
-
+    files = list(Path(TARGETS_PATH).glob("*.tif"))
+    surfaces = load_scaled_images([str(file) for file in files], TARGET_SCALE, workers)
+    targets.clear()
+    for file, surface in zip(files, surfaces, strict=True):
         left_target = Target(
             image=Image(surface, POSITIONS["left_target"]),
             letter=TargetLetter.L if "L" in str(file) else TargetLetter.T,
@@ -30,12 +30,32 @@ class Trial:
     target: Target
     stimulus_onset_async: int
     response: Response
-    reaction_time: int | None = None
+    reaction_time: float | None = None
+    time_trial_start: float | None = None
+    time_draw_stimulus: float | None = None
+    time_draw_target: float | None = None
+    time_response: float | None = None
+    time_stimulus_onset: float | None = None
+    time_target_onset: float | None = None
+    frames_dropped: int = 0
+    max_frame_ms: float = 0
 
     @property
     def response_accuracy(self) -> bool:
         return self.response == self.target.letter
 
+    @property
+    def measured_stimulus_onset_async(self) -> float | None:
+        if self.time_stimulus_onset is None or self.time_target_onset is None:
+            return None
+        return self.time_target_onset - self.time_stimulus_onset
+
+    @property
+    def measured_reaction_time(self) -> float | None:
+        if self.time_response is None or self.time_target_onset is None:
+            return None
+        return self.time_response - self.time_target_onset
+
     @property
     def gaze_validity(self) -> bool:
         return self.stimulus.gaze_direction == self.target.location
@@ -50,6 +70,8 @@ class Trial:
 
         yield "response_accuracy", int(self.response_accuracy)
         yield "gaze_validity", int(self.gaze_validity)
+        yield "measured_stimulus_onset_async", self.measured_stimulus_onset_async
+        yield "measured_reaction_time", self.measured_reaction_time
 
 
 def generate_trials() -> list[Trial]:
@@ -7,20 +7,61 @@ import pygame
 # resources paths
 
 DATA_PATH = "data/"
+TRIAL_LOG_PATH = "data/logs/"
+CHECKPOINT_PATH = "data/checkpoints/"
+PARTICIPANT_INDEX_FILE = "index.json"  # Saved sessions, kept in DATA_PATH.
+EVENT_RECORDING_PATH: str | None = None  # Records input for replay. None disables.
+SIMULATION_PATH = "simulated/"  # Simulated and replayed sessions, kept apart.
 STIMULI_PATH = "resources/stimuli"
 TARGETS_PATH = "resources/targets"
+IMAGE_CACHE_PATH: str | None = ".cache/images"  # None disables the image cache.
+ANALYSIS_PATH = "analysis/"
+ANALYSIS_CACHE_PATH: str | None = ".cache/sessions"  # None disables the cache.
+
+# Loading
+
+LOADING_WORKERS = 4  # Threads decoding stimuli concurrently. 1 loads serially.
+REPORT_LOAD_TIMES = False
+
+# Garbage collection
+
+GC_CONTROL = True  # Only collect garbage between trials during the experiment.
+
+# Output
+
+TRIAL_LOG_SYNC_INTERVAL = 10  # Completed trials buffered between each fsync.
+# Any of "xlsx", "csv", "parquet" and "feather". Parquet and Feather need pyarrow.
+OUTPUT_FORMATS = ["xlsx", "csv"]
+
+# Analysis
+
+ANALYSIS_WORKERS: int | None = None  # Processes used. None uses every core.
+ANALYSIS_FORMATS = ["parquet", "feather", "csv"]  # The first available is written.
+RT_TRIM_RANGE = (100.0, 2000.0)  # Reaction times kept for analysis, in ms.
+RT_TRIM_SD: float | None = 2.5  # Deviations from the condition mean kept.
+BOOTSTRAP_SAMPLES = 10000
+BOOTSTRAP_CONFIDENCE = 0.95
 
 # Display
 
-FRAMERATE = 144
+FRAMERATE = 144  # Used when the display refresh rate cannot be measured.
+REFRESH_RATE_SAMPLES = 60  # Display flips timed to measure the refresh rate.
+REFRESH_RATE_RANGE = (24.0, 500.0)  # Measured rates outside this are rejected.
+FRAME_PACING = "hybrid"  # "tick", "hybrid" (sleep then spin) or "vsync".
+SPIN_MARGIN = 2.0  # Milliseconds before each frame that hybrid pacing spins.
+INPUT_POLL_INTERVAL = 1.0  # Milliseconds between input polls in hybrid pacing.
 TRIAL_DEBUGGING = False
 SHOW_FRAMERATE = False or TRIAL_DEBUGGING
+DIRTY_RECT_RENDERING = True  # Only redraw and update regions that changed.
+DROPPED_FRAME_THRESHOLD = 1.5  # Frames longer than this many periods are dropped.
+FRAME_HISTORY = 1024  # Number of recent frame durations kept for statistics.
 
 IS_FULLSCREEN = True
 DISPLAY_WIDTH = 1920
 DISPLAY_HEIGHT = 1080
 SCREEN_DIMENSIONS: dict[str, tuple[int, int]] = {}
 POSITIONS: dict[str, tuple[int, int]] = {}
+DISPLAY_TIMING: dict[str, float] = {}
 
 # Colours
 
@@ -60,6 +101,22 @@ RANDOM_TRIAL_ORDER = True
 FIRST_TRIAL_DELAY = 1000
 MINIMUM_REST_TIME = 2000
 
+# The Response, by name, given by each key code. Several keys can give the same
+# Response, e.g. to accept the keys of another keyboard layout.
+RESPONSE_KEYS = {
+    pygame.K_SPACE: "SPACE",
+    pygame.K_h: "H",
+}
+# A Linux input device, e.g. "/dev/input/by-id/usb-...-event-kbd", read directly
+# for kernel timestamped responses. Needs read access to the device, e.g.
+# membership of the input group. None uses the pygame event queue.
+RESPONSE_DEVICE: str | None = None
+# The key code given by each Linux input event code read from RESPONSE_DEVICE.
+EVDEV_KEYS = {
+    57: pygame.K_SPACE,  # KEY_SPACE
+    35: pygame.K_h,  # KEY_H
+}
+
 SPECIES_COUNTERBALANCING = True  # Complete one species condition before the other.
 COUNTERBALANCING_ASCENDING = (
     False  # Determines the order of counterbalancing. Humans first when True.
@@ -132,3 +189,7 @@ TEXT_FINISHED = (
     "Experiment complete!\nThank you for participating."
     "\n\nPress ESCAPE to quit or R to restart."
 )
+TEXT_DROPPED_FRAMES = "Trials with dropped frames: {:.1f}%"
+TEXT_SAVING = "Saving results..."
+TEXT_SAVED = "Results saved."
+TEXT_SAVE_ERROR = "Results could not be saved: {}"
@@ -1,6 +1,6 @@
 """
 This module defines the InputBox class, an interactive element allowing
-users to input text and numbers. 
+users to input text and numbers.
 """
 
 import pygame
@@ -9,6 +9,10 @@ from src.constants import BG_SELECTED, BLACK
 from src.gui.interactive_text import InteractiveText
 from src.visuals import Text
 
+# The first and last key codes typing a character, from "!" to "~". pygame has
+# no constant for "~", so its ASCII code is used.
+PRINTABLE_KEYS = (pygame.K_EXCLAIM, ord("~"))
+
 
 class InputBox(InteractiveText):
     """
@@ -164,19 +168,22 @@ class InputBox(InteractiveText):
         if not key:
             return
 
-        name: str = pygame.key.name(key)
-        if name == "return":
+        if key == pygame.K_RETURN:
             self.not_clicked()
             return
-        if name == "backspace":
+        if key == pygame.K_BACKSPACE:
             self.text.string = self.text.string[:-1]
             self.set_rect()
             return
         if len(self.text.string) >= self.char_limit:
             return
 
-        if self.is_numeric and name.isnumeric():
-            self.text.string += name
-        elif not self.is_numeric and len(name) == 1:
-            self.text.string += name
+        # Printable ASCII keys have the code of their character.
+        if not PRINTABLE_KEYS[0] <= key <= PRINTABLE_KEYS[1]:
+            return
+        character = chr(key)
+        if self.is_numeric and character.isdigit():
+            self.text.string += character
+        elif not self.is_numeric:
+            self.text.string += character
         self.set_rect()
@@ -2,14 +2,11 @@
 Defines DetailsScene class.
 """
 
-from pathlib import Path
-
 import pygame
 
 from src.components import Participant
 from src.constants import (
     BG_GREY,
-    DATA_PATH,
     ERROR_RED,
     SCREEN_DIMENSIONS,
     TEXT_AGE,
@@ -26,6 +23,7 @@ from src.constants import (
 )
 from src.gui import Button, InputBox
 from src.scenes.scene import Scene
+from src.services import participant_index
 from src.visuals import MultilineText, Text, fonts
 
 
@@ -50,14 +48,12 @@ class DetailsScene(Scene):
         Handles mouse motion events.
     """
 
+    event_types = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
     def __init__(self, screen: pygame.Surface) -> None:
         super().__init__(screen)
 
-        id = 1
-        for file in Path(DATA_PATH).rglob("*.xlsx"):
-            if file.stem.isnumeric():
-                num = int(file.stem)
-                id = num if num > id else id
+        id = participant_index.highest_id()
         centre_x = SCREEN_DIMENSIONS["centre"][0]
 
         self.participant = None
@@ -4,9 +4,9 @@ Defines ExperimentScene class.
 
 import pygame
 
-from src.constants import SCREEN_DIMENSIONS, TEXT_REST
+from src.constants import BG_GREY, DIRTY_RECT_RENDERING, SCREEN_DIMENSIONS, TEXT_REST
 from src.scenes.scene import Scene
-from src.visuals import Element, FixationCross, MultilineText, fonts
+from src.visuals import Element, FixationCross, FrameComposer, MultilineText, fonts
 
 
 class ExperimentScene(Scene):
@@ -18,10 +18,14 @@ class ExperimentScene(Scene):
         The main window displaying the experiment.
     participant_details: dict[str, int]
         Detials of the participant.
+    is_resting: bool
+        A flag indicating whether the rest screen is displayed.
     Methods
     -------
     display()
         Displays the scene on the main window.
+    prepare_frames()
+        Queues the frames of each phase of the upcoming trial to be composed.
     update_state()
         Communicates to the SceneManager when to trasition from this scene to the next.
     key_down()
@@ -34,7 +38,9 @@ class ExperimentScene(Scene):
         super().__init__(screen)
 
         centre_x = SCREEN_DIMENSIONS["centre"][0]
-        self.is_resting = False
+        self._is_resting = False
+        self._drawn: list[Element] = []
+        self.frame_composer = FrameComposer(screen.get_size())
         self.fixation_cross = FixationCross(screen)
         self.rest_text = MultilineText(
             string=TEXT_REST,
@@ -42,10 +48,86 @@ class ExperimentScene(Scene):
             position=(centre_x, 500),
         )
 
+    @property
+    def is_resting(self) -> bool:
+        """
+        Gets or sets whether the rest screen is displayed. Changing it redraws
+        the whole scene.
+
+        Returns
+        -------
+        bool
+        """
+        return self._is_resting
+
+    @is_resting.setter
+    def is_resting(self, is_resting: bool) -> None:
+        if is_resting != self._is_resting:
+            self.is_dirty = True
+        self._is_resting = is_resting
+
+    def prepare_frames(self, phases: list[list[Element]]) -> None:
+        """
+        Queues the frames of each phase of the upcoming trial to be composed,
+        drawing each phase's elements over the fixation cross. One frame is
+        composed per display() call, so the work is spread over the first
+        frames of the inter-trial interval instead of dropping one.
+
+        Parameters
+        ----------
+        phases: list[list[Element]]
+            The trial elements displayed during each phase.
+
+        Returns
+        -------
+        None
+        """
+        self.frame_composer.prepare(
+            [[self.fixation_cross, *elements] for elements in phases]
+        )
+
     def display(self, elements: list[Element]) -> None:
+        """
+        Displays the fixation cross and trial elements, or the rest screen.
+        The next queued frame is composed first, and prepared frames are
+        presented with a single blit. When DIRTY_RECT_RENDERING is enabled,
+        only the regions of elements added or removed since the last frame are
+        cleared and redrawn.
+
+        Parameters
+        ----------
+        elements: list[Element]
+            The trial elements to draw over the fixation cross.
+
+        Returns
+        -------
+        None
+        """
+        self.frame_composer.compose_next()
         if self.is_resting:
-            self.rest_text.draw(self.screen)
+            drawn = [self.rest_text]
+        else:
+            drawn = [self.fixation_cross, *elements]
+        frame = None if self.is_resting else self.frame_composer.get(drawn)
+        if DIRTY_RECT_RENDERING:
+            if self.is_dirty:
+                self.redraw()
+            else:
+                self.dirty_rects = [
+                    element.rect
+                    for element in self._drawn + drawn
+                    if (element in drawn) != (element in self._drawn)
+                ]
+                if frame is None:
+                    for rect in self.dirty_rects:
+                        self.screen.fill(BG_GREY, rect)
+            self._drawn = drawn
+            if not self.dirty_rects:
+                return
+        if frame is not None:
+            rects = self.dirty_rects if DIRTY_RECT_RENDERING else [frame.get_rect()]
+            for rect in rects:
+                self.screen.blit(frame, rect, rect)
             return
-        self.fixation_cross.draw(self.screen)
-        for image in elements:
-            image.draw(self.screen)
+        for element in drawn:
+            element.draw(self.screen)
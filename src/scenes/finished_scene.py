@@ -2,37 +2,114 @@
 Defines FinishedScene class.
 """
 
+from concurrent.futures import Future
+
 import pygame
 
-from src.constants import SCREEN_DIMENSIONS, TEXT_FINISHED
+from src.constants import (
+    SCREEN_DIMENSIONS,
+    TEXT_DROPPED_FRAMES,
+    TEXT_FINISHED,
+    TEXT_SAVE_ERROR,
+    TEXT_SAVED,
+    TEXT_SAVING,
+)
 from src.scenes.scene import Scene
-from src.visuals import MultilineText, fonts
+from src.visuals import MultilineText, Text, fonts
 
 
 class FinishedScene(Scene):
     """
-    The final scene of the experiment. Saves results and forces participant to quit or restart.
+    The final scene of the experiment. Shows the progress of saving results and
+    forces participant to quit or restart.
 
     Attributes
     ----------
     screen: pygame.Surface
         The main window displaying the experiment.
+    dropped_frame_percent: float
+        The percentage of trials with dropped frames.
+    save: Future[None] | None
+        The background write of the results, if one was started.
 
     Methods
     -------
     display()
         Display the scene on the main window.
-    save_output()
-        Saves all trials to an Excel file once the experiment is finished.
+    is_saving() -> bool
+        Whether the results are still being written.
+    save_status() -> str
+        Describes the progress of saving the results.
     """
 
-    def __init__(self, screen: pygame.Surface) -> None:
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        dropped_frame_percent: float = 0.0,
+        save: Future[None] | None = None,
+    ) -> None:
         super().__init__(screen)
 
+        self.dropped_frame_percent = dropped_frame_percent
+        self.save = save
+        centre_x, centre_y = SCREEN_DIMENSIONS["centre"]
+        self.status = Text(
+            string=self.save_status(),
+            font=fonts["small"],
+            position=(centre_x, centre_y + 250),
+        )
         self.elements = [
             MultilineText(
                 string=TEXT_FINISHED,
                 font=fonts["text"],
                 position=SCREEN_DIMENSIONS["centre"],
-            )
+            ),
+            Text(
+                string=TEXT_DROPPED_FRAMES.format(dropped_frame_percent),
+                font=fonts["small"],
+                position=(centre_x, centre_y + 200),
+            ),
+            self.status,
         ]
+
+    def display(self) -> None:
+        """
+        Display the scene on the main window, redrawing it when the progress
+        of saving the results changes.
+
+        Returns
+        -------
+        None
+        """
+        status = self.save_status()
+        if status != self.status.string:
+            self.status.string = status
+            self.is_dirty = True
+        super().display()
+
+    def is_saving(self) -> bool:
+        """
+        Whether the results are still being written.
+
+        Returns
+        -------
+        bool
+        """
+        return self.save is not None and not self.save.done()
+
+    def save_status(self) -> str:
+        """
+        Describes the progress of saving the results.
+
+        Returns
+        -------
+        str
+        """
+        if self.save is None:
+            return ""
+        if not self.save.done():
+            return TEXT_SAVING
+        error = self.save.exception()
+        if error:
+            return TEXT_SAVE_ERROR.format(error)
+        return TEXT_SAVED
@@ -3,6 +3,7 @@ from enum import IntEnum, auto
 
 import pygame
 
+from src.constants import BG_GREY, DIRTY_RECT_RENDERING
 from src.gui import Interactive
 from src.visuals import Element
 
@@ -24,6 +25,14 @@ class Scene:
     ----------
     screen: pygame.Surface
         The main window displaying the experiment.
+    is_dirty: bool
+        A flag indicating whether the whole scene must be redrawn next frame.
+    dirty_rects: list[pygame.Rect]
+        The regions of the main window changed by the last call to display().
+    event_types: tuple[int, ...]
+        The pygame event types the scene consumes. Other input events are
+        blocked from the event queue while the scene is active. QUIT and
+        KEYDOWN are needed to quit from any scene.
     Methods
     -------
     display()
@@ -38,11 +47,15 @@ class Scene:
         Handles mouse motion events.
     """
 
+    event_types: tuple[int, ...] = (pygame.QUIT, pygame.KEYDOWN)
+
     def __init__(self, screen: pygame.Surface) -> None:
         self.screen = screen
         self.progress = False
         self.elements: list[Element] = []
         self.interactables: list[Interactive] = []
+        self.is_dirty = True
+        self.dirty_rects: list[pygame.Rect] = []
 
     def update_state(self) -> bool:
         """
@@ -55,16 +68,33 @@ class Scene:
 
     def display(self) -> None:
         """
-        Displays the scene on the main window.
+        Displays the scene on the main window. When DIRTY_RECT_RENDERING is
+        enabled, the scene is only cleared and redrawn while it is dirty.
         Returns
         -------
         None
         """
+        if DIRTY_RECT_RENDERING:
+            if not self.is_dirty:
+                self.dirty_rects = []
+                return
+            self.redraw()
         for element in self.elements:
             element.draw(self.screen)
         for interactable in self.interactables:
             interactable.draw(self.screen)
 
+    def redraw(self) -> None:
+        """
+        Clears the whole main window and marks it as changed this frame.
+        Returns
+        -------
+        None
+        """
+        self.screen.fill(BG_GREY)
+        self.dirty_rects = [self.screen.get_rect()]
+        self.is_dirty = False
+
     @abstractmethod
     def button_down(self, button: int, mouse_pos: tuple[int, int]) -> None:
         """
@@ -33,6 +33,8 @@ class StartScene(Scene):
         Handles key down events.
     """
 
+    event_types = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
     def __init__(self, screen: pygame.Surface) -> None:
         super().__init__(screen)
         centre_x = SCREEN_DIMENSIONS["centre"][0]
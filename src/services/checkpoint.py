@@ -0,0 +1,156 @@
+"""
+Saves the shuffled trial order of a session to disk, so an interrupted session
+can be resumed at the next trial with the same order. Completed responses are
+recovered from the session's trial log.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from src.components import Participant, Trial
+from src.constants import CHECKPOINT_PATH
+
+
+def checkpoint_file(participant_id: int) -> Path:
+    """
+    Gets the checkpoint location of a participant's session.
+
+    Parameters
+    ----------
+    participant_id: int
+        The participant's ID.
+
+    Returns
+    -------
+    Path
+    """
+    return Path(CHECKPOINT_PATH) / f"{participant_id}.json"
+
+
+def trial_key(trial: Trial) -> list[int]:
+    """
+    Identifies a trial by its levels, independent of the order in which
+    stimuli and targets were loaded.
+
+    Parameters
+    ----------
+    trial: Trial
+        The trial to identify.
+
+    Returns
+    -------
+    list[int]
+    """
+    return [
+        trial.stimulus.species,
+        trial.stimulus.number,
+        trial.stimulus.gaze_direction,
+        trial.target.letter,
+        trial.target.location,
+        trial.stimulus_onset_async,
+    ]
+
+
+def save(participant: Participant, trials: list[Trial], log_path: Path) -> None:
+    """
+    Writes the trial order of a session. The file is replaced atomically, so a
+    crash while saving leaves any previous checkpoint intact.
+
+    Parameters
+    ----------
+    participant: Participant
+        The participant completing the session.
+    trials: list[Trial]
+        The trials in presentation order.
+    log_path: Path
+        The session's trial log.
+
+    Returns
+    -------
+    None
+    """
+    path = checkpoint_file(participant.id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "participant": dict(participant),
+                "log_path": str(log_path),
+                "trials": [trial_key(trial) for trial in trials],
+            },
+            file,
+        )
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+
+
+def load(participant_id: int) -> dict[str, Any] | None:
+    """
+    Reads the checkpoint of an unfinished session.
+
+    Parameters
+    ----------
+    participant_id: int
+        The participant's ID.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The checkpoint, or None if there is no readable checkpoint.
+    """
+    try:
+        with open(checkpoint_file(participant_id), encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def restore_order(keys: list[list[int]], trials: list[Trial]) -> list[Trial] | None:
+    """
+    Arranges generated trials in a checkpointed order.
+
+    Parameters
+    ----------
+    keys: list[list[int]]
+        The checkpointed trial order.
+    trials: list[Trial]
+        Newly generated trials.
+
+    Returns
+    -------
+    list[Trial] | None
+        The trials in checkpointed order, or None if they do not match the
+        checkpoint.
+    """
+    if len(keys) != len(trials):
+        return None
+    by_key: dict[tuple[int, ...], list[Trial]] = {}
+    for trial in trials:
+        by_key.setdefault(tuple(trial_key(trial)), []).append(trial)
+    ordered: list[Trial] = []
+    for key in keys:
+        matches = by_key.get(tuple(key))
+        if not matches:
+            return None
+        ordered.append(matches.pop())
+    return ordered
+
+
+def clear(participant_id: int) -> None:
+    """
+    Removes the checkpoint of a finished session.
+
+    Parameters
+    ----------
+    participant_id: int
+        The participant's ID.
+
+    Returns
+    -------
+    None
+    """
+    checkpoint_file(participant_id).unlink(missing_ok=True)
@@ -0,0 +1,110 @@
+"""
+Defines the Clock class, the high-resolution time source of the experiment,
+and the VirtualClock class, which stands in for it in simulations.
+"""
+
+from time import perf_counter_ns
+
+NS_PER_MS = 1_000_000
+
+
+class Clock:
+    """
+    A monotonic clock reporting milliseconds since it was created, with
+    sub-millisecond resolution.
+
+    Methods
+    -------
+    now() -> float
+        Gets the time in milliseconds since the clock was created.
+    to_ms(ns: int) -> float
+        Converts a perf_counter_ns() timestamp to the clock's timebase.
+    """
+
+    def __init__(self) -> None:
+        self._start_ns = perf_counter_ns()
+
+    def now(self) -> float:
+        """
+        Gets the time in milliseconds since the clock was created.
+
+        Returns
+        -------
+        float
+        """
+        return self.to_ms(perf_counter_ns())
+
+    def to_ms(self, ns: int) -> float:
+        """
+        Converts a perf_counter_ns() timestamp to milliseconds since the clock
+        was created.
+
+        Parameters
+        ----------
+        ns: int
+            A timestamp returned by time.perf_counter_ns().
+
+        Returns
+        -------
+        float
+        """
+        return (ns - self._start_ns) / NS_PER_MS
+
+
+class VirtualClock(Clock):
+    """
+    A clock that only moves when advanced, so simulations run as fast as the
+    CPU allows while the experiment sees real timings.
+
+    Methods
+    -------
+    now() -> float
+        Gets the virtual time in milliseconds.
+    to_ms(ns: int) -> float
+        Converts a timestamp in nanoseconds to milliseconds.
+    advance(ms: float) -> None
+        Moves the virtual time forward.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+
+    def now(self) -> float:
+        """
+        Gets the virtual time in milliseconds.
+
+        Returns
+        -------
+        float
+        """
+        return self._now
+
+    def to_ms(self, ns: int) -> float:
+        """
+        Converts a timestamp in nanoseconds to milliseconds.
+
+        Parameters
+        ----------
+        ns: int
+            A virtual timestamp in nanoseconds.
+
+        Returns
+        -------
+        float
+        """
+        return ns / NS_PER_MS
+
+    def advance(self, ms: float) -> None:
+        """
+        Moves the virtual time forward.
+
+        Parameters
+        ----------
+        ms: float
+            The time to advance by in milliseconds.
+
+        Returns
+        -------
+        None
+        """
+        self._now += ms
@@ -0,0 +1,157 @@
+"""
+Defines the EvdevEventSource class, which reads the response keys directly from
+a Linux input device. The kernel timestamps each key press as it arrives, so
+responses are timed without the latency and jitter of SDL's event queue.
+"""
+
+import fcntl
+import os
+import select
+import struct
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+import pygame
+
+from src.constants import EVDEV_KEYS
+from src.services.clock import Clock
+from src.services.event_source import EventSource
+
+# struct input_event: seconds, microseconds, type, code and value.
+INPUT_EVENT = struct.Struct("llHHi")
+EV_KEY = 1
+KEY_PRESS = 1
+
+# Selects the clock of the device's timestamps. Defaults to the wall clock.
+EVIOCSCLOCKID = 0x400445A0
+
+# Seconds the reader waits for input before checking whether it was closed.
+READ_TIMEOUT = 0.1
+
+
+class EvdevEventSource(EventSource):
+    """
+    Passes on the events of another source, replacing its response key presses
+    with those read from a Linux input device in a background thread. Every
+    other event, such as escape, still comes from the other source.
+
+    Attributes
+    ----------
+    source: EventSource
+        The source of all other events, usually the pygame event queue.
+    clock: Clock
+        Converts the kernel timestamps to the experiment's timebase.
+    path: Path
+        The input device, or a file of input events standing in for one.
+    keys: dict[int, int]
+        The pygame key code given by each input event code read.
+    reader: threading.Thread
+        Reads the device until it is closed or runs out of events.
+
+    Methods
+    -------
+    get() -> list[pygame.event.Event]
+        Gets the events that have arrived since the last call.
+    poll() -> None
+        Polls the other source.
+    close() -> None
+        Stops reading the device and closes the other source.
+    """
+
+    def __init__(
+        self,
+        source: EventSource,
+        clock: Clock,
+        path: Path | str,
+        keys: dict[int, int] = EVDEV_KEYS,
+    ) -> None:
+        self.source = source
+        self.clock = clock
+        self.path = Path(path)
+        self.keys = keys
+        self._events: deque[pygame.event.Event] = deque()
+        self._closed = threading.Event()
+        self._fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        try:
+            # perf_counter_ns also reads the monotonic clock on Linux.
+            fcntl.ioctl(self._fd, EVIOCSCLOCKID, struct.pack("i", time.CLOCK_MONOTONIC))
+            self._offset_ns = 0
+        except OSError:
+            # Not an input device, so timestamps are from the wall clock.
+            self._offset_ns = time.perf_counter_ns() - time.time_ns()
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+    def get(self) -> list[pygame.event.Event]:
+        """
+        Gets the events that have arrived since the last call. Presses of the
+        response keys from the other source are dropped.
+
+        Returns
+        -------
+        list[pygame.event.Event]
+        """
+        response_keys = self.keys.values()
+        events = [
+            event
+            for event in self.source.get()
+            if event.type != pygame.KEYDOWN or event.key not in response_keys
+        ]
+        while self._events:
+            events.append(self._events.popleft())
+        return events
+
+    def poll(self) -> None:
+        """
+        Polls the other source.
+
+        Returns
+        -------
+        None
+        """
+        self.source.poll()
+
+    def close(self) -> None:
+        """
+        Stops reading the device and closes the other source.
+
+        Returns
+        -------
+        None
+        """
+        self._closed.set()
+        self.reader.join()
+        os.close(self._fd)
+        self.source.close()
+
+    def _read(self) -> None:
+        buffer = b""
+        while not self._closed.is_set():
+            readable, _, _ = select.select([self._fd], [], [], READ_TIMEOUT)
+            if not readable:
+                continue
+            try:
+                data = os.read(self._fd, INPUT_EVENT.size * 64)
+            except BlockingIOError:
+                continue
+            except OSError:
+                # The device was unplugged.
+                return
+            if not data:
+                return
+            buffer += data
+            end = len(buffer) - len(buffer) % INPUT_EVENT.size
+            input_events = INPUT_EVENT.iter_unpack(buffer[:end])
+            for seconds, microseconds, event_type, code, value in input_events:
+                if event_type == EV_KEY and value == KEY_PRESS and code in self.keys:
+                    ns = seconds * 1_000_000_000 + microseconds * 1000
+                    self._events.append(
+                        pygame.event.Event(
+                            pygame.KEYDOWN,
+                            key=self.keys[code],
+                            time=self.clock.to_ms(ns + self._offset_ns),
+                        )
+                    )
+            buffer = buffer[end:]
@@ -0,0 +1,331 @@
+"""
+Defines the sources of input events read by the SceneManager each frame. The
+pygame event queue is used when running the experiment, and can be recorded
+to a file. A recording can be replayed by a scripted source against a virtual
+clock, so a whole session can be reproduced faster than real time. The
+recording starts with a header holding the rest of the session's state, such
+as its trial order.
+"""
+
+import json
+import os
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+from src.services.clock import Clock
+
+# Event attributes recorded as tuples, which JSON stores as lists.
+TUPLE_ATTRIBUTES = ["pos", "rel", "buttons"]
+
+
+class EventSource:
+    """
+    Base class for sources of input events.
+
+    Methods
+    -------
+    get() -> list[pygame.event.Event]
+        Gets the events that have arrived since the last call.
+    poll() -> None
+        Takes the events that have arrived so far, to be returned by get().
+    close() -> None
+        Releases the resources of the source.
+    """
+
+    @abstractmethod
+    def get(self) -> list[pygame.event.Event]:
+        """
+        Gets the events that have arrived since the last call.
+
+        Returns
+        -------
+        list[pygame.event.Event]
+        """
+        pass
+
+    def poll(self) -> None:
+        """
+        Takes the events that have arrived so far, to be returned by get().
+        Does nothing unless the source timestamps events on arrival.
+
+        Returns
+        -------
+        None
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Releases the resources of the source.
+
+        Returns
+        -------
+        None
+        """
+        pass
+
+
+class PygameEventSource(EventSource):
+    """
+    Reads events from the pygame event queue. Each event is given a time
+    attribute, the clock time in milliseconds when it was taken from the
+    queue. Polling between frames makes this close to its arrival time.
+
+    Attributes
+    ----------
+    clock: Clock
+        Timestamps the events.
+
+    Methods
+    -------
+    get() -> list[pygame.event.Event]
+        Gets the events that have arrived since the last call.
+    poll() -> None
+        Takes and timestamps the events waiting in the pygame event queue.
+    """
+
+    def __init__(self, clock: Clock | None = None) -> None:
+        self.clock = clock or Clock()
+        self._events: list[pygame.event.Event] = []
+
+    def get(self) -> list[pygame.event.Event]:
+        """
+        Gets the events that have arrived since the last call.
+
+        Returns
+        -------
+        list[pygame.event.Event]
+        """
+        self.poll()
+        events, self._events = self._events, []
+        return events
+
+    def poll(self) -> None:
+        """
+        Takes and timestamps the events waiting in the pygame event queue.
+
+        Returns
+        -------
+        None
+        """
+        events = pygame.event.get()
+        if not events:
+            return
+        time = self.clock.now()
+        for event in events:
+            event.time = time
+        self._events.extend(events)
+
+
+class RecordingEventSource(EventSource):
+    """
+    Passes on the events of another source, writing each to a JSON Lines file
+    with the time it was read. A header can be written before the events.
+
+    Attributes
+    ----------
+    source: EventSource
+        The source of the recorded events.
+    clock: Clock
+        Timestamps the recorded events.
+    path: Path
+        The location of the recording.
+
+    Methods
+    -------
+    write_header(header: dict[str, Any]) -> None
+        Records the state of the session needed to replay it.
+    get() -> list[pygame.event.Event]
+        Gets and records the events that have arrived since the last call.
+    poll() -> None
+        Polls the recorded source.
+    close() -> None
+        Closes the recording and the recorded source.
+    """
+
+    def __init__(self, source: EventSource, clock: Clock, path: Path | str) -> None:
+        self.source = source
+        self.clock = clock
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+
+    def write_header(self, header: dict[str, Any]) -> None:
+        """
+        Records the state of the session needed to replay it, such as the
+        trial order. Should be called before any events are read.
+
+        Parameters
+        ----------
+        header: dict[str, Any]
+            JSON serialisable session state.
+
+        Returns
+        -------
+        None
+        """
+        self._write([{"header": header}])
+
+    def get(self) -> list[pygame.event.Event]:
+        """
+        Gets and records the events that have arrived since the last call.
+
+        Returns
+        -------
+        list[pygame.event.Event]
+        """
+        events = self.source.get()
+        if events:
+            time = self.clock.now()
+            self._write([to_record(time, event) for event in events])
+        return events
+
+    def poll(self) -> None:
+        """
+        Polls the recorded source.
+
+        Returns
+        -------
+        None
+        """
+        self.source.poll()
+
+    def close(self) -> None:
+        """
+        Closes the recording and the recorded source.
+
+        Returns
+        -------
+        None
+        """
+        os.close(self._fd)
+        self.source.close()
+
+    def _write(self, records: list[dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(record) + "\n" for record in records)
+        os.write(self._fd, lines.encode("utf-8"))
+
+
+class ScriptedEventSource(EventSource):
+    """
+    Delivers a fixed list of timestamped events, each once the clock reaches
+    its time.
+
+    Attributes
+    ----------
+    clock: Clock
+        Decides which events are due.
+
+    Methods
+    -------
+    get() -> list[pygame.event.Event]
+        Gets the events that have become due since the last call.
+    is_finished() -> bool
+        Whether every event has been delivered.
+    """
+
+    def __init__(
+        self, events: list[tuple[float, pygame.event.Event]], clock: Clock
+    ) -> None:
+        self.clock = clock
+        self._events = sorted(events, key=lambda item: item[0])
+        self._next = 0
+
+    def get(self) -> list[pygame.event.Event]:
+        """
+        Gets the events that have become due since the last call.
+
+        Returns
+        -------
+        list[pygame.event.Event]
+        """
+        now = self.clock.now()
+        start = self._next
+        while self._next < len(self._events) and self._events[self._next][0] <= now:
+            self._next += 1
+        return [event for _, event in self._events[start : self._next]]
+
+    def is_finished(self) -> bool:
+        """
+        Whether every event has been delivered.
+
+        Returns
+        -------
+        bool
+        """
+        return self._next >= len(self._events)
+
+
+def to_record(time: float, event: pygame.event.Event) -> dict[str, Any]:
+    """
+    Converts an event to a JSON serialisable record. Attributes that cannot be
+    serialised, such as the window, are left out.
+
+    Parameters
+    ----------
+    time: float
+        The time the event was read in milliseconds.
+    event: pygame.event.Event
+        The event to record.
+
+    Returns
+    -------
+    dict[str, Any]
+    """
+    attributes = {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in event.dict.items()
+        if isinstance(value, (bool, int, float, str, tuple))
+    }
+    return {"time": time, "type": event.type, "attributes": attributes}
+
+
+def load_header(path: Path | str) -> dict[str, Any]:
+    """
+    Reads the header of a recording.
+
+    Parameters
+    ----------
+    path: Path | str
+        The location of the recording.
+
+    Returns
+    -------
+    dict[str, Any]
+        The recorded session state, empty if the recording has no header.
+    """
+    with open(path, encoding="utf-8") as file:
+        record = json.loads(file.readline() or "{}")
+    return record.get("header", {})
+
+
+def load_recording(path: Path | str) -> list[tuple[float, pygame.event.Event]]:
+    """
+    Reads the timestamped events of a recording.
+
+    Parameters
+    ----------
+    path: Path | str
+        The location of the recording.
+
+    Returns
+    -------
+    list[tuple[float, pygame.event.Event]]
+    """
+    events = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            record = json.loads(line)
+            if "header" in record:
+                continue
+            attributes = record["attributes"]
+            for key in TUPLE_ATTRIBUTES:
+                if key in attributes:
+                    attributes[key] = tuple(attributes[key])
+            events.append(
+                (record["time"], pygame.event.Event(record["type"], attributes))
+            )
+    return events
@@ -0,0 +1,153 @@
+"""
+Defines the FrameMonitor class, which tracks frame durations to detect dropped
+frames and timing jitter.
+"""
+
+from collections import deque
+from math import sqrt
+from statistics import fmean, pstdev
+
+from src.constants import DISPLAY_TIMING, DROPPED_FRAME_THRESHOLD, FRAME_HISTORY
+
+
+def dropped_frames(duration: float) -> int:
+    """
+    Gets the number of display refreshes missed by a frame. A frame lasting
+    longer than DROPPED_FRAME_THRESHOLD frame periods counts as dropped.
+
+    Parameters
+    ----------
+    duration: float
+        The time between two flips in milliseconds.
+
+    Returns
+    -------
+    int
+    """
+    periods = duration / DISPLAY_TIMING["frame_period"]
+    if periods <= DROPPED_FRAME_THRESHOLD:
+        return 0
+    return max(round(periods) - 1, 1)
+
+
+class FrameMonitor:
+    """
+    Keeps a ring buffer of the most recent frame durations, and running totals
+    of every duration since the totals were last cleared.
+
+    Attributes
+    ----------
+    durations: deque[float]
+        The time between consecutive flips in milliseconds, oldest first.
+
+    Methods
+    -------
+    record(time: float) -> float | None
+        Records a flip and returns the duration of the frame it ended.
+    reset() -> None
+        Forgets the last flip, so the next frame is not timed.
+    statistics() -> dict[str, float]
+        Summarises the durations in the buffer.
+    totals() -> dict[str, float]
+        Summarises every duration since the totals were last cleared.
+    clear_totals() -> None
+        Starts new running totals.
+    """
+
+    def __init__(self, size: int = FRAME_HISTORY) -> None:
+        self.durations: deque[float] = deque(maxlen=size)
+        self._last_flip: float | None = None
+        self.clear_totals()
+
+    def record(self, time: float) -> float | None:
+        """
+        Records a flip and returns the duration of the frame it ended.
+
+        Parameters
+        ----------
+        time: float
+            The time of the flip in milliseconds.
+
+        Returns
+        -------
+        float | None
+            The time since the previous flip, or None for the first flip.
+        """
+        last_flip, self._last_flip = self._last_flip, time
+        if last_flip is None:
+            return None
+        duration = time - last_flip
+        self.durations.append(duration)
+        # Welford's algorithm, so the totals need no memory per frame.
+        self._frames += 1
+        delta = duration - self._mean
+        self._mean += delta / self._frames
+        self._m2 += delta * (duration - self._mean)
+        self._max = max(self._max, duration)
+        self._dropped += dropped_frames(duration)
+        return duration
+
+    def reset(self) -> None:
+        """
+        Forgets the last flip, so the next frame is not timed. Used when a
+        frame is expected to be slow, such as on a scene transition.
+
+        Returns
+        -------
+        None
+        """
+        self._last_flip = None
+
+    def statistics(self) -> dict[str, float]:
+        """
+        Summarises the durations in the buffer.
+
+        Returns
+        -------
+        dict[str, float]
+            The mean, standard deviation and maximum frame duration in
+            milliseconds, the target frame period, and the number of frames
+            and dropped frames in the buffer.
+        """
+        durations = self.durations or [0.0]
+        return {
+            "frames": len(self.durations),
+            "target_ms": DISPLAY_TIMING["frame_period"],
+            "mean_ms": fmean(durations),
+            "sd_ms": pstdev(durations),
+            "max_ms": max(durations),
+            "dropped": sum(dropped_frames(duration) for duration in self.durations),
+        }
+
+    def totals(self) -> dict[str, float]:
+        """
+        Summarises every duration since the totals were last cleared, unlike
+        statistics() which only covers the buffer.
+
+        Returns
+        -------
+        dict[str, float]
+            The same measures as statistics().
+        """
+        return {
+            "frames": self._frames,
+            "target_ms": DISPLAY_TIMING["frame_period"],
+            "mean_ms": self._mean,
+            "sd_ms": sqrt(self._m2 / self._frames) if self._frames else 0.0,
+            "max_ms": self._max,
+            "dropped": self._dropped,
+        }
+
+    def clear_totals(self) -> None:
+        """
+        Starts new running totals.
+
+        Returns
+        -------
+        None
+        """
+        self._frames = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._max = 0.0
+        self._dropped = 0
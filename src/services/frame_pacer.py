@@ -0,0 +1,126 @@
+"""
+Defines the FramePacer class, which regulates the framerate of the main loop.
+"""
+
+from collections.abc import Callable
+from enum import StrEnum
+from time import perf_counter_ns, sleep
+
+import pygame
+
+from src.constants import (
+    DISPLAY_TIMING,
+    FRAME_PACING,
+    INPUT_POLL_INTERVAL,
+    SPIN_MARGIN,
+)
+from src.services.clock import NS_PER_MS
+
+
+class PacingMode(StrEnum):
+    """
+    Defines how the main loop waits for the next frame.
+    """
+
+    TICK = "tick"  # pygame.time.Clock.tick, limited by OS sleep granularity.
+    HYBRID = "hybrid"  # Sleep until shortly before the deadline, then spin.
+    VSYNC = "vsync"  # No waiting, the display update blocks until vsync.
+
+
+class FramePacer:
+    """
+    Regulates the framerate of the main loop.
+
+    Attributes
+    ----------
+    mode: PacingMode
+        How the main loop waits for the next frame.
+    spin_margin: float
+        The time in milliseconds before each frame deadline at which hybrid
+        pacing stops sleeping and busy-waits.
+    poll: Callable[[], None] | None
+        Takes waiting input events, so they are timestamped on arrival rather
+        than at the next frame. Hybrid pacing calls it while sleeping, at
+        most poll_interval apart, and while spinning. The other modes wait in
+        pygame or the display driver, so input is only taken once per frame.
+    poll_interval: float
+        The time in milliseconds between calls to poll while sleeping.
+    clock: pygame.time.Clock
+        Measures the achieved framerate.
+
+    Methods
+    -------
+    wait() -> None
+        Waits until the next frame is due.
+    report(statistics: dict[str, float]) -> None
+        Prints the achieved frame period against the target.
+    """
+
+    def __init__(
+        self,
+        mode: PacingMode | str = FRAME_PACING,
+        spin_margin: float = SPIN_MARGIN,
+        poll: Callable[[], None] | None = None,
+        poll_interval: float = INPUT_POLL_INTERVAL,
+    ) -> None:
+        self.mode = PacingMode(mode)
+        self.spin_margin = spin_margin
+        self.poll = poll
+        self.poll_interval = poll_interval
+        self.clock = pygame.time.Clock()
+        self._deadline = perf_counter_ns()
+
+    def wait(self) -> None:
+        """
+        Waits until the next frame is due, according to the pacing mode.
+
+        Returns
+        -------
+        None
+        """
+        if self.mode == PacingMode.TICK:
+            self.clock.tick(DISPLAY_TIMING["refresh_rate"])
+            return
+        if self.mode == PacingMode.HYBRID:
+            self._wait_hybrid()
+        self.clock.tick()
+
+    def _wait_hybrid(self) -> None:
+        # Deadlines advance by whole frame periods so that sleep overshoot does
+        # not accumulate, and restart from now when a frame is already late.
+        now = perf_counter_ns()
+        period = round(DISPLAY_TIMING["frame_period"] * NS_PER_MS)
+        deadline = max(self._deadline + period, now)
+        spin_start = deadline - round(self.spin_margin * NS_PER_MS)
+        while (remaining := spin_start - perf_counter_ns()) > 0:
+            if self.poll:
+                self.poll()
+                remaining = min(remaining, round(self.poll_interval * NS_PER_MS))
+            sleep(remaining / 1_000_000_000)
+        while perf_counter_ns() < deadline:
+            if self.poll:
+                self.poll()
+        self._deadline = deadline
+
+    def report(self, statistics: dict[str, float]) -> None:
+        """
+        Prints the achieved frame period against the target, to compare pacing
+        modes on a machine.
+
+        Parameters
+        ----------
+        statistics: dict[str, float]
+            Frame duration statistics from FrameMonitor.statistics() or totals().
+
+        Returns
+        -------
+        None
+        """
+        print(
+            f"{self.mode} pacing over {statistics['frames']} frames: "
+            f"target {statistics['target_ms']:.3f} ms, "
+            f"mean {statistics['mean_ms']:.3f} ms, "
+            f"sd {statistics['sd_ms']:.3f} ms, "
+            f"max {statistics['max_ms']:.3f} ms, "
+            f"{statistics['dropped']} dropped"
+        )
@@ -0,0 +1,87 @@
+"""
+Converts experiment intervals to whole display frames, so trial phases can be
+triggered by frame count at the detected refresh rate.
+"""
+
+from collections.abc import Iterable
+
+from src.constants import DISPLAY_TIMING
+
+
+def to_frames(ms: float) -> int:
+    """
+    Converts an interval to the nearest whole number of frames.
+
+    Parameters
+    ----------
+    ms: float
+        The interval in milliseconds.
+
+    Returns
+    -------
+    int
+    """
+    return round(ms / DISPLAY_TIMING["frame_period"])
+
+
+def to_ms(frames: int) -> float:
+    """
+    Converts a number of frames to milliseconds.
+
+    Parameters
+    ----------
+    frames: int
+        The number of frames.
+
+    Returns
+    -------
+    float
+    """
+    return frames * DISPLAY_TIMING["frame_period"]
+
+
+def quantisation_errors(intervals: Iterable[float]) -> dict[float, float]:
+    """
+    Gets the difference between each interval and its frame-quantised duration.
+
+    Parameters
+    ----------
+    intervals: Iterable[float]
+        The intervals in milliseconds.
+
+    Returns
+    -------
+    dict[float, float]
+        The quantised duration minus the interval, in milliseconds, keyed on
+        the interval.
+    """
+    return {ms: to_ms(to_frames(ms)) - ms for ms in intervals}
+
+
+def report_quantisation(intervals: dict[str, Iterable[float]]) -> None:
+    """
+    Prints the refresh rate, whether it was measured or FRAMERATE was assumed,
+    and the frame-quantised duration of each interval.
+
+    Parameters
+    ----------
+    intervals: dict[str, Iterable[float]]
+        The intervals in milliseconds, keyed on their name.
+
+    Returns
+    -------
+    None
+    """
+    source = (
+        "measured" if DISPLAY_TIMING["refresh_rate_measured"] else "FRAMERATE fallback"
+    )
+    print(
+        f"Refresh rate: {DISPLAY_TIMING['refresh_rate']:g} Hz, {source} "
+        f"({DISPLAY_TIMING['frame_period']:.3f} ms per frame)"
+    )
+    for name, values in intervals.items():
+        for ms, error in quantisation_errors(values).items():
+            print(
+                f"{name} {ms:g} ms: {to_frames(ms)} frames, "
+                f"{to_ms(to_frames(ms)):.3f} ms ({error:+.3f} ms)"
+            )
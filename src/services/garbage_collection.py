@@ -0,0 +1,138 @@
+"""
+Controls Python's garbage collector during the experiment, so that automatic
+collections cannot pause the main loop at a stimulus or target onset.
+Collections are instead run explicitly at the start of each inter-trial
+interval and rest, and every collection of the session is logged with its
+duration and the trial phase it happened in.
+"""
+
+import gc
+from collections.abc import Callable
+from dataclasses import dataclass
+from time import perf_counter
+
+from src.constants import GC_CONTROL
+
+
+def _no_phase() -> str:
+    return ""
+
+
+@dataclass
+class _Tracking:
+    # The trial phase collections are labelled with, and when the current
+    # collection started.
+    phase: Callable[[], str] = _no_phase
+    collection_start: float = 0.0
+
+
+_tracking = _Tracking()
+
+_collection_log: list[dict[str, float | int | str]] = []
+
+
+def _log_collection(event: str, info: dict[str, int]) -> None:
+    if event == "start":
+        _tracking.collection_start = perf_counter()
+        return
+    _collection_log.append(
+        {
+            "generation": info["generation"],
+            "collected": info["collected"],
+            "duration_ms": (perf_counter() - _tracking.collection_start) * 1000,
+            "phase": _tracking.phase(),
+        }
+    )
+
+
+def track_collections(phase: Callable[[], str]) -> None:
+    """
+    Logs every garbage collection, labelled with the trial phase.
+
+    Parameters
+    ----------
+    phase: Callable[[], str]
+        Returns the name of the current trial phase.
+
+    Returns
+    -------
+    None
+    """
+    _tracking.phase = phase
+    if _log_collection not in gc.callbacks:
+        gc.callbacks.append(_log_collection)
+
+
+def collection_log() -> list[dict[str, float | int | str]]:
+    """
+    Gets the collections logged since the log was last cleared.
+
+    Returns
+    -------
+    list[dict[str, float | int | str]]
+        The generation, objects collected, duration and trial phase of each
+        collection.
+    """
+    return list(_collection_log)
+
+
+def clear_log() -> None:
+    """
+    Clears the collection log, e.g. at the start of a session.
+
+    Returns
+    -------
+    None
+    """
+    _collection_log.clear()
+
+
+def freeze() -> None:
+    """
+    Moves every object tracked by the collector to a permanent generation,
+    so long-lived objects such as stimuli and trials are never scanned again.
+
+    Returns
+    -------
+    None
+    """
+    if not GC_CONTROL:
+        return
+    gc.collect()
+    gc.freeze()
+
+
+def pause() -> None:
+    """
+    Disables automatic garbage collection.
+
+    Returns
+    -------
+    None
+    """
+    if GC_CONTROL:
+        gc.disable()
+
+
+def resume() -> None:
+    """
+    Re-enables automatic garbage collection.
+
+    Returns
+    -------
+    None
+    """
+    if GC_CONTROL:
+        gc.enable()
+
+
+def collect() -> None:
+    """
+    Runs a full garbage collection while automatic collection is paused.
+
+    Returns
+    -------
+    None
+    """
+    if GC_CONTROL and not gc.isenabled():
+        gc.collect()
@@ -0,0 +1,190 @@
+"""
+Loads and scales experiment images, decoding files concurrently.
+
+Scaled pixel data is cached on disk as raw RGBA buffers, keyed on the
+content hash of the source file and the scaled size, so later launches
+memory-map the cache instead of decoding the source images again.
+"""
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+import pygame
+
+from src.constants import IMAGE_CACHE_PATH, LOADING_WORKERS, REPORT_LOAD_TIMES
+
+CACHE_FORMAT = "RGBA"
+
+load_times: dict[str, float] = {}
+
+
+def cache_file(path: str, size: tuple[int, int], cache_path: str) -> Path:
+    """
+    Gets the cache file of an image scaled to a size. The file name changes
+    whenever the content of the source image or the size changes.
+
+    Parameters
+    ----------
+    path: str
+        Path to the source image file.
+    size: tuple[int, int]
+        The width and height of the scaled image.
+    cache_path: str
+        Directory containing the cached images.
+
+    Returns
+    -------
+    Path
+    """
+    with open(path, "rb") as file:
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+    return Path(cache_path) / f"{digest}_{size[0]}x{size[1]}.{CACHE_FORMAT.lower()}"
+
+
+def read_cache(file: Path, size: tuple[int, int]) -> pygame.Surface | None:
+    """
+    Memory-maps a cached image. Returns None if the cache file is missing or
+    does not match the expected size.
+
+    Parameters
+    ----------
+    file: Path
+        The cache file.
+    size: tuple[int, int]
+        The width and height of the cached image.
+
+    Returns
+    -------
+    pygame.Surface | None
+    """
+    if not file.is_file() or file.stat().st_size != size[0] * size[1] * 4:
+        return None
+    with open(file, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    return pygame.image.frombuffer(buffer, size, CACHE_FORMAT)
+
+
+def write_cache(file: Path, surface: pygame.Surface) -> None:
+    """
+    Writes the pixel data of a scaled image to the cache. The data is written to
+    a temporary file first so an interrupted write never leaves a partial entry.
+
+    Parameters
+    ----------
+    file: Path
+        The cache file.
+    surface: pygame.Surface
+        The scaled image.
+
+    Returns
+    -------
+    None
+    """
+    file.parent.mkdir(parents=True, exist_ok=True)
+    temp = file.with_suffix(f".{os.getpid()}.tmp")
+    temp.write_bytes(pygame.image.tobytes(surface, CACHE_FORMAT))
+    os.replace(temp, file)
+
+
+def load_scaled_image(
+    path: str, size: tuple[int, int], cache_path: str | None = IMAGE_CACHE_PATH
+) -> pygame.Surface:
+    """
+    Loads an image file and scales it, recording the load time in milliseconds.
+    Reads the image from the cache when an entry exists, and otherwise decodes
+    the file and adds it to the cache.
+
+    Parameters
+    ----------
+    path: str
+        Path to the image file.
+    size: tuple[int, int]
+        The width and height of the scaled image.
+    cache_path: str | None, optional
+        Directory containing the cached images, or None to always decode the
+        file. Defaults to IMAGE_CACHE_PATH from src.constants.
+
+    Returns
+    -------
+    pygame.Surface
+    """
+    start = perf_counter()
+    file = cache_file(path, size, cache_path) if cache_path else None
+    surface = read_cache(file, size) if file else None
+    if surface is None:
+        surface = pygame.transform.scale(pygame.image.load(path), size)
+        if file:
+            write_cache(file, surface)
+    load_times[path] = (perf_counter() - start) * 1000
+    return surface
+
+
+def load_scaled_images(
+    paths: list[str],
+    size: tuple[int, int],
+    workers: int = LOADING_WORKERS,
+    cache_path: str | None = IMAGE_CACHE_PATH,
+) -> list[pygame.Surface]:
+    """
+    Loads and scales image files, using a thread pool when more than one worker
+    is requested. pygame releases the GIL while decoding and scaling, so images
+    are processed concurrently and returned to the calling thread in order.
+
+    Parameters
+    ----------
+    paths: list[str]
+        Paths to the image files.
+    size: tuple[int, int]
+        The width and height of the scaled images.
+    workers: int, optional
+        Number of loading threads. Defaults to LOADING_WORKERS from src.constants.
+    cache_path: str | None, optional
+        Directory containing the cached images, or None to always decode the
+        files. Defaults to IMAGE_CACHE_PATH from src.constants.
+
+    Returns
+    -------
+    list[pygame.Surface]
+        The scaled images, in the same order as paths.
+    """
+    start = perf_counter()
+    if workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            surfaces = list(
+                executor.map(lambda p: load_scaled_image(p, size, cache_path), paths)
+            )
+    else:
+        surfaces = [load_scaled_image(path, size, cache_path) for path in paths]
+    if REPORT_LOAD_TIMES:
+        report_load_times(paths, (perf_counter() - start) * 1000, workers)
+    return surfaces
+
+
+def report_load_times(paths: list[str], total: float, workers: int) -> None:
+    """
+    Prints the load time of each image and the total wall time.
+
+    Parameters
+    ----------
+    paths: list[str]
+        Paths to the loaded image files.
+    total: float
+        Wall time taken to load every image, in milliseconds.
+    workers: int
+        Number of loading threads used.
+
+    Returns
+    -------
+    None
+    """
+    for path in paths:
+        print(f"{path}: {load_times[path]:.1f} ms")
+    print(
+        f"Loaded {len(paths)} images in {total:.1f} ms "
+        f"({sum(load_times[path] for path in paths):.1f} ms decoding, "
+        f"{workers} workers)"
+    )
@@ -0,0 +1,173 @@
+"""
+Writes the results tables of a session in each of the configured output
+formats. Excel keeps every table as a sheet of one workbook, while the
+columnar formats write one file per table, which are far faster to read back
+for analysis. Parquet and Feather require pyarrow, and are skipped when it is
+not installed.
+"""
+
+import os
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+
+from pandas import DataFrame, ExcelWriter
+
+from src.constants import OUTPUT_FORMATS
+
+# Explicit column types of the trial_data table. Nullable types are used where
+# a value is missing for trials without a response or measured onset.
+TRIAL_DATA_DTYPES: dict[str, str] = {
+    "stimulus_number": "int64",
+    "stimulus_species": "int64",
+    "stimulus_gaze_direction": "int64",
+    "target_letter": "int64",
+    "target_location": "int64",
+    "stimulus_onset_async": "int64",
+    "response": "int64",
+    "reaction_time": "Float64",
+    "time_trial_start": "Float64",
+    "time_draw_stimulus": "Float64",
+    "time_draw_target": "Float64",
+    "time_response": "Float64",
+    "time_stimulus_onset": "Float64",
+    "time_target_onset": "Float64",
+    "frames_dropped": "int64",
+    "max_frame_ms": "float64",
+    "response_accuracy": "int64",
+    "gaze_validity": "int64",
+    "measured_stimulus_onset_async": "Float64",
+    "measured_reaction_time": "Float64",
+    "participant_id": "int64",
+    "participant_age": "int64",
+    "participant_gender": "int64",
+    "participant_culture": "int64",
+    "counterbalancing": "int64",
+}
+
+
+def with_dtypes(df: DataFrame, dtypes: dict[str, str]) -> DataFrame:
+    """
+    Casts the columns of a table to explicit types.
+
+    Parameters
+    ----------
+    df: DataFrame
+        The table to cast.
+    dtypes: dict[str, str]
+        The type of each column. Columns missing from the table are ignored.
+
+    Returns
+    -------
+    DataFrame
+    """
+    return df.astype({k: v for k, v in dtypes.items() if k in df.columns})
+
+
+def _replace(tmp: Path, path: Path) -> None:
+    # Syncs a fully written temporary file and renames it into place.
+    with open(tmp, "rb") as file:
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+
+
+def _columnar(df: DataFrame) -> DataFrame:
+    # Columnar formats store the index as an ordinary column.
+    return df.reset_index() if df.index.name else df
+
+
+def write_xlsx(stem: Path, tables: dict[str, DataFrame]) -> None:
+    tmp = stem.with_name(f"{stem.name}.tmp.xlsx")
+    with ExcelWriter(tmp) as writer:
+        for name, df in tables.items():
+            df.to_excel(writer, sheet_name=name)
+    _replace(tmp, stem.with_suffix(".xlsx"))
+
+
+def write_csv(stem: Path, tables: dict[str, DataFrame]) -> None:
+    for name, df in tables.items():
+        tmp = stem.with_name(f"{stem.name}_{name}.tmp.csv")
+        _columnar(df).to_csv(tmp, index=False)
+        _replace(tmp, stem.with_name(f"{stem.name}_{name}.csv"))
+
+
+def write_parquet(stem: Path, tables: dict[str, DataFrame]) -> None:
+    for name, df in tables.items():
+        tmp = stem.with_name(f"{stem.name}_{name}.tmp.parquet")
+        _columnar(df).to_parquet(tmp, index=False)
+        _replace(tmp, stem.with_name(f"{stem.name}_{name}.parquet"))
+
+
+def write_feather(stem: Path, tables: dict[str, DataFrame]) -> None:
+    for name, df in tables.items():
+        tmp = stem.with_name(f"{stem.name}_{name}.tmp.feather")
+        _columnar(df).reset_index(drop=True).to_feather(tmp)
+        _replace(tmp, stem.with_name(f"{stem.name}_{name}.feather"))
+
+
+writers: dict[str, Callable[[Path, dict[str, DataFrame]], None]] = {
+    "xlsx": write_xlsx,
+    "csv": write_csv,
+    "parquet": write_parquet,
+    "feather": write_feather,
+}
+
+# Formats that cannot be written without an optional dependency.
+requirements: dict[str, str] = {
+    "parquet": "pyarrow",
+    "feather": "pyarrow",
+}
+
+
+def is_available(output_format: str) -> bool:
+    """
+    Whether an output format can be written in this environment.
+
+    Parameters
+    ----------
+    output_format: str
+        The name of the format, as a key of writers.
+
+    Returns
+    -------
+    bool
+    """
+    if output_format not in writers:
+        return False
+    requirement = requirements.get(output_format)
+    return requirement is None or find_spec(requirement) is not None
+
+
+def write_tables(
+    stem: Path | str,
+    tables: dict[str, DataFrame],
+    output_formats: list[str] = OUTPUT_FORMATS,
+) -> list[str]:
+    """
+    Writes each table in every available output format. Every file is written
+    to a temporary path and synced before it replaces any previous output.
+
+    Parameters
+    ----------
+    stem: Path | str
+        The output path without a suffix, e.g. data/1.
+    tables: dict[str, DataFrame]
+        The tables to write, keyed by name.
+    output_formats: list[str], optional
+        The formats to write. Defaults to OUTPUT_FORMATS from src.constants.
+
+    Returns
+    -------
+    list[str]
+        The formats written.
+    """
+    stem = Path(stem)
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    written = []
+    for output_format in output_formats:
+        if not is_available(output_format):
+            print(f"Output format {output_format} is unavailable and was skipped")
+            continue
+        writers[output_format](stem, tables)
+        written.append(output_format)
+    return written
@@ -0,0 +1,152 @@
+"""
+Maintains an index of saved sessions in DATA_PATH, so the highest participant
+ID can be found without scanning every output file. The index is rebuilt from
+a scan only when it is missing, unreadable or older than the data directory.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.constants import DATA_PATH, PARTICIPANT_INDEX_FILE
+
+# Suffixes of the output files a scan recognises as saved sessions.
+OUTPUT_SUFFIXES = [".xlsx", ".csv", ".parquet", ".feather"]
+
+
+def index_file() -> Path:
+    """
+    Gets the location of the index.
+
+    Returns
+    -------
+    Path
+    """
+    return Path(DATA_PATH) / PARTICIPANT_INDEX_FILE
+
+
+def is_stale() -> bool:
+    """
+    Whether the index is missing or older than the last change to DATA_PATH,
+    such as an output file copied in by hand.
+
+    Returns
+    -------
+    bool
+    """
+    try:
+        index_mtime = index_file().stat().st_mtime_ns
+    except OSError:
+        return True
+    return Path(DATA_PATH).stat().st_mtime_ns > index_mtime
+
+
+def scan() -> dict[str, Any]:
+    """
+    Builds the index by scanning DATA_PATH for output files named by
+    participant ID.
+
+    Returns
+    -------
+    dict[str, Any]
+    """
+    ids: set[int] = set()
+    for file in Path(DATA_PATH).rglob("*"):
+        if file.suffix not in OUTPUT_SUFFIXES:
+            continue
+        stem = file.stem.split("_")[0]
+        if stem.isnumeric():
+            ids.add(int(stem))
+    return {
+        "highest_id": max(ids, default=1),
+        "sessions": [{"participant_id": id} for id in sorted(ids)],
+    }
+
+
+def load() -> dict[str, Any]:
+    """
+    Reads the index, rebuilding it from a scan if it is missing or stale.
+
+    Returns
+    -------
+    dict[str, Any]
+    """
+    if not is_stale():
+        try:
+            with open(index_file(), encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, json.JSONDecodeError):
+            pass
+    index = scan()
+    if os.path.isdir(DATA_PATH):
+        save(index)
+    return index
+
+
+def save(index: dict[str, Any]) -> None:
+    """
+    Writes the index atomically.
+
+    Parameters
+    ----------
+    index: dict[str, Any]
+        The index to write.
+
+    Returns
+    -------
+    None
+    """
+    path = index_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as file:
+        json.dump(index, file, indent=1)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+    # Replacing the file updates the directory after the file was written, so
+    # the index is touched to be no older than DATA_PATH.
+    os.utime(path)
+
+
+def highest_id() -> int:
+    """
+    Gets the highest participant ID with a saved session.
+
+    Returns
+    -------
+    int
+        The highest ID, or 1 if no sessions are saved.
+    """
+    return load()["highest_id"]
+
+
+def record_session(participant_id: int, index: dict[str, Any] | None = None) -> None:
+    """
+    Adds a saved session to the index. Should be called once the session's
+    output files are written.
+
+    Parameters
+    ----------
+    participant_id: int
+        The ID of the participant whose session was saved.
+    index: dict[str, Any] | None, optional
+        The index loaded before the output files were written. Writing the
+        files makes the index stale, so loading it afterwards would rescan.
+
+    Returns
+    -------
+    None
+    """
+    if index is None:
+        index = load()
+    index["highest_id"] = max(index["highest_id"], participant_id)
+    index["sessions"].append(
+        {
+            "participant_id": participant_id,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+        }
+    )
+    save(index)
@@ -2,15 +2,36 @@
 Defines SceneManager class, which handles pygame events and game scenes.
 """
 
+from collections.abc import Callable
+
 import pygame
 
+from src.components import Trial
 from src.scenes.details_scene import DetailsScene
 from src.scenes.experiment_scene import ExperimentScene
 from src.scenes.finished_scene import FinishedScene
 from src.scenes.scene import QuitActionType, Scene
 from src.scenes.start_scene import StartScene
+from src.services.clock import Clock
+from src.services.event_source import EventSource, PygameEventSource
+from src.services.frame_monitor import FrameMonitor
 from src.services.trial_manager import TrialManager
 
+# Handles an input event, returning an action to end the frame early with.
+EventHandler = Callable[[pygame.event.Event], QuitActionType | None]
+
+# Input event types blocked while the active scene does not consume them.
+INPUT_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.TEXTINPUT,
+]
+
 
 class SceneManager:
     """
@@ -19,18 +40,74 @@ class SceneManager:
     ----------
     screen: pygame.Surface
         The main window displaying the experiment.
+    clock: Clock
+        The high-resolution clock timestamping trials and responses. A
+        VirtualClock can be given to run the experiment in a simulation.
+    events: EventSource
+        The source of input events, the pygame event queue by default. A
+        ScriptedEventSource can be given to replay a recorded session.
+    frame_monitor: FrameMonitor
+        Tracks recent frame durations to detect dropped frames.
+    scene_statistics: dict[str, dict[str, float]]
+        The frame totals of each ended scene, keyed on the scene's class name.
+    dispatch: dict[int, EventHandler]
+        The handler of each event type the active scene consumes. Rebuilt
+        whenever the active scene changes.
     Methods
     -------
     process_game_events()
         Manages all pygame events, delegates events to the active scene, and updates the state of scenes.
     start_new_scene()
         Replaces the active scene with the next.
+    record_flip()
+        Timestamps the frame just presented on the display.
+    is_saving()
+        Whether the results are still being written.
+    experiment_frame_statistics()
+        Summarises the frames of the experiment scene.
+    dispatch_table()
+        Maps the event types a scene consumes to their handlers.
     """
 
-    def __init__(self, screen: pygame.Surface) -> None:
-        self.active_scene: Scene = StartScene(screen)
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        clock: Clock | None = None,
+        events: EventSource | None = None,
+    ) -> None:
         self.trial_manager: TrialManager = TrialManager()
-        self.time = 0
+        self.prepared_trial: Trial | None = None
+        self.clock = clock or Clock()
+        self.events = events or PygameEventSource(self.clock)
+        self.frame_monitor = FrameMonitor()
+        self.scene_statistics: dict[str, dict[str, float]] = {}
+        self.time = 0.0
+        self.active_scene = StartScene(screen)
+
+    @property
+    def active_scene(self) -> Scene:
+        """
+        Gets or sets the active scene. Setting it rebuilds the dispatch table
+        and blocks the input events the scene does not consume, so they are
+        dropped by SDL instead of queued.
+        Returns
+        -------
+        Scene
+        """
+        return self._active_scene
+
+    @active_scene.setter
+    def active_scene(self, scene: Scene) -> None:
+        self._active_scene = scene
+        self.dispatch = self.dispatch_table(scene)
+        pygame.event.set_blocked(
+            [
+                event_type
+                for event_type in INPUT_EVENTS
+                if event_type not in scene.event_types
+            ]
+        )
+        pygame.event.set_allowed(scene.event_types)
 
     def process_game_events(self) -> QuitActionType:
         """
@@ -40,27 +117,15 @@ class SceneManager:
         QuitActionType
             Communicates whether program should continue, quit, or restart.
         """
-        self.time = pygame.time.get_ticks()
+        self.time = self.clock.now()
         quit_action = QuitActionType.CONTINUE
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return QuitActionType.QUIT
-            elif event.type == pygame.MOUSEMOTION:
-                self.active_scene.mouse_motion(event.pos)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button in (1, 3):
-                    self.active_scene.button_down(event.button, event.pos)
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return QuitActionType.QUIT
-                if event.key == pygame.K_r and isinstance(
-                    self.active_scene, FinishedScene
-                ):
-                    return QuitActionType.RESTART
-                if isinstance(self.active_scene, ExperimentScene):
-                    self.trial_manager.key_down(self.time, event.key)
-                self.active_scene.key_down(event.key)
+        for event in self.events.get():
+            handler = self.dispatch.get(event.type)
+            if handler:
+                action = handler(event)
+                if action is not None:
+                    return action
 
         if self.active_scene.update_state():
             self.start_new_scene()
@@ -71,6 +136,9 @@ class SceneManager:
                 self.start_new_scene()
                 return QuitActionType.CONTINUE
             elements = self.trial_manager.during_trial(self.time)
+            if self.trial_manager.current_trial is not self.prepared_trial:
+                self.prepared_trial = self.trial_manager.current_trial
+                self.active_scene.prepare_frames(self.trial_manager.trial_phases())
             self.active_scene.is_resting = self.trial_manager.is_resting
             self.active_scene.display(elements)
         else:
@@ -78,14 +146,147 @@ class SceneManager:
 
         return quit_action
 
+    def record_flip(self) -> None:
+        """
+        Timestamps the frame just presented on the display. Should be called
+        immediately after the display is updated.
+        Returns
+        -------
+        None
+        """
+        time = self.clock.now()
+        duration = self.frame_monitor.record(time)
+        if isinstance(self.active_scene, ExperimentScene):
+            self.trial_manager.record_flip(time, duration)
+
+    def experiment_frame_statistics(self) -> dict[str, float]:
+        """
+        Summarises the frames of the experiment scene, or of the active scene
+        if the experiment has not ended, e.g. when quitting early.
+        Returns
+        -------
+        dict[str, float]
+        """
+        return self.scene_statistics.get(
+            ExperimentScene.__name__, self.frame_monitor.totals()
+        )
+
+    def is_saving(self) -> bool:
+        """
+        Whether the results are still being written. Quitting and restarting
+        are blocked until the write is complete.
+        Returns
+        -------
+        bool
+        """
+        return (
+            isinstance(self.active_scene, FinishedScene)
+            and self.active_scene.is_saving()
+        )
+
+    def dispatch_table(self, scene: Scene) -> dict[int, EventHandler]:
+        """
+        Maps the event types a scene consumes to their handlers.
+        Parameters
+        ----------
+        scene: Scene
+            The scene receiving the events.
+        Returns
+        -------
+        dict[int, EventHandler]
+        """
+        handlers: dict[int, EventHandler] = {
+            pygame.QUIT: self.quit,
+            pygame.MOUSEMOTION: self.mouse_motion,
+            pygame.MOUSEBUTTONDOWN: self.button_down,
+            pygame.KEYDOWN: self.key_down,
+        }
+        if isinstance(scene, ExperimentScene):
+            handlers[pygame.KEYDOWN] = self.response_key_down
+        return {
+            event_type: handlers[event_type]
+            for event_type in scene.event_types
+            if event_type in handlers
+        }
+
+    def quit(self, _: pygame.event.Event) -> QuitActionType | None:
+        """
+        Handles the window being closed, unless the results are being written.
+        Returns
+        -------
+        QuitActionType | None
+        """
+        return None if self.is_saving() else QuitActionType.QUIT
+
+    def mouse_motion(self, event: pygame.event.Event) -> QuitActionType | None:
+        """
+        Delegates mouse motion events to the active scene.
+        Returns
+        -------
+        QuitActionType | None
+        """
+        self.active_scene.mouse_motion(event.pos)
+        return None
+
+    def button_down(self, event: pygame.event.Event) -> QuitActionType | None:
+        """
+        Delegates left and right clicks to the active scene, marking it for
+        redrawing.
+        Returns
+        -------
+        QuitActionType | None
+        """
+        if event.button in (1, 3):
+            self.active_scene.button_down(event.button, event.pos)
+            self.active_scene.is_dirty = True
+        return None
+
+    def key_down(self, event: pygame.event.Event) -> QuitActionType | None:
+        """
+        Quits on escape and restarts on R from the finished scene, unless the
+        results are being written. Other keys are delegated to the active
+        scene, marking it for redrawing.
+        Returns
+        -------
+        QuitActionType | None
+        """
+        if event.key in (pygame.K_ESCAPE, pygame.K_r) and self.is_saving():
+            return None
+        if event.key == pygame.K_ESCAPE:
+            return QuitActionType.QUIT
+        if event.key == pygame.K_r and isinstance(self.active_scene, FinishedScene):
+            return QuitActionType.RESTART
+        self.active_scene.key_down(event.key)
+        self.active_scene.is_dirty = True
+        return None
+
+    def response_key_down(self, event: pygame.event.Event) -> QuitActionType | None:
+        """
+        Quits on escape, otherwise passes the key to the trial manager as a
+        response, timed from the event's arrival when it was timestamped. The
+        experiment scene tracks its own changes between frames.
+        Returns
+        -------
+        QuitActionType | None
+        """
+        if event.key == pygame.K_ESCAPE:
+            return QuitActionType.QUIT
+        self.trial_manager.key_down(getattr(event, "time", self.time), event.key)
+        self.active_scene.key_down(event.key)
+        return None
+
     def start_new_scene(self) -> None:
         """
         Replaces the active scene with the next.
-        Uses the class of the active scene to determine the next.
+        Uses the class of the active scene to determine the next. The frame
+        of the transition is excluded from frame timing, and the frame totals
+        of the scene are kept in scene_statistics.
         Returns
         -------
         None
         """
+        name = type(self.active_scene).__name__
+        self.scene_statistics[name] = self.frame_monitor.totals()
         if isinstance(self.active_scene, StartScene):
             self.active_scene = DetailsScene(self.active_scene.screen)
         elif isinstance(self.active_scene, DetailsScene):
@@ -96,5 +297,11 @@ class SceneManager:
             self.active_scene = ExperimentScene(self.active_scene.screen)
             self.trial_manager.start_experiment(self.time)
         elif isinstance(self.active_scene, ExperimentScene):
-            self.active_scene = FinishedScene(self.active_scene.screen)
             self.trial_manager.end_experiment(self.time)
+            self.active_scene = FinishedScene(
+                self.active_scene.screen,
+                self.trial_manager.dropped_frame_percent(),
+                self.trial_manager.save_future,
+            )
+        self.frame_monitor.reset()
+        self.frame_monitor.clear_totals()
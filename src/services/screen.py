@@ -1,16 +1,34 @@
+from collections.abc import Iterable
+from itertools import pairwise
+from statistics import median
+from time import perf_counter_ns
+
 import pygame
 
 from src.constants import (
     DISPLAY_HEIGHT,
+    DISPLAY_TIMING,
     DISPLAY_WIDTH,
+    FRAME_PACING,
+    FRAMERATE,
     IS_FULLSCREEN,
     POSITIONS,
+    REFRESH_RATE_RANGE,
+    REFRESH_RATE_SAMPLES,
     SCREEN_DIMENSIONS,
     STIMULUS_SCALE,
     TARGET_OFFSET,
     TARGET_SCALE,
     TEXT_TITLE,
 )
+from src.services.clock import NS_PER_MS
+from src.visuals import Element, Image, MultilineText, Text
+from src.visuals.tools import is_display_format
+
+# Flips timed before checking that they block, and the least time they take
+# if they do. Each blocking flip takes at least one refresh, 2 ms at 500 Hz.
+BLOCKING_CHECK_FLIPS = 5
+BLOCKING_CHECK_MS = 5
 
 
 def init_screen() -> pygame.Surface:
@@ -20,7 +38,12 @@ def init_screen() -> pygame.Surface:
         size = (0, 0)
         flags = pygame.FULLSCREEN
     pygame.display.set_caption(TEXT_TITLE)
-    screen = pygame.display.set_mode(size, flags)
+    # Flips only keep time with the display with vsync, so the refresh rate is
+    # measured on a vsync window whatever the pacing.
+    screen = init_vsync_display(size, flags)
+    refresh_rate = detect_refresh_rate()
+    if FRAME_PACING != "vsync":
+        screen = pygame.display.set_mode(size, flags)
     x, y = screen.get_size()
     SCREEN_DIMENSIONS.update(
         {
@@ -37,4 +60,103 @@ def init_screen() -> pygame.Surface:
             "right_target": (x + TARGET_OFFSET, y - scale_offset),
         }
     )
+    DISPLAY_TIMING.update(
+        {
+            "refresh_rate": refresh_rate or FRAMERATE,
+            "frame_period": 1000 / (refresh_rate or FRAMERATE),
+            "refresh_rate_measured": float(refresh_rate is not None),
+        }
+    )
     return screen
+
+
+def init_vsync_display(size: tuple[int, int], flags: int) -> pygame.Surface:
+    """
+    Creates the main window with vsync, so each display update blocks until
+    the next refresh. Falls back to a window without vsync if unsupported.
+
+    Parameters
+    ----------
+    size: tuple[int, int]
+        The size of the window, or (0, 0) for the desktop size.
+    flags: int
+        The pygame display flags.
+
+    Returns
+    -------
+    pygame.Surface
+    """
+    if size == (0, 0):
+        size = pygame.display.get_desktop_sizes()[0]
+    try:
+        return pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+    except pygame.error as e:
+        print(e)
+        return pygame.display.set_mode(size, flags)
+
+
+def detect_refresh_rate(samples: int = REFRESH_RATE_SAMPLES) -> float | None:
+    """
+    Measures the refresh rate of the display by timing a burst of display
+    flips, which block until the next refresh when vsync is in effect. The
+    rate cannot be measured when the flips do not block, e.g. without vsync
+    or with the SDL dummy video driver.
+
+    Parameters
+    ----------
+    samples: int, optional
+        The number of flips timed. Defaults to REFRESH_RATE_SAMPLES from
+        src.constants.
+
+    Returns
+    -------
+    float | None
+        The refresh rate in hertz, or None if it could not be measured.
+    """
+    pygame.display.flip()
+    times = [perf_counter_ns()]
+    for _ in range(samples):
+        pygame.display.flip()
+        times.append(perf_counter_ns())
+        # Flips returning at once are not synchronised with the display.
+        if (
+            len(times) == BLOCKING_CHECK_FLIPS + 1
+            and times[-1] - times[0] < BLOCKING_CHECK_MS * NS_PER_MS
+        ):
+            return None
+    period = median((b - a) / NS_PER_MS for a, b in pairwise(times))
+    rate = 1000 / period if period > 0 else 0.0
+    if not REFRESH_RATE_RANGE[0] <= rate <= REFRESH_RATE_RANGE[1]:
+        return None
+    return rate
+
+
+def check_display_format(elements: Iterable[Element]) -> list[Element]:
+    """
+    Flags elements holding a surface that has not been converted to the
+    display pixel format, and would therefore be converted on every blit.
+
+    Parameters
+    ----------
+    elements: Iterable[Element]
+        The elements to check.
+
+    Returns
+    -------
+    list[Element]
+        The elements holding an unconverted surface.
+    """
+    unconverted: list[Element] = []
+    for element in elements:
+        if isinstance(element, Image):
+            surfaces = [element.surface]
+        elif isinstance(element, Text):
+            surfaces = [element.render]
+        elif isinstance(element, MultilineText):
+            surfaces = [line.render for line in element._lines]
+        else:
+            continue
+        if not all(is_display_format(surface) for surface in surfaces):
+            print(f"Surface not in display format: {element.name or element}")
+            unconverted.append(element)
+    return unconverted
@@ -0,0 +1,320 @@
+"""
+Runs the whole experiment with a simulated participant and a virtual clock,
+so a session completes as fast as the CPU allows. The participant responds by
+posting the same pygame events as a keyboard and mouse, and the session is
+saved like any other, but in a separate directory so the experiment's data is
+left untouched.
+"""
+
+import random
+import tempfile
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pygame
+
+from src.components import Participant, Response, TargetLetter
+from src.constants import (
+    DISPLAY_TIMING,
+    MINIMUM_REST_TIME,
+    RESPONSE_KEYS,
+    TEXT_AGE,
+    TEXT_CONTINUE,
+    TEXT_CULTURE,
+    TEXT_GENDER,
+    TEXT_ID,
+)
+from src.gui import InputBox
+from src.scenes.details_scene import DetailsScene
+from src.scenes.experiment_scene import ExperimentScene
+from src.scenes.finished_scene import FinishedScene
+from src.scenes.scene import QuitActionType, Scene
+from src.scenes.start_scene import StartScene
+from src.services.clock import VirtualClock
+from src.services.event_source import (
+    EventSource,
+    PygameEventSource,
+    RecordingEventSource,
+    ScriptedEventSource,
+)
+from src.services.scene_manager import SceneManager
+
+# The first key code giving each Response.
+RESPONSE_KEY_CODES = {
+    Response[name]: key for key, name in reversed(RESPONSE_KEYS.items())
+}
+
+
+class SimulatedParticipant:
+    """
+    Completes the experiment by posting input events. Reaction times follow an
+    ex-Gaussian distribution, a normal distribution plus an exponential tail,
+    measured from the target onset.
+
+    Attributes
+    ----------
+    participant: Participant
+        The details entered on the details scene.
+    rt_mu: float
+        The mean of the normal component of reaction times in milliseconds.
+    rt_sigma: float
+        The standard deviation of the normal component in milliseconds.
+    rt_tau: float
+        The mean of the exponential component in milliseconds. 0 gives normally
+        distributed reaction times.
+    cueing_effect: float
+        The time in milliseconds added to reaction times on invalid trials.
+    accuracy: float
+        The probability of pressing the correct key.
+
+    Methods
+    -------
+    act(scene_manager: SceneManager, time: float) -> None
+        Posts the input events responding to the active scene.
+    reaction_time(is_valid: bool) -> float
+        Draws a reaction time.
+    """
+
+    def __init__(
+        self,
+        participant: Participant,
+        *,
+        rt_mu: float = 400.0,
+        rt_sigma: float = 40.0,
+        rt_tau: float = 100.0,
+        cueing_effect: float = 0.0,
+        accuracy: float = 0.95,
+        seed: int | None = None,
+    ) -> None:
+        self.participant = participant
+        self.rt_mu = rt_mu
+        self.rt_sigma = rt_sigma
+        self.rt_tau = rt_tau
+        self.cueing_effect = cueing_effect
+        self.accuracy = accuracy
+        self._random = random.Random(seed)
+        self._responded_scene: Scene | None = None
+        self._trial_number = -1
+        self._response_time: float | None = None
+        self._response_key = 0
+
+    def act(self, scene_manager: SceneManager, time: float) -> None:
+        """
+        Posts the input events responding to the active scene. Should be called
+        once per frame, before the events are processed.
+
+        Parameters
+        ----------
+        scene_manager: SceneManager
+            Runs the experiment.
+        time: float
+            The current time in milliseconds.
+
+        Returns
+        -------
+        None
+        """
+        scene = scene_manager.active_scene
+        if isinstance(scene, ExperimentScene):
+            self._respond_to_trial(scene_manager, time)
+            return
+        if scene is self._responded_scene:
+            return
+        self._responded_scene = scene
+        if isinstance(scene, StartScene):
+            self._click(scene, TEXT_CONTINUE)
+        elif isinstance(scene, DetailsScene):
+            self._enter_details(scene)
+        elif isinstance(scene, FinishedScene):
+            # Time is virtual, so the results can be waited for.
+            if scene.save:
+                scene.save.exception()
+            self._press(pygame.K_ESCAPE)
+
+    def reaction_time(self, is_valid: bool) -> float:
+        """
+        Draws a reaction time.
+
+        Parameters
+        ----------
+        is_valid: bool
+            Whether the stimulus gazed towards the target.
+
+        Returns
+        -------
+        float
+        """
+        rt = self._random.gauss(self.rt_mu, self.rt_sigma)
+        if self.rt_tau > 0:
+            rt += self._random.expovariate(1 / self.rt_tau)
+        if not is_valid:
+            rt += self.cueing_effect
+        return max(rt, 0.0)
+
+    def _respond_to_trial(self, scene_manager: SceneManager, time: float) -> None:
+        trial_manager = scene_manager.trial_manager
+        if trial_manager.is_resting:
+            if time >= trial_manager.time_rest_start + MINIMUM_REST_TIME:
+                self._press(pygame.K_SPACE)
+            return
+        trial = trial_manager.current_trial
+        if not trial:
+            return
+        if trial_manager.trial_number != self._trial_number:
+            if trial.time_target_onset is None:
+                return
+            self._trial_number = trial_manager.trial_number
+            self._response_time = trial.time_target_onset + self.reaction_time(
+                trial.gaze_validity
+            )
+            correct = (
+                Response.SPACE if trial.target.letter == TargetLetter.L else Response.H
+            )
+            incorrect = Response.H if correct == Response.SPACE else Response.SPACE
+            is_correct = self._random.random() < self.accuracy
+            self._response_key = RESPONSE_KEY_CODES[
+                correct if is_correct else incorrect
+            ]
+        if self._response_time is not None and time >= self._response_time:
+            self._press(self._response_key)
+            self._response_time = None
+
+    def _enter_details(self, scene: DetailsScene) -> None:
+        details = {
+            TEXT_ID: self.participant.id,
+            TEXT_AGE: self.participant.age,
+            TEXT_GENDER: self.participant.gender,
+            TEXT_CULTURE: self.participant.culture,
+        }
+        for interactable in scene.interactables:
+            if not isinstance(interactable, InputBox):
+                continue
+            self._click(scene, interactable.name)
+            for _ in interactable.text.string:
+                self._press(pygame.K_BACKSPACE)
+            for digit in str(details[interactable.name]):
+                self._press(pygame.key.key_code(digit))
+        self._click(scene, TEXT_CONTINUE)
+
+    def _click(self, scene: Scene, name: str) -> None:
+        for interactable in scene.interactables:
+            if interactable.name == name:
+                pygame.event.post(
+                    pygame.event.Event(
+                        pygame.MOUSEBUTTONDOWN, button=1, pos=interactable.rect.center
+                    )
+                )
+                return
+
+    def _press(self, key: int) -> None:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+
+@contextmanager
+def redirect_data_paths(data_path: Path | str) -> Iterator[Path]:
+    """
+    Saves sessions, trial logs, checkpoints and the participant index in
+    another directory while in the context.
+
+    Parameters
+    ----------
+    data_path: Path | str
+        The directory replacing DATA_PATH.
+
+    Yields
+    ------
+    Path
+        The directory.
+    """
+    data_path = Path(data_path)
+    with ExitStack() as stack:
+        for target, path in [
+            ("src.services.trial_manager.DATA_PATH", f"{data_path}/"),
+            ("src.services.trial_manager.TRIAL_LOG_PATH", f"{data_path}/logs/"),
+            ("src.services.checkpoint.CHECKPOINT_PATH", f"{data_path}/checkpoints/"),
+            ("src.services.participant_index.DATA_PATH", f"{data_path}/"),
+        ]:
+            stack.enter_context(patch(target, path))
+        yield data_path
+
+
+def simulate(
+    screen: pygame.Surface,
+    responder: SimulatedParticipant | None = None,
+    *,
+    trials: int | None = None,
+    recording: list[tuple[float, pygame.event.Event]] | None = None,
+    record_path: str | None = None,
+    trial_order: list[list[int]] | None = None,
+    data_path: Path | str | None = None,
+) -> SceneManager:
+    """
+    Runs the experiment from the start scene until it quits, advancing a
+    virtual clock by one frame period per frame. Input comes from a simulated
+    participant, a recorded session, or both. The session is saved in its own
+    directory, never with the experiment's data, so a replay cannot overwrite
+    or resume a real participant's session.
+
+    Parameters
+    ----------
+    screen: pygame.Surface
+        The main window. Use the SDL dummy video driver to run headless.
+    responder: SimulatedParticipant | None, optional
+        Completes the experiment by posting input events.
+    trials: int | None, optional
+        Limits the session to its first trials, for a shorter run.
+    recording: list[tuple[float, pygame.event.Event]] | None, optional
+        Timestamped events to replay instead of reading the pygame event
+        queue. The run stops once every event has been delivered.
+    record_path: str | None, optional
+        Records the input events to this file, for a later replay. The trial
+        order is written to the recording's header.
+    trial_order: list[list[int]] | None, optional
+        The trial order of a recorded session, from its header, restored
+        before the trials start.
+    data_path: Path | str | None, optional
+        Saves the session, its trial log, checkpoint and participant index in
+        this directory. Defaults to a temporary directory, removed once the
+        session has been saved.
+
+    Returns
+    -------
+    SceneManager
+        The finished experiment.
+    """
+    with ExitStack() as stack:
+        if data_path is None:
+            data_path = stack.enter_context(tempfile.TemporaryDirectory())
+        stack.enter_context(redirect_data_paths(data_path))
+        clock = VirtualClock()
+        script = (
+            ScriptedEventSource(recording, clock) if recording is not None else None
+        )
+        events: EventSource = script or PygameEventSource(clock)
+        recorder = None
+        if record_path:
+            events = recorder = RecordingEventSource(events, clock, record_path)
+        scene_manager = SceneManager(screen, clock, events)
+        trial_manager = scene_manager.trial_manager
+        if trial_order is not None:
+            trial_manager.restore_trial_order(trial_order)
+        if recorder:
+            recorder.write_header({"trials": trial_manager.trial_order()})
+        if trials is not None:
+            trial_manager.trials = trial_manager.trials[:trials]
+            trial_manager.trials_length = len(trial_manager.trials)
+        action = QuitActionType.CONTINUE
+        while action == QuitActionType.CONTINUE:
+            if responder:
+                responder.act(scene_manager, clock.now())
+            action = scene_manager.process_game_events()
+            scene_manager.record_flip()
+            clock.advance(DISPLAY_TIMING["frame_period"])
+            if script and script.is_finished():
+                break
+        events.close()
+        if trial_manager.save_future:
+            trial_manager.save_future.exception()
+        return scene_manager
@@ -0,0 +1,131 @@
+"""
+Defines the TrialLog class, an append-only record of completed trials written
+to disk while the session runs.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from src.constants import TRIAL_LOG_SYNC_INTERVAL
+
+
+class TrialLog:
+    """
+    An append-only JSON Lines file holding one record per completed trial.
+    Each record is written to the operating system as it is appended, so a
+    crash of the program loses none, and synced to disk with fsync every few
+    trials, so a crash of the computer loses at most the unsynced trials.
+
+    Attributes
+    ----------
+    path: Path
+        The location of the log file.
+    sync_interval: int
+        The number of records appended between each sync.
+
+    Methods
+    -------
+    append(record: dict[str, Any]) -> None
+        Appends a trial record to the log.
+    sync() -> None
+        Writes appended records to disk.
+    close() -> None
+        Syncs and closes the log.
+    read() -> list[dict[str, Any]]
+        Reads every complete record in the log.
+    """
+
+    def __init__(
+        self, path: Path | str, sync_interval: int = TRIAL_LOG_SYNC_INTERVAL
+    ) -> None:
+        self.path = Path(path)
+        self.sync_interval = sync_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._discard_partial_line()
+        self._fd: int | None = os.open(
+            self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        )
+        self._unsynced = 0
+
+    def _discard_partial_line(self) -> None:
+        # A crash can leave half a record at the end of an existing log, which
+        # new records would otherwise be appended onto.
+        if not self.path.exists():
+            return
+        with open(self.path, "rb+") as file:
+            content = file.read()
+            if content and not content.endswith(b"\n"):
+                file.truncate(content.rfind(b"\n") + 1)
+
+    def append(self, record: dict[str, Any]) -> None:
+        """
+        Appends a trial record to the log, syncing once sync_interval records
+        have been appended since the last sync.
+
+        Parameters
+        ----------
+        record: dict[str, Any]
+            The trial record. Values must be serialisable to JSON.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the log has been closed.
+        """
+        if self._fd is None:
+            raise ValueError("The trial log is closed")
+        os.write(self._fd, (json.dumps(record) + "\n").encode("utf-8"))
+        self._unsynced += 1
+        if self._unsynced >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """
+        Writes appended records to disk.
+
+        Returns
+        -------
+        None
+        """
+        if self._fd is None:
+            return
+        os.fsync(self._fd)
+        self._unsynced = 0
+
+    def close(self) -> None:
+        """
+        Syncs and closes the log.
+
+        Returns
+        -------
+        None
+        """
+        if self._fd is None:
+            return
+        self.sync()
+        os.close(self._fd)
+        self._fd = None
+
+    def read(self) -> list[dict[str, Any]]:
+        """
+        Reads every complete record in the log. A partially written final line,
+        left by a crash, is ignored.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+        """
+        records = []
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+        return records
@@ -1,7 +1,11 @@
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 import pygame
-from pandas import DataFrame, ExcelWriter
+from pandas import DataFrame
 
 from src.components import (
     GazeValidity,
@@ -15,18 +19,50 @@ from src.components import (
     generate_trials,
     init_stimuli,
     init_targets,
+    stimuli,
+    targets,
 )
 from src.constants import (
     COUNTERBALANCING_ASCENDING,
+    DATA_PATH,
+    DISPLAY_TIMING,
     FIRST_TRIAL_DELAY,
     INTER_TRIAL_INTERVAL,
     MAX_RESPONSE_TIME,
     MINIMUM_REST_TIME,
+    RESPONSE_KEYS,
     TRIAL_DEBUGGING,
+    TRIAL_LOG_PATH,
 )
+from src.services import (
+    checkpoint,
+    garbage_collection,
+    output_writer,
+    participant_index,
+)
+from src.services.frame_monitor import dropped_frames
+from src.services.frame_scheduler import to_frames, to_ms
+from src.services.screen import check_display_format
+from src.services.trial_log import TrialLog
 from src.visuals import MultilineText, fonts
 from src.visuals.element import Element
 
+# The Response given by each key code.
+RESPONSES = {key: Response[name] for key, name in RESPONSE_KEYS.items()}
+
+# Trial fields restored from the trial log when a session is resumed.
+RESUMED_FIELDS = [
+    "reaction_time",
+    "time_trial_start",
+    "time_draw_stimulus",
+    "time_draw_target",
+    "time_response",
+    "time_stimulus_onset",
+    "time_target_onset",
+    "frames_dropped",
+    "max_frame_ms",
+]
+
 
 class TrialManager:
     participant: Participant
@@ -34,38 +70,99 @@ class TrialManager:
     trials_length: int
     trial_number: int
     current_trial: Trial | None = None
-    time_trial_start: int = 0
-    time_draw_stimulus: int = 0
-    time_draw_target: int = 0
-    experiment_start_time: int = 0
-    experiment_end_time: int = 0
+    trial_log: TrialLog | None = None
+    save_future: Future[None] | None = None
+    time_trial_start: float = 0
+    time_draw_stimulus: float = 0
+    time_draw_target: float = 0
+    frame: int = 0
+    frame_trial_start: int = 0
+    frame_draw_stimulus: int = 0
+    frame_draw_target: int = 0
+    experiment_start_time: float = 0
+    experiment_end_time: float = 0
     has_experiment_started: bool = False
     has_experiment_finished: bool = False
     is_resting: bool = False
-    time_rest_start: int = 0
+    time_rest_start: float = 0
+    is_stimulus_drawn: bool = False
+    is_target_drawn: bool = False
 
     def __init__(self) -> None:
         init_stimuli()
         init_targets()
+        check_display_format(
+            [stimulus.image for stimulus in stimuli]
+            + [target.image for target in targets]
+        )
         self.trials = generate_trials()
         self.trials_length = len(self.trials)
         self.trial_number = -1
+        garbage_collection.track_collections(self.current_phase)
+        garbage_collection.freeze()
+        self.inter_trial_frames = to_frames(INTER_TRIAL_INTERVAL)
+        self.max_response_frames = to_frames(MAX_RESPONSE_TIME)
 
-    def start_experiment(self, time: int) -> None:
+    def start_experiment(self, time: float) -> None:
         pygame.mouse.set_visible(False)
+        garbage_collection.clear_log()
+        garbage_collection.pause()
         self.has_experiment_started = True
         self.experiment_start_time = time
-        self.start_trial(time + FIRST_TRIAL_DELAY)
+        if not self.resume_session():
+            self.trial_log = TrialLog(
+                Path(TRIAL_LOG_PATH)
+                / f"{self.participant.id}_{datetime.now():%Y%m%d-%H%M%S}.jsonl"
+            )
+            checkpoint.save(self.participant, self.trials, self.trial_log.path)
+        delay = to_frames(FIRST_TRIAL_DELAY)
+        self.start_trial(time + to_ms(delay), delay)
 
-    def end_experiment(self, time: int) -> None:
-        if not self.has_experiment_started:
+    def end_experiment(self, time: float) -> None:
+        if not self.has_experiment_started or self.has_experiment_finished:
             return
         pygame.mouse.set_visible(True)
+        garbage_collection.resume()
         self.has_experiment_finished = True
         self.experiment_end_time = time
-        self.save_data()
+        if self.trial_log:
+            self.trial_log.close()
+        self.save_future = self.save_data()
+
+    def resume_session(self) -> bool:
+        # Continues an unfinished session for the participant, with the same
+        # trial order, after the last trial recorded in its log.
+        saved = checkpoint.load(self.participant.id)
+        if not saved or not os.path.exists(saved["log_path"]):
+            return False
+        trials = checkpoint.restore_order(saved["trials"], self.trials)
+        if trials is None:
+            return False
+        self.trials = trials
+        self.trial_log = TrialLog(saved["log_path"])
+        records = self.trial_log.read()
+        for record in records:
+            trial = self.trials[record["trial_number"] - 1]
+            for field in RESUMED_FIELDS:
+                setattr(trial, field, record[field])
+            trial.response = Response(record["response"])
+        self.trial_number = len(records) - 1
+        print(f"Resuming participant {self.participant.id} at trial {len(records) + 1}")
+        return True
+
+    def trial_order(self) -> list[list[int]]:
+        # Identifies the trials in presentation order, to restore it later.
+        return [checkpoint.trial_key(trial) for trial in self.trials]
 
-    def start_trial(self, time: int) -> None:
+    def restore_trial_order(self, keys: list[list[int]]) -> None:
+        # Must be called before the experiment starts, e.g. to replay a session.
+        trials = checkpoint.restore_order(keys, self.trials)
+        if trials is None:
+            raise ValueError("The trial order does not match the generated trials")
+        self.trials = trials
+
+    def start_trial(self, time: float, frame_delay: int = 0) -> None:
+        # Phases are triggered by frame count, self.frame being the next frame.
         if self.is_resting and time < self.time_rest_start + MINIMUM_REST_TIME:
             return
         # if next trial is the middle trial, begin rest if not already resting.
@@ -75,6 +172,9 @@ class TrialManager:
             else:
                 self.is_resting = True
                 self.time_rest_start = time
+                garbage_collection.collect()
+                if self.trial_log:
+                    self.trial_log.sync()
                 return
 
         self.trial_number += 1
@@ -82,61 +182,162 @@ class TrialManager:
             self.end_experiment(time)
             return
         self.current_trial = self.trials[self.trial_number]
-        soa = self.current_trial.stimulus_onset_async
+        soa_frames = to_frames(self.current_trial.stimulus_onset_async)
+        self.frame_trial_start = self.frame + frame_delay
+        self.frame_draw_stimulus = self.frame_trial_start + self.inter_trial_frames
+        self.frame_draw_target = self.frame_draw_stimulus + soa_frames
         self.time_trial_start = time
-        self.time_draw_stimulus = time + INTER_TRIAL_INTERVAL
-        self.time_draw_target = time + INTER_TRIAL_INTERVAL + soa
+        self.time_draw_stimulus = time + to_ms(self.inter_trial_frames)
+        self.time_draw_target = self.time_draw_stimulus + to_ms(soa_frames)
+        garbage_collection.collect()
+        self.current_trial.time_trial_start = self.time_trial_start
+        self.current_trial.time_draw_stimulus = self.time_draw_stimulus
+        self.current_trial.time_draw_target = self.time_draw_target
+
+    def during_trial(self, time: float) -> list[Element]:
+        elements = self.frame_elements(time)
+        self.frame += 1
+        return elements
 
-    def during_trial(self, time: int) -> list[Element]:
+    def frame_elements(self, time: float) -> list[Element]:
         elements: list[Element] = []
+        self.is_stimulus_drawn = False
+        self.is_target_drawn = False
         if self.is_resting:
             return elements
-        if time - self.time_draw_target >= MAX_RESPONSE_TIME:
+        if self.frame - self.frame_draw_target >= self.max_response_frames:
             self.end_trial(time, Response.NONE)
             return elements
         trial = self.trials[self.trial_number]
         if TRIAL_DEBUGGING:
             elements.append(self.trial_debugging())
-        if time >= self.time_draw_stimulus:
+        if self.frame >= self.frame_draw_stimulus:
             elements.append(trial.stimulus.image)
-        if time >= self.time_draw_target:
+            self.is_stimulus_drawn = True
+        if self.frame >= self.frame_draw_target:
             elements.append(trial.target.image)
+            self.is_target_drawn = True
         return elements
 
-    def end_trial(self, time: int, response: Response) -> None:
+    def record_flip(self, time: float, duration: float | None = None) -> None:
+        # time is when the frame drawn by during_trial reached the display.
+        trial = self.current_trial
+        if not trial or self.is_resting:
+            return
+        # Only frames from stimulus onset until the response or timeout are
+        # timing critical, so only they mark the trial as dropping frames.
+        if duration is not None and self.is_stimulus_drawn:
+            trial.frames_dropped += dropped_frames(duration)
+            trial.max_frame_ms = max(trial.max_frame_ms, duration)
+        if self.is_stimulus_drawn and trial.time_stimulus_onset is None:
+            trial.time_stimulus_onset = time
+        if self.is_target_drawn and trial.time_target_onset is None:
+            trial.time_target_onset = time
+
+    def current_phase(self) -> str:
+        if not self.has_experiment_started:
+            return "setup"
+        if self.has_experiment_finished:
+            return "finished"
+        if self.is_resting:
+            return "rest"
+        if self.frame > self.frame_draw_target:
+            return "target"
+        if self.frame > self.frame_draw_stimulus:
+            return "stimulus"
+        return "inter_trial_interval"
+
+    def dropped_frame_percent(self) -> float:
+        completed = self.trials[: min(self.trial_number + 1, self.trials_length)]
+        if not completed:
+            return 0.0
+        dropped = [trial for trial in completed if trial.frames_dropped]
+        return len(dropped) / len(completed) * 100
+
+    def trial_phases(self) -> list[list[Element]]:
+        if not self.current_trial:
+            return []
+        stimulus = self.current_trial.stimulus.image
+        target = self.current_trial.target.image
+        return [[], [stimulus], [stimulus, target]]
+
+    def target_onset(self) -> float:
+        # The target's measured onset once its flip is recorded, as a late flip
+        # would otherwise be counted in the reaction time.
+        if self.current_trial and self.current_trial.time_target_onset is not None:
+            return self.current_trial.time_target_onset
+        return self.time_draw_target
+
+    def end_trial(self, time: float, response: Response) -> None:
         if not self.current_trial:
             return
         self.current_trial.response = response
-        self.current_trial.reaction_time = time - self.time_draw_target
+        self.current_trial.time_response = time
+        self.current_trial.reaction_time = time - self.target_onset()
+        if self.trial_log:
+            self.trial_log.append(self.trial_record(self.trial_number))
         self.start_trial(time)
 
-    def key_down(self, time: int, key: int) -> None:
+    def key_down(self, time: float, key: int) -> None:
         if self.is_resting:
             if time < self.time_rest_start + MINIMUM_REST_TIME:
                 return
             else:
                 self.start_trial(time)
                 return
-        if time < self.time_draw_target:
+        # Timestamped presses can arrive a frame after they were made.
+        if self.frame <= self.frame_draw_target or time < self.target_onset():
             return
-        name = pygame.key.name(key)
-        if name not in ["space", "h"]:
+        response = RESPONSES.get(key)
+        if response is None:
             return
-        response = Response.SPACE if name == "space" else Response.H
         self.end_trial(time, response)
 
-    def save_data(self) -> None:
-        if not self.has_experiment_finished:
-            return
+    def trial_record(self, trial_number: int) -> dict[str, Any]:
+        record: dict[str, Any] = {"trial_number": trial_number + 1}
+        record.update((k, v) for k, v in self.trials[trial_number] if "image" not in k)
+        record.update(self.participant)
+        record["counterbalancing"] = int(COUNTERBALANCING_ASCENDING)
+        return record
 
-        df_trial_data = DataFrame(
-            [{k: v for k, v in trial if "image" not in k} for trial in self.trials]
+    def save_data(self) -> Future[None] | None:
+        # The workbook is written by a background thread so the display is not
+        # frozen. Everything it needs is gathered here, on the main thread.
+        if not self.has_experiment_finished or not self.trial_log:
+            return None
+        completed = self.trials[: min(self.trial_number + 1, self.trials_length)]
+        frame_timing = {
+            "refresh_rate": DISPLAY_TIMING["refresh_rate"],
+            "frame_period": DISPLAY_TIMING["frame_period"],
+            "refresh_rate_measured": DISPLAY_TIMING["refresh_rate_measured"],
+            "trials_with_dropped_frames_percent": self.dropped_frame_percent(),
+            "frames_dropped": sum(trial.frames_dropped for trial in completed),
+            "max_frame_ms": max([trial.max_frame_ms for trial in completed], default=0),
+        }
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(
+            self.write_results,
+            f"{DATA_PATH}{self.participant.id}",
+            self.trial_log.read(),
+            frame_timing,
+            garbage_collection.collection_log(),
         )
-        for k, v in self.participant:
-            df_trial_data[k] = v
-        df_trial_data["counterbalancing"] = int(COUNTERBALANCING_ASCENDING)
-        df_trial_data.index.name = "trial_number"
-        df_trial_data.index += 1
+        executor.shutdown(wait=False)
+        return future
+
+    def write_results(
+        self,
+        stem: str,
+        records: list[dict[str, Any]],
+        frame_timing: dict[str, float],
+        collections: list[dict[str, float | int | str]],
+    ) -> None:
+        # The results are built from the trial log written during the session.
+        df_trial_data = output_writer.with_dtypes(
+            DataFrame(records), output_writer.TRIAL_DATA_DTYPES
+        )
+        if not df_trial_data.empty:
+            df_trial_data = df_trial_data.set_index("trial_number")
 
         variables = [
             StimulusSpecies,
@@ -151,17 +352,27 @@ class TrialManager:
             {
                 variable.__name__: {level.name: level.value for level in variable}
                 for variable in variables
-            }
+            },
+            dtype="Int64",
         )
+        df_variable_levels.index.name = "level"
 
-        if not os.path.exists("data/"):
-            os.mkdir("data/")
+        df_frame_timing = DataFrame({"value": frame_timing}, dtype="float64")
+        df_frame_timing.index.name = "measure"
 
-        with ExcelWriter(f"data/{self.participant.id}.xlsx") as writer:
-            df_trial_data.to_excel(writer, sheet_name="trial_data")
-            df_variable_levels.to_excel(writer, sheet_name="variable_levels")
-
-        # print(df.index)
+        index = participant_index.load()
+        output_writer.write_tables(
+            stem,
+            {
+                "trial_data": df_trial_data,
+                "variable_levels": df_variable_levels,
+                "frame_timing": df_frame_timing,
+                "garbage_collection": DataFrame(collections),
+            },
+        )
+        participant_index.record_session(self.participant.id, index)
+        # Only now can the session no longer be rebuilt from its checkpoint.
+        checkpoint.clear(self.participant.id)
 
     def trial_debugging(self) -> MultilineText:
         string = ""
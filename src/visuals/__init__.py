@@ -7,6 +7,8 @@ Element
     Base class for all visual and GUI elements.
 FixationCross
     Class for creating and displaying a fixation cross.
+FrameComposer
+    Class for pre-composing complete frames from elements.
 Image
     Class for handling and displaying images.
 MultilineText
@@ -28,6 +30,7 @@ init_fonts() -> None
 from .element import Element
 from .fixation_cross import FixationCross
 from .fonts import fonts, init_fonts
+from .frame_composer import FrameComposer
 from .image import Image
 from .multiline_text import MultilineText
 from .text import Text
@@ -35,6 +38,7 @@ from .text import Text
 __all__ = [
     "Element",
     "FixationCross",
+    "FrameComposer",
     "Image",
     "MultilineText",
     "Text",
@@ -0,0 +1,142 @@
+"""
+This module defines the FrameComposer class, which pre-composes complete
+frames from visual elements so that presenting a frame is a single blit.
+Frames are composed one at a time, so the work can be spread over several
+display frames.
+"""
+
+import pygame
+
+from src.constants import BG_GREY
+
+from .element import Element
+from .tools import convert_surface
+
+
+class FrameComposer:
+    """
+    A class holding pre-composed, full-screen frames. Each frame is built
+    from a list of elements drawn in order over a background colour.
+
+    Attributes
+    ----------
+    size : tuple[int, int]
+        The width and height of the composed frames.
+    background_colour : pygame.Color
+        The colour filling each frame before the elements are drawn.
+
+    Methods
+    -------
+    prepare(frames: list[list[Element]]) -> None
+        Queues the given frames, replacing any previously prepared frames.
+    compose_next() -> bool
+        Composes the next queued frame.
+    get(elements: list[Element]) -> pygame.Surface | None
+        Gets the prepared frame composed from the given elements.
+    compose(elements: list[Element], frame: pygame.Surface | None) -> pygame.Surface
+        Draws the given elements onto a frame.
+    """
+
+    def __init__(
+        self, size: tuple[int, int], background_colour: pygame.Color = BG_GREY
+    ) -> None:
+        """
+        Initialises a new instance of the FrameComposer class.
+
+        Parameters
+        ----------
+        size : tuple[int, int]
+            The width and height of the composed frames.
+        background_colour : pygame.Color, optional
+            The colour filling each frame before the elements are drawn.
+            Defaults to BG_GREY from src.constants.
+        """
+        self.size = size
+        self.background_colour = background_colour
+        self._frames: dict[tuple[int, ...], pygame.Surface] = {}
+        self._queued: list[list[Element]] = []
+        self._spare: list[pygame.Surface] = []
+
+    @staticmethod
+    def _key(elements: list[Element]) -> tuple[int, ...]:
+        return tuple(id(element) for element in elements)
+
+    def prepare(self, frames: list[list[Element]]) -> None:
+        """
+        Queues the given frames to be composed by compose_next(), replacing
+        any previously prepared frames. Frames already composed from the same
+        elements are kept, and the surfaces of the others are reused.
+
+        Parameters
+        ----------
+        frames : list[list[Element]]
+            The elements of each frame, in drawing order.
+
+        Returns
+        -------
+        None
+        """
+        keys = {self._key(elements) for elements in frames}
+        for key in [key for key in self._frames if key not in keys]:
+            self._spare.append(self._frames.pop(key))
+        self._queued = [
+            elements for elements in frames if self._key(elements) not in self._frames
+        ]
+
+    def compose_next(self) -> bool:
+        """
+        Composes the next queued frame, making it available from get().
+
+        Returns
+        -------
+        bool
+            Whether a frame was composed, False once the queue is empty.
+        """
+        if not self._queued:
+            return False
+        elements = self._queued.pop(0)
+        frame = self._spare.pop() if self._spare else None
+        self._frames[self._key(elements)] = self.compose(elements, frame)
+        return True
+
+    def get(self, elements: list[Element]) -> pygame.Surface | None:
+        """
+        Gets the prepared frame composed from the given elements.
+
+        Parameters
+        ----------
+        elements : list[Element]
+            The elements of the frame, in drawing order.
+
+        Returns
+        -------
+        pygame.Surface | None
+            The composed frame, or None if it has not been prepared.
+        """
+        return self._frames.get(self._key(elements))
+
+    def compose(
+        self, elements: list[Element], frame: pygame.Surface | None = None
+    ) -> pygame.Surface:
+        """
+        Draws the given elements onto a frame.
+
+        Parameters
+        ----------
+        elements : list[Element]
+            The elements of the frame, in drawing order.
+        frame : pygame.Surface | None, optional
+            A surface to draw over, such as a frame no longer needed. Defaults
+            to a new surface.
+
+        Returns
+        -------
+        pygame.Surface
+            The composed frame, in the display pixel format.
+        """
+        if frame is None:
+            frame = convert_surface(pygame.Surface(self.size))
+        frame.fill(self.background_colour)
+        for element in elements:
+            element.draw(frame)
+        return frame
@@ -6,6 +6,7 @@ at a specific position when enabled.
 import pygame
 
 from .element import Element
+from .tools import convert_surface
 
 
 def load_image(path: str) -> pygame.Surface:
@@ -59,7 +60,8 @@ class Image(Element):
         ----------
         surface: pygame.Surface | str
             The pygame object representing the image, or a path to an
-            image file.
+            image file. Converted to the display pixel format once the
+            display has been initialised.
         position : tuple[int, int], optional
             The x, y coordinates of the element. Defaults to (0, 0).
         size : tuple[int, int], optional
@@ -74,6 +76,7 @@ class Image(Element):
         if isinstance(surface, str):
             surface = load_image(surface)
 
+        surface = convert_surface(surface)
         self._original_surface = surface
         if size == (0, 0):
             size = surface.get_size()
@@ -98,6 +101,7 @@ class Image(Element):
         if isinstance(surface, str):
             surface = load_image(surface)
 
+        surface = convert_surface(surface)
         self._original_surface = surface
         self._surface = pygame.transform.scale(surface, self.size)
 
@@ -7,6 +7,7 @@ import pygame
 from src.constants import BLACK
 
 from .element import Element
+from .tools import convert_surface
 
 
 class Text(Element):
@@ -163,7 +164,9 @@ class Text(Element):
         -------
         None
         """
-        self.render = self.font.render(self.string, True, self.text_colour)
+        self.render = convert_surface(
+            self.font.render(self.string, True, self.text_colour)
+        )
         rect = self.render.get_rect()
         rect.center = self.position
         self._rect = rect
@@ -1,5 +1,6 @@
 """
-Defines visual utility functions, including a display for framerate.
+Defines visual utility functions, including a display for framerate and
+conversion of surfaces to the display pixel format.
 """
 
 import pygame
@@ -9,7 +10,7 @@ from src.constants import BLACK
 
 def show_fps(
     surface: pygame.Surface, clock: pygame.time.Clock, font: pygame.font.Font
-) -> None:
+) -> pygame.Rect:
     """
     Displays the application's framerate in the top left corner.
 
@@ -24,7 +25,55 @@ def show_fps(
 
     Returns
     -------
-    None
+    pygame.Rect
+        The area covered by the framerate.
     """
     fps_text = font.render(f"FPS: {clock.get_fps():.0f}", True, BLACK)
-    surface.blit(fps_text, (5, 5))
+    return surface.blit(fps_text, (5, 5))
+
+
+def convert_surface(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a surface to the pixel format of the display, so blitting it does
+    not require a per-pixel conversion each frame. Surfaces with per-pixel alpha
+    keep their alpha channel. Returns the surface unchanged if the display has
+    not been initialised.
+
+    Parameters
+    ----------
+    surface: pygame.Surface
+        The surface to convert.
+
+    Returns
+    -------
+    pygame.Surface
+    """
+    if pygame.display.get_surface() is None or is_display_format(surface):
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def is_display_format(surface: pygame.Surface) -> bool:
+    """
+    Checks whether a surface shares the pixel format of the display.
+
+    Parameters
+    ----------
+    surface: pygame.Surface
+        The surface to check.
+
+    Returns
+    -------
+    bool
+        True if the surface can be blitted to the display without conversion,
+        or if the display has not been initialised.
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return True
+    return (
+        surface.get_bitsize() == display.get_bitsize()
+        and surface.get_masks()[:3] == display.get_masks()[:3]
+    )
@@ -0,0 +1,91 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pandas import DataFrame
+
+from src.analysis import aggregation
+from src.services import output_writer
+
+
+def session_tables(participant_id: int, response: int = 1) -> dict[str, DataFrame]:
+    trial_data = DataFrame(
+        {
+            "trial_number": [1, 2],
+            "stimulus_species": [1, 2],
+            "stimulus_gaze_direction": [1, 2],
+            "target_letter": [1, 2],
+            "target_location": [2, 1],
+            "response": [response, 0],
+            "reaction_time": [412.5, None],
+            "participant_id": [participant_id, participant_id],
+        }
+    ).set_index("trial_number")
+    variable_levels = DataFrame(
+        {
+            variable.__name__: {level.name: level.value for level in variable}
+            for variable in aggregation.VARIABLE_COLUMNS.values()
+        },
+        dtype="Int64",
+    )
+    variable_levels.index.name = "level"
+    return {"trial_data": trial_data, "variable_levels": variable_levels}
+
+
+class TestAggregation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.directory.name) / "data"
+        self.cache_path = str(Path(self.directory.name) / "cache")
+        output_writer.write_tables(self.data_path / "1", session_tables(1), ["xlsx"])
+        output_writer.write_tables(
+            self.data_path / "2", session_tables(2), ["xlsx", "csv"]
+        )
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def aggregate(self) -> DataFrame:
+        return aggregation.aggregate(str(self.data_path), 2, self.cache_path)
+
+    def test_find_sessions(self) -> None:
+        sessions = aggregation.find_sessions(str(self.data_path))
+        self.assertEqual(list(sessions), [1, 2])
+        self.assertEqual(sessions[1].name, "1.xlsx")
+        self.assertEqual(sessions[2].name, "2_trial_data.csv")
+
+    def test_aggregate(self) -> None:
+        trials = self.aggregate()
+        self.assertEqual(len(trials), 4)
+        self.assertEqual(list(trials["participant_id"]), [1, 1, 2, 2])
+        self.assertEqual(list(trials["trial_number"]), [1, 2, 1, 2])
+        self.assertEqual(trials["reaction_time"].dtype, "Float64")
+
+    def test_invalid_session_skipped(self) -> None:
+        output_writer.write_tables(
+            self.data_path / "3", session_tables(3, response=9), ["xlsx"]
+        )
+        self.assertEqual(set(self.aggregate()["participant_id"]), {1, 2})
+
+    def test_corrupt_session_skipped(self) -> None:
+        (self.data_path / "5.xlsx").write_bytes(b"PK\x03\x04 truncated")
+        with self.assertLogs(aggregation.logger, "WARNING") as logs:
+            self.assertEqual(set(self.aggregate()["participant_id"]), {1, 2})
+        self.assertIn("5.xlsx", logs.output[0])
+
+    def test_cached_sessions_not_parsed(self) -> None:
+        self.aggregate()
+        self.assertEqual(len(list(Path(self.cache_path).glob("*.pkl"))), 2)
+        output_writer.write_tables(self.data_path / "4", session_tables(4), ["xlsx"])
+        trials = self.aggregate()
+        self.assertEqual(set(trials["participant_id"]), {1, 2, 4})
+        self.assertEqual(len(list(Path(self.cache_path).glob("*.pkl"))), 3)
+
+    def test_write_dataset(self) -> None:
+        path = aggregation.write_dataset(self.aggregate(), self.directory.name)
+        self.assertTrue(path.exists())
+        self.assertEqual(path.stem, "group_trials")
+
+
+if __name__ == "__main__":
+    unittest.main()
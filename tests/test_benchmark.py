@@ -0,0 +1,28 @@
+import unittest
+
+from benchmark import run, visuals_benchmarks
+from tests.tools import minimal_setup
+
+
+class TestBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestBenchmark, cls).setUpClass()
+        cls.screen = minimal_setup()
+
+    def test_benchmarks_run(self) -> None:
+        benchmarks = visuals_benchmarks(self.screen)
+        self.assertIn("ExperimentScene.display[prepared]", benchmarks)
+        self.assertIn("MultilineText.set_rect", benchmarks)
+        for benchmark in benchmarks.values():
+            benchmark()
+
+    def test_run(self) -> None:
+        result = run(lambda: None, repeat=2, min_time=0.001)
+        self.assertGreater(result["number"], 1)
+        self.assertLessEqual(result["min_us"], result["median_us"])
+        self.assertLessEqual(result["median_us"], result["max_us"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from pathlib import Path
+
+from src.components import Participant, generate_trials, init_stimuli, init_targets
+from src.services import checkpoint
+from tests.tools import minimal_setup, patch_data_paths
+
+
+class TestCheckpoint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestCheckpoint, cls).setUpClass()
+        cls.screen = minimal_setup()
+        init_stimuli()
+        init_targets()
+
+    def setUp(self) -> None:
+        patch_data_paths(self)
+        self.participant = Participant(999, 1, 1, 1)
+        self.trials = generate_trials()
+
+    def test_trial_keys_unique(self) -> None:
+        keys = {tuple(checkpoint.trial_key(trial)) for trial in self.trials}
+        self.assertEqual(len(keys), len(self.trials))
+
+    def test_save_and_load(self) -> None:
+        checkpoint.save(self.participant, self.trials, Path("log.jsonl"))
+        saved = checkpoint.load(self.participant.id)
+        self.assertEqual(saved["log_path"], "log.jsonl")
+        self.assertEqual(saved["participant"]["participant_id"], 999)
+        self.assertEqual(len(saved["trials"]), len(self.trials))
+
+    def test_load_missing(self) -> None:
+        self.assertIsNone(checkpoint.load(self.participant.id))
+
+    def test_restore_order(self) -> None:
+        keys = [checkpoint.trial_key(trial) for trial in reversed(self.trials)]
+        restored = checkpoint.restore_order(keys, self.trials)
+        self.assertEqual(restored, list(reversed(self.trials)))
+
+    def test_restore_order_mismatch(self) -> None:
+        keys = [checkpoint.trial_key(trial) for trial in self.trials]
+        self.assertIsNone(checkpoint.restore_order(keys[:-1], self.trials))
+        keys[0] = [0, 0, 0, 0, 0, 0]
+        self.assertIsNone(checkpoint.restore_order(keys, self.trials))
+
+    def test_clear(self) -> None:
+        checkpoint.save(self.participant, self.trials, Path("log.jsonl"))
+        checkpoint.clear(self.participant.id)
+        self.assertIsNone(checkpoint.load(self.participant.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from time import perf_counter_ns
+
+from src.services.clock import Clock, VirtualClock
+
+
+class TestClock(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = Clock()
+
+    def test_now_is_monotonic(self) -> None:
+        times = [self.clock.now() for _ in range(100)]
+        self.assertEqual(times, sorted(times))
+        self.assertGreaterEqual(times[0], 0)
+
+    def test_now_is_float_milliseconds(self) -> None:
+        self.assertIsInstance(self.clock.now(), float)
+
+    def test_to_ms(self) -> None:
+        ns = perf_counter_ns()
+        self.assertAlmostEqual(
+            self.clock.to_ms(ns + 1_500_000) - self.clock.to_ms(ns), 1.5
+        )
+
+
+class TestVirtualClock(unittest.TestCase):
+    def test_advance(self) -> None:
+        clock = VirtualClock()
+        self.assertEqual(clock.now(), 0.0)
+        clock.advance(6.25)
+        clock.advance(6.25)
+        self.assertEqual(clock.now(), 12.5)
+        self.assertEqual(clock.to_ms(1_500_000), 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+from pandas import DataFrame
+
+from src.analysis import cueing_effect
+from src.components.stimulus import StimulusSpecies
+
+
+def make_trials(participants: int, effect: float = 20.0) -> DataFrame:
+    # Every participant responds correctly in 400 ms on valid trials and
+    # 400 + effect ms on invalid trials, with a little noise.
+    rng = np.random.default_rng(0)
+    rows = participants * 2 * 3 * 2 * 10
+    trials = DataFrame(
+        {
+            "participant_id": np.repeat(
+                np.arange(1, participants + 1), rows // participants
+            ),
+            "stimulus_species": np.tile(np.repeat([1, 2], 60), participants),
+            "stimulus_onset_async": np.tile(
+                np.repeat([100, 300, 700], 20), 2 * participants
+            ),
+            "gaze_validity": np.tile(np.repeat([1, 0], 10), 6 * participants),
+            "response_accuracy": 1,
+        }
+    )
+    trials["reaction_time"] = (
+        400 + (1 - trials["gaze_validity"]) * effect + rng.normal(0, 1, rows)
+    )
+    return trials
+
+
+class TestCueingEffect(unittest.TestCase):
+    def test_trim(self) -> None:
+        trials = make_trials(1)
+        trials.loc[0, "response_accuracy"] = 0
+        trials.loc[1, "reaction_time"] = 50
+        trials.loc[2, "reaction_time"] = np.nan
+        trials.loc[15, "reaction_time"] = 900
+        trimmed = cueing_effect.trim(trials)
+        self.assertEqual(len(trimmed), len(trials) - 4)
+        self.assertTrue(set(trimmed.index).isdisjoint({0, 1, 2, 15}))
+        untrimmed = cueing_effect.trim(trials, sd=None)
+        self.assertIn(15, untrimmed.index)
+
+    def test_participant_effects(self) -> None:
+        effects = cueing_effect.participant_effects(make_trials(3))
+        self.assertEqual(len(effects), 3 * 2 * 3)
+        np.testing.assert_allclose(effects["cueing_effect"], 20, atol=2)
+        np.testing.assert_allclose(
+            effects["cueing_effect"], effects["invalid_rt"] - effects["valid_rt"]
+        )
+
+    def test_group_effects(self) -> None:
+        participants = 20
+        effects = cueing_effect.participant_effects(make_trials(participants))
+        group = cueing_effect.group_effects(effects, samples=1200, workers=1, seed=1)
+        self.assertEqual(len(group), 6)
+        self.assertTrue((group["participants"] == participants).all())
+        self.assertTrue((group["ci_lower"] <= group["cueing_effect"]).all())
+        self.assertTrue((group["cueing_effect"] <= group["ci_upper"]).all())
+        np.testing.assert_allclose(group["cueing_effect"], 20, atol=1)
+
+    def test_parallel_bootstrap_reproducible(self) -> None:
+        effects = cueing_effect.participant_effects(make_trials(10))
+        serial = cueing_effect.group_effects(effects, samples=1200, workers=1, seed=2)
+        parallel = cueing_effect.group_effects(effects, samples=1200, workers=2, seed=2)
+        np.testing.assert_allclose(serial["ci_lower"], parallel["ci_lower"])
+        np.testing.assert_allclose(serial["ci_upper"], parallel["ci_upper"])
+
+    def test_missing_condition(self) -> None:
+        trials = make_trials(2)
+        missing = (trials["participant_id"] == trials["participant_id"].max()) & (
+            trials["stimulus_species"] == StimulusSpecies.DOG
+        )
+        trials = trials[~missing]
+        effects = cueing_effect.participant_effects(cueing_effect.trim(trials))
+        group = cueing_effect.group_effects(effects, samples=500, workers=1, seed=3)
+        self.assertEqual(list(group["participants"]), [2, 2, 2, 1, 1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import pygame
+
+from src.services.clock import Clock
+from src.services.evdev_source import EV_KEY, INPUT_EVENT, EvdevEventSource
+from src.services.event_source import EventSource
+from tests.tools import minimal_setup
+
+KEY_SPACE = 57
+KEY_A = 30
+
+
+def input_event(ns: int, code: int, value: int, type: int = EV_KEY) -> bytes:
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return INPUT_EVENT.pack(seconds, remainder // 1000, type, code, value)
+
+
+class ListEventSource(EventSource):
+    def __init__(self, events: list[pygame.event.Event]) -> None:
+        self.events = events
+        self.is_closed = False
+
+    def get(self) -> list[pygame.event.Event]:
+        events, self.events = self.events, []
+        return events
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+class TestEvdevEventSource(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestEvdevEventSource, cls).setUpClass()
+        minimal_setup()
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "event0"
+        self.clock = Clock()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_key_presses_from_device_file(self) -> None:
+        now = time.time_ns()
+        self.path.write_bytes(
+            input_event(now - 50_000_000, KEY_SPACE, 1)
+            + input_event(now - 40_000_000, KEY_SPACE, 2)
+            + input_event(now - 30_000_000, KEY_SPACE, 0)
+            + input_event(now - 20_000_000, KEY_A, 1)
+            + input_event(now - 10_000_000, 4, 458796, type=4)
+        )
+        escape = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+        space = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+        source = ListEventSource([escape, space])
+        device = EvdevEventSource(source, self.clock, self.path)
+        device.reader.join(timeout=5)
+        events = device.get()
+        self.assertEqual(len(events), 2)
+        self.assertIs(events[0], escape)
+        self.assertEqual(events[1].key, pygame.K_SPACE)
+        self.assertAlmostEqual(events[1].time, self.clock.now() - 50, delta=20)
+        device.close()
+        self.assertTrue(source.is_closed)
+
+    def test_key_presses_from_pipe(self) -> None:
+        os.mkfifo(self.path)
+        reader = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        writer = os.open(self.path, os.O_WRONLY)
+        os.close(reader)
+        device = EvdevEventSource(ListEventSource([]), self.clock, self.path)
+        self.assertEqual(device.get(), [])
+        # A partial event is kept until the rest arrives.
+        event = input_event(time.time_ns(), KEY_SPACE, 1)
+        os.write(writer, event[:10])
+        time.sleep(0.05)
+        os.write(writer, event[10:])
+        os.close(writer)
+        device.reader.join(timeout=5)
+        self.assertEqual([event.key for event in device.get()], [pygame.K_SPACE])
+        device.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
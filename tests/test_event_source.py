@@ -0,0 +1,126 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygame
+
+from src.components import Participant
+from src.scenes.scene import QuitActionType
+from src.services.clock import VirtualClock
+from src.services.event_source import (
+    EventSource,
+    PygameEventSource,
+    RecordingEventSource,
+    ScriptedEventSource,
+    load_header,
+    load_recording,
+)
+from src.services.scene_manager import SceneManager
+from src.services.simulation import SimulatedParticipant, simulate
+from tests.tools import minimal_setup, patch_data_paths
+
+
+class ListEventSource(EventSource):
+    def __init__(self, events: list[pygame.event.Event]) -> None:
+        self.events = events
+
+    def get(self) -> list[pygame.event.Event]:
+        events, self.events = self.events, []
+        return events
+
+
+class TestEventSource(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestEventSource, cls).setUpClass()
+        cls.screen = minimal_setup()
+
+    def setUp(self) -> None:
+        patch_data_paths(self)
+        self.directory = tempfile.TemporaryDirectory()
+        self.clock = VirtualClock()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_pygame_events_timestamped_on_poll(self) -> None:
+        source = PygameEventSource(self.clock)
+        pygame.event.get()
+        self.clock.advance(5)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        source.poll()
+        self.clock.advance(10)
+        events = source.get()
+        self.assertEqual([event.time for event in events], [5.0])
+        self.assertEqual(source.get(), [])
+
+    def test_scripted_events_delivered_when_due(self) -> None:
+        space = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+        escape = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+        source = ScriptedEventSource([(20.0, escape), (10.0, space)], self.clock)
+        self.assertEqual(source.get(), [])
+        self.clock.advance(15)
+        self.assertEqual(source.get(), [space])
+        self.assertEqual(source.get(), [])
+        self.clock.advance(5)
+        self.assertEqual(source.get(), [escape])
+        self.assertTrue(source.is_finished())
+
+    def test_record_and_load(self) -> None:
+        path = Path(self.directory.name) / "events.jsonl"
+        events = [
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_h, window=None),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(5, 6)),
+        ]
+        recorder = RecordingEventSource(ListEventSource(events), self.clock, path)
+        recorder.write_header({"trials": [[1, 2]]})
+        self.clock.advance(12.5)
+        self.assertEqual(recorder.get(), events)
+        recorder.close()
+        self.assertEqual(load_header(path), {"trials": [[1, 2]]})
+        recording = load_recording(path)
+        self.assertEqual([time for time, _ in recording], [12.5, 12.5])
+        self.assertEqual(recording[0][1].type, pygame.KEYDOWN)
+        self.assertEqual(recording[0][1].key, pygame.K_h)
+        self.assertEqual(recording[1][1].pos, (5, 6))
+
+    def test_load_recording_without_header(self) -> None:
+        path = Path(self.directory.name) / "events.jsonl"
+        events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_h)]
+        recorder = RecordingEventSource(ListEventSource(events), self.clock, path)
+        recorder.get()
+        recorder.close()
+        self.assertEqual(load_header(path), {})
+        self.assertEqual(len(load_recording(path)), 1)
+
+    def test_scene_manager_reads_event_source(self) -> None:
+        escape = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+        source = ScriptedEventSource([(10.0, escape)], self.clock)
+        scene_manager = SceneManager(self.screen, self.clock, source)
+        self.assertEqual(scene_manager.process_game_events(), QuitActionType.CONTINUE)
+        self.clock.advance(10)
+        self.assertEqual(scene_manager.process_game_events(), QuitActionType.QUIT)
+
+    def test_replay_reproduces_session(self) -> None:
+        path = str(Path(self.directory.name) / "session.jsonl")
+        responder = SimulatedParticipant(Participant(9998, 30, 1, 1), seed=2)
+        random.seed(3)
+        recorded = simulate(self.screen, responder, trials=4, record_path=path)
+        # The trial order comes from the header, not the shuffle.
+        random.seed(4)
+        replayed = simulate(
+            self.screen,
+            trials=4,
+            recording=load_recording(path),
+            trial_order=load_header(path)["trials"],
+        )
+        for trial_number in range(4):
+            self.assertEqual(
+                recorded.trial_manager.trial_record(trial_number),
+                replayed.trial_manager.trial_record(trial_number),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.constants import DIRTY_RECT_RENDERING, WHITE
+from src.scenes.experiment_scene import ExperimentScene
+from src.visuals import Image
+from tests.tools import minimal_setup
+
+
+@unittest.skipUnless(DIRTY_RECT_RENDERING, "dirty rect rendering disabled")
+class TestExperimentScene(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestExperimentScene, cls).setUpClass()
+        cls.screen = minimal_setup()
+
+    def setUp(self) -> None:
+        self.scene = ExperimentScene(self.screen)
+        surface = pygame.Surface((40, 40))
+        surface.fill(WHITE)
+        self.image = Image(surface, (100, 100))
+
+    def test_first_frame_full_update(self) -> None:
+        self.scene.display([])
+        self.assertEqual(self.scene.dirty_rects, [self.screen.get_rect()])
+        self.assertFalse(self.scene.is_dirty)
+
+    def test_unchanged_frame_no_update(self) -> None:
+        self.scene.display([self.image])
+        self.scene.display([self.image])
+        self.assertEqual(self.scene.dirty_rects, [])
+
+    def test_added_and_removed_elements(self) -> None:
+        self.scene.display([])
+        self.scene.display([self.image])
+        self.assertEqual(self.scene.dirty_rects, [self.image.rect])
+        self.scene.display([])
+        self.assertEqual(self.scene.dirty_rects, [self.image.rect])
+
+    def test_prepared_frames_match_drawing(self) -> None:
+        self.scene.display([])
+        self.scene.display([self.image])
+        expected = self.screen.copy()
+        self.scene.prepare_frames([[], [self.image]])
+        self.scene.display([])
+        self.scene.display([self.image])
+        self.assertIsNotNone(
+            self.scene.frame_composer.get([self.scene.fixation_cross, self.image])
+        )
+        self.assertEqual(self.scene.dirty_rects, [self.image.rect])
+        self.assertEqual(
+            pygame.image.tobytes(self.screen, "RGB"),
+            pygame.image.tobytes(expected, "RGB"),
+        )
+
+    def test_prepared_frames_spread_over_display(self) -> None:
+        other = Image(pygame.Surface((40, 40)), (200, 100))
+        compose = self.scene.frame_composer.compose
+        with patch.object(
+            self.scene.frame_composer, "compose", wraps=compose
+        ) as composed:
+            self.scene.prepare_frames([[], [self.image], [self.image, other]])
+            self.assertEqual(composed.call_count, 0)
+            for frames in range(1, 4):
+                self.scene.display([])
+                self.assertEqual(composed.call_count, frames)
+            self.scene.display([])
+            self.assertEqual(composed.call_count, 3)
+
+    def test_rest_toggle_full_update(self) -> None:
+        self.scene.display([])
+        self.scene.is_resting = True
+        self.assertTrue(self.scene.is_dirty)
+        self.scene.display([])
+        self.assertEqual(self.scene.dirty_rects, [self.screen.get_rect()])
+        self.scene.is_resting = True
+        self.scene.display([])
+        self.assertEqual(self.scene.dirty_rects, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from concurrent.futures import Future
+
+from src.constants import TEXT_SAVE_ERROR, TEXT_SAVED, TEXT_SAVING
+from src.scenes.finished_scene import FinishedScene
+from tests.tools import minimal_setup
+
+
+class TestFinishedScene(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestFinishedScene, cls).setUpClass()
+        cls.screen = minimal_setup()
+
+    def setUp(self) -> None:
+        self.save: Future[None] = Future()
+        self.finished_scene = FinishedScene(self.screen, save=self.save)
+
+    def test_saving(self) -> None:
+        self.assertTrue(self.finished_scene.is_saving())
+        self.assertEqual(self.finished_scene.status.string, TEXT_SAVING)
+
+    def test_saved(self) -> None:
+        self.finished_scene.display()
+        self.save.set_result(None)
+        self.finished_scene.display()
+        self.assertFalse(self.finished_scene.is_saving())
+        self.assertEqual(self.finished_scene.status.string, TEXT_SAVED)
+        self.assertTrue(self.finished_scene.dirty_rects)
+
+    def test_save_error(self) -> None:
+        self.save.set_exception(PermissionError("data/1.xlsx"))
+        self.finished_scene.display()
+        self.assertFalse(self.finished_scene.is_saving())
+        self.assertEqual(
+            self.finished_scene.status.string, TEXT_SAVE_ERROR.format("data/1.xlsx")
+        )
+
+    def test_no_save(self) -> None:
+        finished_scene = FinishedScene(self.screen)
+        self.assertFalse(finished_scene.is_saving())
+        self.assertEqual(finished_scene.status.string, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+import pygame
+
+from src.constants import BG_GREY, WHITE
+from src.visuals import FrameComposer, Image
+from tests.tools import minimal_setup
+
+size = (200, 100)
+
+
+class TestFrameComposer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestFrameComposer, cls).setUpClass()
+        cls.screen = minimal_setup()
+
+    def setUp(self) -> None:
+        self.composer = FrameComposer(size)
+        surface = pygame.Surface((10, 10))
+        surface.fill(WHITE)
+        self.image = Image(surface, (20, 20))
+
+    def test_compose(self) -> None:
+        frame = self.composer.compose([self.image])
+        self.assertEqual(frame.get_size(), size)
+        self.assertEqual(frame.get_at((0, 0)), BG_GREY)
+        self.assertEqual(frame.get_at((25, 25)), WHITE)
+
+    def test_prepare_and_get(self) -> None:
+        self.assertIsNone(self.composer.get([self.image]))
+        self.composer.prepare([[], [self.image]])
+        self.assertIsNone(self.composer.get([]))
+        while self.composer.compose_next():
+            pass
+        self.assertIsInstance(self.composer.get([]), pygame.Surface)
+        self.assertIsInstance(self.composer.get([self.image]), pygame.Surface)
+
+    def test_compose_next_one_frame(self) -> None:
+        self.composer.prepare([[], [self.image]])
+        self.assertTrue(self.composer.compose_next())
+        self.assertIsInstance(self.composer.get([]), pygame.Surface)
+        self.assertIsNone(self.composer.get([self.image]))
+        self.assertTrue(self.composer.compose_next())
+        self.assertFalse(self.composer.compose_next())
+
+    def test_prepare_replaces_frames(self) -> None:
+        self.composer.prepare([[self.image]])
+        self.composer.compose_next()
+        frame = self.composer.get([self.image])
+        self.composer.prepare([[]])
+        self.assertIsNone(self.composer.get([self.image]))
+        self.composer.compose_next()
+        self.assertIs(self.composer.get([]), frame)
+        self.assertEqual(frame.get_at((25, 25)), BG_GREY)
+
+    def test_prepare_keeps_composed_frames(self) -> None:
+        self.composer.prepare([[], [self.image]])
+        self.composer.compose_next()
+        frame = self.composer.get([])
+        self.composer.prepare([[], [self.image]])
+        self.assertIs(self.composer.get([]), frame)
+        self.assertTrue(self.composer.compose_next())
+        self.assertFalse(self.composer.compose_next())
+
+
+if __name__ == "__main__":
+    unittest.main()
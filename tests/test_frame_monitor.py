@@ -0,0 +1,65 @@
+import unittest
+
+from src.constants import DISPLAY_TIMING
+from src.services.frame_monitor import FrameMonitor, dropped_frames
+from tests.tools import minimal_setup
+
+
+class TestFrameMonitor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestFrameMonitor, cls).setUpClass()
+        cls.screen = minimal_setup()
+        cls.period = DISPLAY_TIMING["frame_period"]
+
+    def setUp(self) -> None:
+        self.frame_monitor = FrameMonitor(size=4)
+
+    def test_dropped_frames(self) -> None:
+        self.assertEqual(dropped_frames(self.period), 0)
+        self.assertEqual(dropped_frames(self.period * 1.45), 0)
+        self.assertEqual(dropped_frames(self.period * 1.6), 1)
+        self.assertEqual(dropped_frames(self.period * 2), 1)
+        self.assertEqual(dropped_frames(self.period * 3), 2)
+
+    def test_record(self) -> None:
+        self.assertIsNone(self.frame_monitor.record(10.0))
+        self.assertAlmostEqual(self.frame_monitor.record(17.0), 7.0)
+        self.assertEqual(list(self.frame_monitor.durations), [7.0])
+
+    def test_ring_buffer(self) -> None:
+        for frame in range(10):
+            self.frame_monitor.record(frame * self.period)
+        self.assertEqual(len(self.frame_monitor.durations), 4)
+
+    def test_reset(self) -> None:
+        self.frame_monitor.record(0.0)
+        self.frame_monitor.reset()
+        self.assertIsNone(self.frame_monitor.record(500.0))
+        self.assertEqual(len(self.frame_monitor.durations), 0)
+
+    def test_statistics(self) -> None:
+        for time in (0, self.period, self.period * 2, self.period * 5):
+            self.frame_monitor.record(time)
+        statistics = self.frame_monitor.statistics()
+        self.assertEqual(statistics["frames"], 3)
+        self.assertEqual(statistics["dropped"], 2)
+        self.assertAlmostEqual(statistics["max_ms"], self.period * 3)
+        self.assertAlmostEqual(statistics["mean_ms"], self.period * 5 / 3)
+
+    def test_totals_outlast_buffer(self) -> None:
+        for frame in range(10):
+            self.frame_monitor.record(frame * self.period)
+        self.frame_monitor.record(11 * self.period)
+        totals = self.frame_monitor.totals()
+        self.assertEqual(totals["frames"], 10)
+        self.assertAlmostEqual(totals["mean_ms"], 1.1 * self.period)
+        self.assertAlmostEqual(totals["sd_ms"], 0.3 * self.period)
+        self.assertAlmostEqual(totals["max_ms"], 2 * self.period)
+        self.assertEqual(totals["dropped"], 1)
+        self.frame_monitor.clear_totals()
+        self.assertEqual(self.frame_monitor.totals()["frames"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
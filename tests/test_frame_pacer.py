@@ -0,0 +1,66 @@
+import unittest
+from itertools import pairwise
+from time import perf_counter
+
+from src.constants import DISPLAY_TIMING
+from src.services.frame_monitor import FrameMonitor
+from src.services.frame_pacer import FramePacer, PacingMode
+from tests.tools import minimal_setup
+
+frames = 20
+
+
+class TestFramePacer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestFramePacer, cls).setUpClass()
+        cls.screen = minimal_setup()
+        cls.period = DISPLAY_TIMING["frame_period"]
+
+    def pace(self, pacer: FramePacer) -> dict[str, float]:
+        frame_monitor = FrameMonitor()
+        pacer.wait()
+        for _ in range(frames):
+            frame_monitor.record(perf_counter() * 1000)
+            pacer.wait()
+        return frame_monitor.statistics()
+
+    def test_mode_from_string(self) -> None:
+        self.assertEqual(FramePacer("hybrid").mode, PacingMode.HYBRID)
+        with self.assertRaises(ValueError):
+            FramePacer("sometimes")
+
+    def test_hybrid_pacing(self) -> None:
+        statistics = self.pace(FramePacer(PacingMode.HYBRID, spin_margin=2.0))
+        self.assertGreaterEqual(statistics["mean_ms"], self.period * 0.9)
+        self.assertLess(statistics["mean_ms"], self.period * 1.5)
+
+    def test_hybrid_pacing_polls_input(self) -> None:
+        polls = []
+        pacer = FramePacer(
+            PacingMode.HYBRID,
+            spin_margin=1.0,
+            poll=lambda: polls.append(perf_counter()),
+            poll_interval=1.0,
+        )
+        pacer.wait()
+        polls.clear()
+        pacer.wait()
+        self.assertGreater(len(polls), 1)
+        gaps = [(b - a) * 1000 for a, b in pairwise(polls)]
+        self.assertLess(max(gaps), self.period)
+
+    def test_tick_pacing(self) -> None:
+        statistics = self.pace(FramePacer(PacingMode.TICK))
+        self.assertGreaterEqual(statistics["mean_ms"], self.period * 0.5)
+
+    def test_vsync_does_not_wait(self) -> None:
+        start = perf_counter()
+        pacer = FramePacer(PacingMode.VSYNC)
+        for _ in range(frames):
+            pacer.wait()
+        self.assertLess((perf_counter() - start) * 1000, self.period * frames)
+
+
+if __name__ == "__main__":
+    unittest.main()
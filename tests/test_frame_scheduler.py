@@ -0,0 +1,39 @@
+import unittest
+
+from src.constants import DISPLAY_TIMING
+from src.services.frame_scheduler import quantisation_errors, to_frames, to_ms
+from tests.tools import minimal_setup
+
+
+class TestFrameScheduler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestFrameScheduler, cls).setUpClass()
+        cls.screen = minimal_setup()
+        cls.period = DISPLAY_TIMING["frame_period"]
+
+    def test_display_timing(self) -> None:
+        self.assertGreater(DISPLAY_TIMING["refresh_rate"], 0)
+        self.assertAlmostEqual(
+            DISPLAY_TIMING["frame_period"], 1000 / DISPLAY_TIMING["refresh_rate"]
+        )
+
+    def test_to_frames(self) -> None:
+        self.assertEqual(to_frames(0), 0)
+        self.assertEqual(to_frames(self.period * 10), 10)
+        self.assertEqual(to_frames(self.period * 10.4), 10)
+        self.assertEqual(to_frames(self.period * 10.6), 11)
+
+    def test_to_ms(self) -> None:
+        self.assertAlmostEqual(to_ms(12), self.period * 12)
+
+    def test_quantisation_errors(self) -> None:
+        errors = quantisation_errors([self.period * 3, self.period * 3.25])
+        self.assertAlmostEqual(errors[self.period * 3], 0)
+        self.assertAlmostEqual(errors[self.period * 3.25], -self.period * 0.25)
+        for error in quantisation_errors([100, 300, 700]).values():
+            self.assertLessEqual(abs(error), self.period / 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import gc
+import unittest
+
+from src.services import garbage_collection
+
+
+class TestGarbageCollection(unittest.TestCase):
+    def setUp(self) -> None:
+        garbage_collection.track_collections(lambda: "testing")
+        garbage_collection.clear_log()
+
+    def tearDown(self) -> None:
+        gc.enable()
+        gc.unfreeze()
+
+    def test_collections_logged(self) -> None:
+        gc.collect()
+        self.assertGreater(len(garbage_collection.collection_log()), 0)
+        collection = garbage_collection.collection_log()[-1]
+        self.assertEqual(collection["phase"], "testing")
+        self.assertEqual(collection["generation"], 2)
+        self.assertGreaterEqual(collection["duration_ms"], 0)
+
+    def test_callback_registered_once(self) -> None:
+        garbage_collection.track_collections(lambda: "again")
+        self.assertEqual(gc.callbacks.count(garbage_collection._log_collection), 1)
+
+    def test_pause_and_collect(self) -> None:
+        garbage_collection.pause()
+        self.assertFalse(gc.isenabled())
+        garbage_collection.collect()
+        self.assertEqual(len(garbage_collection.collection_log()), 1)
+        garbage_collection.resume()
+        self.assertTrue(gc.isenabled())
+
+    def test_collect_only_while_paused(self) -> None:
+        garbage_collection.collect()
+        self.assertEqual(garbage_collection.collection_log(), [])
+
+    def test_clear_log(self) -> None:
+        gc.collect()
+        garbage_collection.clear_log()
+        self.assertEqual(garbage_collection.collection_log(), [])
+
+    def test_freeze(self) -> None:
+        garbage_collection.freeze()
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
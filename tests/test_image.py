@@ -4,7 +4,9 @@ from random import choice
 
 import pygame
 
+from src.services.screen import check_display_format
 from src.visuals import Image
+from src.visuals.tools import is_display_format
 from tests.tools import minimal_setup, test_blit
 
 images_path = "resources"
@@ -68,6 +70,16 @@ class TestImage(unittest.TestCase):
         self.assertEqual(self.image.position, old_position)
         self.assertEqual(self.image.size, old_size)
 
+    def test_display_format(self) -> None:
+        self.assertTrue(is_display_format(self.image.surface))
+        self.image.size = (0, 0)
+        self.assertTrue(is_display_format(self.image.surface))
+        self.assertEqual(check_display_format([self.image]), [])
+
+    def test_flag_unconverted_surface(self) -> None:
+        self.image._surface = pygame.image.load(choice(self.paths))
+        self.assertEqual(check_display_format([self.image]), [self.image])
+
     def test_draw_when_enabled(self) -> None:
         test_blit(self, self.image, self.screen)
 
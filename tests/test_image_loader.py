@@ -0,0 +1,78 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygame
+
+from src.constants import STIMULI_PATH
+from src.services.image_loader import cache_file, load_scaled_images, load_times
+from tests.tools import minimal_setup
+
+size = (40, 40)
+
+
+class TestImageLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestImageLoader, cls).setUpClass()
+        cls.screen = minimal_setup()
+        cls.paths = [str(path) for path in Path(STIMULI_PATH).rglob("*.tif")][:6]
+
+    def test_serial_load(self) -> None:
+        surfaces = load_scaled_images(self.paths, size, workers=1, cache_path=None)
+        self.assertEqual(len(surfaces), len(self.paths))
+        for surface in surfaces:
+            self.assertIsInstance(surface, pygame.Surface)
+            self.assertEqual(surface.get_size(), size)
+
+    def test_parallel_load_matches_serial(self) -> None:
+        serial = load_scaled_images(self.paths, size, workers=1, cache_path=None)
+        parallel = load_scaled_images(self.paths, size, workers=4, cache_path=None)
+        self.assertEqual(len(serial), len(parallel))
+        for a, b in zip(serial, parallel, strict=True):
+            self.assertEqual(
+                pygame.image.tobytes(a, "RGBA"), pygame.image.tobytes(b, "RGBA")
+            )
+
+    def test_load_times_recorded(self) -> None:
+        load_scaled_images(self.paths, size, workers=2, cache_path=None)
+        for path in self.paths:
+            self.assertIn(path, load_times)
+            self.assertGreaterEqual(load_times[path], 0)
+
+    def test_cache_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_path:
+            decoded = load_scaled_images(self.paths, size, 1, cache_path)
+            for path in self.paths:
+                self.assertTrue(cache_file(path, size, cache_path).is_file())
+            cached = load_scaled_images(self.paths, size, 1, cache_path)
+            for a, b in zip(decoded, cached, strict=True):
+                self.assertEqual(b.get_size(), size)
+                self.assertEqual(
+                    pygame.image.tobytes(a, "RGBA"), pygame.image.tobytes(b, "RGBA")
+                )
+
+    def test_cache_keyed_on_size(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_path:
+            path = self.paths[0]
+            self.assertNotEqual(
+                cache_file(path, size, cache_path),
+                cache_file(path, (20, 20), cache_path),
+            )
+            load_scaled_images([path], size, 1, cache_path)
+            surface = load_scaled_images([path], (20, 20), 1, cache_path)[0]
+            self.assertEqual(surface.get_size(), (20, 20))
+            self.assertEqual(len(list(Path(cache_path).iterdir())), 2)
+
+    def test_corrupt_cache_rebuilt(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_path:
+            path = self.paths[0]
+            file = cache_file(path, size, cache_path)
+            file.write_bytes(b"truncated")
+            surface = load_scaled_images([path], size, 1, cache_path)[0]
+            self.assertEqual(surface.get_size(), size)
+            self.assertEqual(file.stat().st_size, size[0] * size[1] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -110,6 +110,14 @@ class TestInputBox(unittest.TestCase):
         self.input_box.key_down(pygame.K_RETURN)
         self.assertFalse(self.input_box.is_active)
 
+    def test_edit_string_braces_and_tilde(self) -> None:
+        self.input_box.is_active = True
+        for key in (ord("{"), ord("~")):
+            self.input_box.key_down(key)
+        self.assertEqual(self.input_box.text.string, string + "{~")
+        self.input_box.key_down(pygame.K_DELETE)
+        self.assertEqual(self.input_box.text.string, string + "{~")
+
     def test_edit_string_numeric_only(self) -> None:
         self.input_box.is_active = True
         self.input_box.is_numeric = True
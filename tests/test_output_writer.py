@@ -0,0 +1,75 @@
+import tempfile
+import unittest
+from importlib.util import find_spec
+from pathlib import Path
+
+import pandas as pd
+from pandas import DataFrame
+
+from src.services import output_writer
+
+
+class TestOutputWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.stem = Path(self.directory.name) / "1"
+        trial_data = DataFrame(
+            {
+                "trial_number": [1, 2],
+                "response": [1, 0],
+                "reaction_time": [250.5, None],
+            }
+        )
+        self.tables = {
+            "trial_data": output_writer.with_dtypes(
+                trial_data, output_writer.TRIAL_DATA_DTYPES
+            ).set_index("trial_number"),
+            "variable_levels": DataFrame({"Response": {"NONE": 0, "SPACE": 1}}),
+        }
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_with_dtypes(self) -> None:
+        df = self.tables["trial_data"]
+        self.assertEqual(df["response"].dtype, "int64")
+        self.assertEqual(df["reaction_time"].dtype, "Float64")
+        self.assertTrue(pd.isna(df["reaction_time"].iloc[1]))
+
+    def test_write_xlsx(self) -> None:
+        self.assertEqual(
+            output_writer.write_tables(self.stem, self.tables, ["xlsx"]), ["xlsx"]
+        )
+        sheets = pd.read_excel(self.stem.with_suffix(".xlsx"), sheet_name=None)
+        self.assertEqual(list(sheets), ["trial_data", "variable_levels"])
+
+    def test_write_csv(self) -> None:
+        output_writer.write_tables(self.stem, self.tables, ["csv"])
+        df = pd.read_csv(self.stem.with_name("1_trial_data.csv"))
+        self.assertEqual(
+            list(df.columns), ["trial_number", "response", "reaction_time"]
+        )
+        self.assertEqual(df["reaction_time"].iloc[0], 250.5)
+        self.assertTrue(self.stem.with_name("1_variable_levels.csv").exists())
+        self.assertEqual(list(Path(self.directory.name).glob("*.tmp.*")), [])
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow is not installed")
+    def test_write_parquet_and_feather(self) -> None:
+        output_writer.write_tables(self.stem, self.tables, ["parquet", "feather"])
+        for df in (
+            pd.read_parquet(self.stem.with_name("1_trial_data.parquet")),
+            pd.read_feather(self.stem.with_name("1_trial_data.feather")),
+        ):
+            self.assertEqual(df["response"].dtype, "int64")
+            self.assertEqual(df["reaction_time"].dtype, "Float64")
+
+    def test_unavailable_format_skipped(self) -> None:
+        self.assertFalse(output_writer.is_available("docx"))
+        self.assertEqual(
+            output_writer.write_tables(self.stem, self.tables, ["docx", "csv"]),
+            ["csv"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.services import participant_index
+
+
+class TestParticipantIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.directory.name)
+        self.patch = patch.object(participant_index, "DATA_PATH", self.directory.name)
+        self.patch.start()
+
+    def tearDown(self) -> None:
+        self.patch.stop()
+        self.directory.cleanup()
+
+    def touch(self, *names: str) -> None:
+        for name in names:
+            (self.data_path / name).touch()
+
+    def test_no_sessions(self) -> None:
+        self.assertEqual(participant_index.highest_id(), 1)
+
+    def test_scan_when_missing(self) -> None:
+        self.touch("3.xlsx", "12_trial_data.csv", "notes.xlsx", "40.txt")
+        self.assertEqual(participant_index.highest_id(), 12)
+        self.assertTrue(participant_index.index_file().exists())
+        self.assertFalse(participant_index.is_stale())
+
+    def test_index_used_when_fresh(self) -> None:
+        participant_index.save({"highest_id": 7, "sessions": []})
+        with patch.object(participant_index, "scan") as scan:
+            self.assertEqual(participant_index.highest_id(), 7)
+            scan.assert_not_called()
+
+    def test_scan_when_stale(self) -> None:
+        participant_index.save({"highest_id": 7, "sessions": []})
+        self.touch("9.xlsx")
+        later = participant_index.index_file().stat().st_mtime_ns + 10**9
+        os.utime(self.data_path, ns=(later, later))
+        self.assertTrue(participant_index.is_stale())
+        self.assertEqual(participant_index.highest_id(), 9)
+
+    def test_scan_when_unreadable(self) -> None:
+        self.touch("5.xlsx")
+        participant_index.index_file().write_text("{", encoding="utf-8")
+        self.assertEqual(participant_index.highest_id(), 5)
+
+    def test_record_session(self) -> None:
+        index = participant_index.load()
+        self.touch("4.xlsx")
+        participant_index.record_session(4, index)
+        self.assertFalse(participant_index.is_stale())
+        saved = json.loads(participant_index.index_file().read_text(encoding="utf-8"))
+        self.assertEqual(saved["highest_id"], 4)
+        self.assertEqual(saved["sessions"][-1]["participant_id"], 4)
+        self.assertEqual(list(self.data_path.glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from concurrent.futures import Future
 
 import pygame
 
@@ -9,7 +10,7 @@ from src.scenes.finished_scene import FinishedScene
 from src.scenes.scene import QuitActionType
 from src.scenes.start_scene import StartScene
 from src.services.scene_manager import SceneManager
-from tests.tools import minimal_setup
+from tests.tools import minimal_setup, patch_data_paths
 
 
 class TestSceneManager(unittest.TestCase):
@@ -19,6 +20,7 @@ class TestSceneManager(unittest.TestCase):
         cls.screen = minimal_setup()
 
     def setUp(self) -> None:
+        patch_data_paths(self)
         self.scene_manager = SceneManager(self.screen)
 
     def test_start_scene(self) -> None:
@@ -43,9 +45,16 @@ class TestSceneManager(unittest.TestCase):
         # experiment scene
         self.scene_manager.start_new_scene()
         self.assertIsInstance(self.scene_manager.active_scene, ExperimentScene)
+        self.scene_manager.record_flip()
+        self.scene_manager.record_flip()
         # finished scene
         self.scene_manager.start_new_scene()
+        self.scene_manager.record_flip()
+        self.scene_manager.record_flip()
+        self.scene_manager.record_flip()
+        self.assertEqual(self.scene_manager.experiment_frame_statistics()["frames"], 1)
         self.assertIsInstance(self.scene_manager.active_scene, FinishedScene)
+        self.scene_manager.active_scene.save.result(timeout=30)
 
         # test restart
         event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)
@@ -54,6 +63,30 @@ class TestSceneManager(unittest.TestCase):
             self.scene_manager.process_game_events(), QuitActionType.RESTART
         )
 
+    def test_quit_blocked_while_saving(self) -> None:
+        save: Future[None] = Future()
+        self.scene_manager.active_scene = FinishedScene(self.screen, save=save)
+        for key in (pygame.K_ESCAPE, pygame.K_r):
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        self.assertEqual(
+            self.scene_manager.process_game_events(), QuitActionType.CONTINUE
+        )
+        save.set_result(None)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+        self.assertEqual(self.scene_manager.process_game_events(), QuitActionType.QUIT)
+
+    def test_event_subscriptions(self) -> None:
+        self.assertFalse(pygame.event.get_blocked(pygame.MOUSEBUTTONDOWN))
+        self.assertTrue(pygame.event.get_blocked(pygame.MOUSEMOTION))
+        self.scene_manager.active_scene = ExperimentScene(self.screen)
+        self.assertEqual(
+            set(self.scene_manager.dispatch), {pygame.QUIT, pygame.KEYDOWN}
+        )
+        self.assertTrue(pygame.event.get_blocked(pygame.MOUSEBUTTONDOWN))
+        self.assertFalse(pygame.event.get_blocked(pygame.KEYDOWN))
+        self.assertFalse(pygame.event.get_blocked(pygame.QUIT))
+
     def test_continue_when_nothing_happens(self) -> None:
         self.assertEqual(
             self.scene_manager.process_game_events(), QuitActionType.CONTINUE
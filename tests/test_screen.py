@@ -0,0 +1,58 @@
+import unittest
+from itertools import count
+from unittest.mock import patch
+
+from src.constants import DISPLAY_TIMING, FRAMERATE
+from src.services import screen
+from src.services.clock import NS_PER_MS
+from tests.tools import minimal_setup
+
+
+class TestScreen(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestScreen, cls).setUpClass()
+        minimal_setup()
+
+    def setUp(self) -> None:
+        self.addCleanup(DISPLAY_TIMING.update, dict(DISPLAY_TIMING))
+
+    def flips_every(self, period: float) -> float | None:
+        times = count(0, round(period * NS_PER_MS))
+        with patch.object(screen, "perf_counter_ns", lambda: next(times)):
+            return screen.detect_refresh_rate()
+
+    def test_refresh_rate_measured(self) -> None:
+        self.assertAlmostEqual(self.flips_every(1000 / 120), 120, places=1)
+
+    def test_refresh_rate_not_measured_without_vsync(self) -> None:
+        self.assertIsNone(self.flips_every(0.01))
+        self.assertIsNone(self.flips_every(1000))
+
+    def test_dummy_driver_not_measured(self) -> None:
+        self.assertIsNone(screen.detect_refresh_rate())
+
+    def test_refresh_rate_measured_with_vsync_whatever_the_pacing(self) -> None:
+        vsync_display = screen.init_vsync_display
+        with (
+            patch.object(
+                screen, "init_vsync_display", wraps=vsync_display
+            ) as init_vsync_display,
+            patch.object(screen, "detect_refresh_rate", return_value=60.0),
+            patch.object(screen, "FRAME_PACING", "hybrid"),
+        ):
+            screen.init_screen()
+        init_vsync_display.assert_called_once()
+        self.assertEqual(DISPLAY_TIMING["refresh_rate"], 60.0)
+        self.assertAlmostEqual(DISPLAY_TIMING["frame_period"], 1000 / 60)
+        self.assertEqual(DISPLAY_TIMING["refresh_rate_measured"], 1.0)
+
+    def test_refresh_rate_falls_back(self) -> None:
+        with patch.object(screen, "detect_refresh_rate", return_value=None):
+            screen.init_screen()
+        self.assertEqual(DISPLAY_TIMING["refresh_rate"], FRAMERATE)
+        self.assertEqual(DISPLAY_TIMING["refresh_rate_measured"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
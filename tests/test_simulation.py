@@ -0,0 +1,64 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from src.components import Participant, Response
+from src.scenes.finished_scene import FinishedScene
+from src.services.simulation import SimulatedParticipant, simulate
+from tests.tools import minimal_setup, patch_data_paths
+
+
+class TestSimulation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestSimulation, cls).setUpClass()
+        cls.screen = minimal_setup()
+
+    def setUp(self) -> None:
+        self.data_path = patch_data_paths(self)
+
+    def test_reaction_time_distribution(self) -> None:
+        responder = SimulatedParticipant(
+            Participant(9999, 30, 1, 1), rt_tau=0, cueing_effect=50, seed=1
+        )
+        valid = [responder.reaction_time(True) for _ in range(2000)]
+        invalid = [responder.reaction_time(False) for _ in range(2000)]
+        self.assertAlmostEqual(sum(valid) / len(valid), 400, delta=5)
+        self.assertAlmostEqual(sum(invalid) / len(invalid), 450, delta=5)
+
+    def test_simulated_session(self) -> None:
+        responder = SimulatedParticipant(
+            Participant(9999, 30, 2, 3), accuracy=1.0, seed=1
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        scene_manager = simulate(
+            self.screen, responder, trials=6, data_path=directory.name
+        )
+        self.assertIsInstance(scene_manager.active_scene, FinishedScene)
+        trial_manager = scene_manager.trial_manager
+        self.assertTrue(trial_manager.has_experiment_finished)
+        self.assertTrue(trial_manager.save_future.done())
+        self.assertIsNone(trial_manager.save_future.exception())
+        for trial in trial_manager.trials:
+            self.assertNotEqual(trial.response, Response.NONE)
+            self.assertTrue(trial.response_accuracy)
+            self.assertGreater(trial.measured_reaction_time, 0)
+
+        trial_data = pd.read_excel(
+            Path(directory.name) / "9999.xlsx", sheet_name="trial_data"
+        )
+        self.assertEqual(len(trial_data), 6)
+        self.assertEqual(set(trial_data["participant_gender"]), {2})
+
+    def test_session_saved_apart_from_data(self) -> None:
+        responder = SimulatedParticipant(Participant(9999, 30, 1, 1), seed=1)
+        scene_manager = simulate(self.screen, responder, trials=2)
+        self.assertTrue(scene_manager.trial_manager.has_experiment_finished)
+        self.assertEqual(list(self.data_path.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
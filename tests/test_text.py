@@ -5,6 +5,7 @@ import pygame
 from src.constants import BLACK
 from src.visuals.fonts import fonts
 from src.visuals.text import Text
+from src.visuals.tools import is_display_format
 from tests.tools import minimal_setup, test_blit
 
 screen = minimal_setup()
@@ -36,6 +37,9 @@ class TestText(unittest.TestCase):
         self.assertIsInstance(self.text.render, pygame.Surface)
         self.assertIsInstance(self.text.rect, pygame.Rect)
 
+    def test_display_format(self) -> None:
+        self.assertTrue(is_display_format(self.text.render))
+
     def test_change_string(self) -> None:
         old_size = self.text.size
         old_position = self.text.position
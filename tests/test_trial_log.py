@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.services.trial_log import TrialLog
+
+
+class TestTrialLog(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "logs" / "1.jsonl"
+        self.trial_log = TrialLog(self.path, sync_interval=2)
+
+    def tearDown(self) -> None:
+        self.trial_log.close()
+        self.directory.cleanup()
+
+    def test_creates_directory(self) -> None:
+        self.assertTrue(self.path.exists())
+
+    def test_append_and_read(self) -> None:
+        records = [{"trial_number": n, "reaction_time": 250.5 + n} for n in range(3)]
+        for record in records:
+            self.trial_log.append(record)
+        self.assertEqual(self.trial_log.read(), records)
+
+    def test_sync_interval(self) -> None:
+        self.trial_log.append({"trial_number": 1})
+        self.assertEqual(self.trial_log._unsynced, 1)
+        self.trial_log.append({"trial_number": 2})
+        self.assertEqual(self.trial_log._unsynced, 0)
+        self.assertGreater(os.path.getsize(self.path), 0)
+
+    def test_records_written_before_sync(self) -> None:
+        self.trial_log.append({"trial_number": 1})
+        self.assertEqual(self.trial_log._unsynced, 1)
+        with open(self.path, encoding="utf-8") as file:
+            self.assertEqual(file.read(), '{"trial_number": 1}\n')
+
+    def test_read_after_close(self) -> None:
+        self.trial_log.append({"trial_number": 1})
+        self.trial_log.close()
+        self.trial_log.sync()
+        self.assertEqual(self.trial_log.read(), [{"trial_number": 1}])
+
+    def test_partial_line_ignored(self) -> None:
+        self.trial_log.append({"trial_number": 1})
+        self.trial_log.close()
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write('{"trial_number": 2, "reac')
+        self.assertEqual(self.trial_log.read(), [{"trial_number": 1}])
+
+    def test_partial_line_discarded_on_reopen(self) -> None:
+        self.trial_log.append({"trial_number": 1})
+        self.trial_log.close()
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write('{"trial_number": 2, "reac')
+        self.trial_log = TrialLog(self.path)
+        self.trial_log.append({"trial_number": 2})
+        self.assertEqual(
+            self.trial_log.read(), [{"trial_number": 1}, {"trial_number": 2}]
+        )
+
+    def test_appends_to_existing_log(self) -> None:
+        self.trial_log.append({"trial_number": 1})
+        self.trial_log.close()
+        self.trial_log = TrialLog(self.path)
+        self.trial_log.append({"trial_number": 2})
+        self.assertEqual(
+            self.trial_log.read(), [{"trial_number": 1}, {"trial_number": 2}]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
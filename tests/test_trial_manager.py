@@ -0,0 +1,242 @@
+import gc
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.components import Participant, Response
+from src.constants import DISPLAY_TIMING, FIRST_TRIAL_DELAY, INTER_TRIAL_INTERVAL
+from src.services import checkpoint, garbage_collection
+from src.services.frame_scheduler import to_frames, to_ms
+from src.services.trial_manager import TrialManager
+from tests.tools import minimal_setup, patch_data_paths
+
+
+class TestTrialManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestTrialManager, cls).setUpClass()
+        cls.screen = minimal_setup()
+
+    def setUp(self) -> None:
+        patch_data_paths(self)
+        self.trial_manager = TrialManager()
+        self.trial_manager.participant = Participant(1, 1, 1, 1)
+        self.trial_manager.start_experiment(0.0)
+
+    def tearDown(self) -> None:
+        if self.trial_manager.save_future:
+            self.trial_manager.save_future.exception()
+        if self.trial_manager.trial_log:
+            self.trial_manager.trial_log.close()
+        gc.enable()
+
+    def advance_to(self, frame: int) -> None:
+        while self.trial_manager.frame <= frame:
+            self.trial_manager.during_trial(0.0)
+
+    def test_first_trial_schedule(self) -> None:
+        trial = self.trial_manager.current_trial
+        self.assertIsNotNone(trial)
+        delay = to_ms(to_frames(FIRST_TRIAL_DELAY))
+        self.assertEqual(trial.time_trial_start, delay)
+        self.assertAlmostEqual(
+            trial.time_draw_stimulus, delay + to_ms(to_frames(INTER_TRIAL_INTERVAL))
+        )
+        self.assertAlmostEqual(
+            trial.time_draw_target,
+            trial.time_draw_stimulus + to_ms(to_frames(trial.stimulus_onset_async)),
+        )
+
+    def test_phases_triggered_by_frame(self) -> None:
+        trial_manager = self.trial_manager
+        trial = trial_manager.current_trial
+        self.assertEqual(
+            trial_manager.frame_draw_stimulus,
+            to_frames(FIRST_TRIAL_DELAY) + to_frames(INTER_TRIAL_INTERVAL),
+        )
+        self.advance_to(trial_manager.frame_draw_stimulus - 1)
+        self.assertFalse(trial_manager.is_stimulus_drawn)
+        self.assertEqual(trial_manager.during_trial(0.0), [trial.stimulus.image])
+        self.advance_to(trial_manager.frame_draw_target - 1)
+        self.assertFalse(trial_manager.is_target_drawn)
+        self.assertEqual(
+            trial_manager.during_trial(0.0),
+            [trial.stimulus.image, trial.target.image],
+        )
+
+    def test_response_before_target_ignored(self) -> None:
+        trial = self.trial_manager.current_trial
+        self.advance_to(self.trial_manager.frame_draw_target - 1)
+        self.trial_manager.key_down(trial.time_draw_target, pygame.K_SPACE)
+        self.assertIs(self.trial_manager.current_trial, trial)
+        self.assertEqual(trial.response, Response.NONE)
+
+    def test_response_keys(self) -> None:
+        trial = self.trial_manager.current_trial
+        self.advance_to(self.trial_manager.frame_draw_target)
+        self.trial_manager.key_down(trial.time_draw_target + 300, pygame.K_j)
+        self.assertIs(self.trial_manager.current_trial, trial)
+        self.trial_manager.key_down(trial.time_draw_target + 400, pygame.K_h)
+        self.assertEqual(trial.response, Response.H)
+        self.assertEqual(trial.reaction_time, 400)
+
+    def test_early_timestamped_response_ignored(self) -> None:
+        trial = self.trial_manager.current_trial
+        self.advance_to(self.trial_manager.frame_draw_target)
+        self.trial_manager.key_down(trial.time_draw_target - 1, pygame.K_SPACE)
+        self.assertIs(self.trial_manager.current_trial, trial)
+        self.assertEqual(trial.response, Response.NONE)
+
+    def test_late_target_flip_excluded_from_reaction_time(self) -> None:
+        trial = self.trial_manager.current_trial
+        self.advance_to(self.trial_manager.frame_draw_target)
+        self.trial_manager.record_flip(trial.time_draw_target + 20)
+        self.trial_manager.key_down(trial.time_draw_target + 10, pygame.K_SPACE)
+        self.assertIs(self.trial_manager.current_trial, trial)
+        self.trial_manager.key_down(trial.time_draw_target + 320, pygame.K_SPACE)
+        self.assertAlmostEqual(trial.reaction_time, 300)
+        self.assertAlmostEqual(trial.reaction_time, trial.measured_reaction_time)
+
+    def test_response_timeout(self) -> None:
+        trial_manager = self.trial_manager
+        trial = trial_manager.current_trial
+        self.advance_to(
+            trial_manager.frame_draw_target + trial_manager.max_response_frames - 1
+        )
+        self.assertIs(trial_manager.current_trial, trial)
+        trial_manager.during_trial(trial.time_draw_target + 2000)
+        self.assertIsNot(trial_manager.current_trial, trial)
+        self.assertEqual(trial.response, Response.NONE)
+
+    def test_sub_millisecond_reaction_time(self) -> None:
+        trial = self.trial_manager.current_trial
+        self.trial_manager.end_trial(trial.time_draw_target + 250.125, Response.H)
+        self.assertEqual(trial.response, Response.H)
+        self.assertAlmostEqual(trial.reaction_time, 250.125)
+        self.assertAlmostEqual(trial.time_response, trial.time_draw_target + 250.125)
+        self.assertIsNot(self.trial_manager.current_trial, trial)
+
+    def test_record_flip_onsets(self) -> None:
+        trial_manager = self.trial_manager
+        trial = trial_manager.current_trial
+        self.advance_to(trial_manager.frame_draw_stimulus - 1)
+        trial_manager.record_flip(trial.time_draw_stimulus - 0.5)
+        self.assertIsNone(trial.time_stimulus_onset)
+
+        trial_manager.during_trial(0.0)
+        trial_manager.record_flip(trial.time_draw_stimulus + 8.25)
+        trial_manager.during_trial(0.0)
+        trial_manager.record_flip(trial.time_draw_stimulus + 15)
+        self.assertEqual(trial.time_stimulus_onset, trial.time_draw_stimulus + 8.25)
+
+        self.advance_to(trial_manager.frame_draw_target)
+        trial_manager.record_flip(trial.time_draw_target + 4)
+        self.assertEqual(trial.time_target_onset, trial.time_draw_target + 4)
+        self.assertAlmostEqual(
+            trial.measured_stimulus_onset_async,
+            trial.time_draw_target - trial.time_draw_stimulus + 4 - 8.25,
+        )
+
+        trial_manager.key_down(trial.time_draw_target + 300, pygame.K_SPACE)
+        self.assertAlmostEqual(trial.measured_reaction_time, 296)
+
+    def test_record_dropped_frames(self) -> None:
+        trial = self.trial_manager.current_trial
+        period = DISPLAY_TIMING["frame_period"]
+        self.advance_to(self.trial_manager.frame_draw_stimulus)
+        self.trial_manager.record_flip(0.0, period)
+        self.assertEqual(trial.frames_dropped, 0)
+        self.trial_manager.record_flip(0.0, period * 3)
+        self.assertEqual(trial.frames_dropped, 2)
+        self.assertAlmostEqual(trial.max_frame_ms, period * 3)
+        self.assertEqual(self.trial_manager.dropped_frame_percent(), 100)
+        self.trial_manager.end_trial(0.0, Response.NONE)
+        self.assertEqual(self.trial_manager.dropped_frame_percent(), 50)
+
+    def test_slow_inter_trial_frame_not_dropped(self) -> None:
+        trial = self.trial_manager.current_trial
+        period = DISPLAY_TIMING["frame_period"]
+        self.advance_to(self.trial_manager.frame_trial_start)
+        self.trial_manager.record_flip(0.0, period * 3)
+        self.assertEqual(trial.frames_dropped, 0)
+        self.assertEqual(trial.max_frame_ms, 0)
+        self.assertEqual(self.trial_manager.dropped_frame_percent(), 0)
+
+    def test_completed_trials_logged(self) -> None:
+        trial = self.trial_manager.current_trial
+        self.trial_manager.end_trial(trial.time_draw_target + 300, Response.SPACE)
+        record = self.trial_manager.trial_log.read()[-1]
+        self.assertEqual(record["trial_number"], 1)
+        self.assertEqual(record["response"], Response.SPACE)
+        self.assertAlmostEqual(record["reaction_time"], 300)
+        self.assertEqual(record["participant_id"], 1)
+        self.assertNotIn("stimulus_image", record)
+
+    def test_resume_session(self) -> None:
+        first = self.trial_manager
+        first.end_trial(first.current_trial.time_draw_target + 300, Response.SPACE)
+        first.end_trial(first.current_trial.time_draw_target + 400, Response.H)
+        first.trial_log.close()
+        gc.enable()
+
+        self.trial_manager = TrialManager()
+        self.trial_manager.participant = Participant(1, 1, 1, 1)
+        self.trial_manager.start_experiment(0.0)
+        self.assertEqual(self.trial_manager.trial_number, 2)
+        self.assertEqual(self.trial_manager.trial_log.path, first.trial_log.path)
+        self.assertEqual(
+            [checkpoint.trial_key(trial) for trial in self.trial_manager.trials],
+            [checkpoint.trial_key(trial) for trial in first.trials],
+        )
+        resumed = self.trial_manager.trials[1]
+        self.assertEqual(resumed.response, Response.H)
+        self.assertAlmostEqual(resumed.reaction_time, 400)
+
+    def test_finished_session_not_resumed(self) -> None:
+        self.assertIsNotNone(checkpoint.load(self.trial_manager.participant.id))
+        self.trial_manager.trials = self.trial_manager.trials[:2]
+        self.trial_manager.end_experiment(0.0)
+        self.trial_manager.save_future.result(timeout=30)
+        self.assertIsNone(checkpoint.load(self.trial_manager.participant.id))
+
+    def test_checkpoint_kept_when_saving_fails(self) -> None:
+        self.trial_manager.trials = self.trial_manager.trials[:2]
+        with patch(
+            "src.services.output_writer.write_tables", side_effect=OSError("locked")
+        ):
+            self.trial_manager.end_experiment(0.0)
+            self.assertIsInstance(self.trial_manager.save_future.exception(), OSError)
+        self.assertIsNotNone(checkpoint.load(self.trial_manager.participant.id))
+
+    def test_results_saved_in_background(self) -> None:
+        self.trial_manager.trials = self.trial_manager.trials[:2]
+        self.trial_manager.end_experiment(0.0)
+        save = self.trial_manager.save_future
+        self.assertIsNotNone(save)
+        self.assertIsNone(save.result(timeout=30))
+        self.trial_manager.end_experiment(0.0)
+        self.assertIs(self.trial_manager.save_future, save)
+
+    def test_collection_log_starts_with_session(self) -> None:
+        log = garbage_collection.collection_log()
+        self.assertNotIn("setup", [collection["phase"] for collection in log])
+        self.trial_manager.trials = self.trial_manager.trials[:2]
+        with patch("src.services.output_writer.write_tables") as write_tables:
+            self.trial_manager.end_experiment(0.0)
+            self.trial_manager.save_future.result(timeout=30)
+        saved = write_tables.call_args.args[1]["garbage_collection"]
+        self.assertGreater(len(saved), 0)
+        self.assertNotIn("setup", list(saved["phase"]))
+
+    def test_garbage_collection_paused_during_experiment(self) -> None:
+        self.assertFalse(gc.isenabled())
+        self.assertEqual(self.trial_manager.current_phase(), "inter_trial_interval")
+        self.trial_manager.trials = self.trial_manager.trials[:2]
+        self.trial_manager.end_experiment(0.0)
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(self.trial_manager.current_phase(), "finished")
+
+
+if __name__ == "__main__":
+    unittest.main()
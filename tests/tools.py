@@ -1,3 +1,5 @@
+import tempfile
+from pathlib import Path
 from typing import Any
 from unittest import TestCase
 from unittest.mock import Mock
@@ -5,6 +7,7 @@ from unittest.mock import Mock
 import pygame
 
 from src.services.screen import init_screen
+from src.services.simulation import redirect_data_paths
 from src.visuals import Element, init_fonts
 
 
@@ -35,6 +38,17 @@ def minimal_setup() -> pygame.Surface:
     return screen
 
 
+def patch_data_paths(test: TestCase) -> Path:
+    """
+    Redirects saved sessions, trial logs and checkpoints to a temporary
+    directory until the test has been cleaned up, so tests never touch the
+    real data directory.
+    """
+    directory = tempfile.TemporaryDirectory()
+    test.addCleanup(directory.cleanup)
+    return test.enterContext(redirect_data_paths(directory.name))
+
+
 def test_draw_rect(
     test: TestCase, element: Element, screen: pygame.Surface, assert_true: bool = True
 ) -> None: